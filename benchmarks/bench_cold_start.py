@@ -0,0 +1,111 @@
+"""
+Measure cold start: import time of main.py and boot time of a uvicorn worker.
+
+For each run a fresh interpreter is used, so nothing is cached in-process:
+  import   - wall time of ``import main``
+  live     - uvicorn launch until /live answers 200
+  ready    - uvicorn launch until /ready answers 200 (graph compiled, DB reachable)
+
+Usage:
+    python benchmarks/bench_cold_start.py --runs 5
+"""
+import os
+import sys
+import argparse
+import socket
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+
+def offline_env(workdir: str) -> dict:
+    env = dict(os.environ)
+    env.setdefault("GOOGLE_API_KEY", "offline")
+    env.setdefault("TAVILY_API_KEY", "offline")
+    env.setdefault("RAPID_API_KEY", "offline")
+    env["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    env["TRACE_FILE"] = os.path.join(workdir, "traces.jsonl")
+    env["RATE_LIMIT_DB"] = os.path.join(workdir, "rate_limits.db")
+    env["CHECKPOINT_DB"] = os.path.join(workdir, "checkpoints.db")
+    env["PYTHONPATH"] = str(project_root)
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_import(env: dict, workdir: str) -> float:
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=workdir,
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def time_boot(env: dict, workdir: str, timeout: float):
+    import requests
+
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--app-dir", str(project_root)],
+        env=env, cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    live = ready = None
+    try:
+        while time.perf_counter() - start < timeout and ready is None:
+            for path in ("/live", "/ready") if live is None else ("/ready",):
+                try:
+                    status = requests.get(f"http://127.0.0.1:{port}{path}", timeout=1).status_code
+                except requests.RequestException:
+                    break
+                if status == 200:
+                    elapsed = time.perf_counter() - start
+                    if path == "/live":
+                        live = elapsed
+                    else:
+                        ready = elapsed
+            time.sleep(0.02)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return live, ready
+
+
+def summary(values):
+    values = [v for v in values if v is not None]
+    if not values:
+        return "n/a"
+    return f"median {statistics.median(values):.3f}s  min {min(values):.3f}s  max {max(values):.3f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="cold_start_")
+    env = offline_env(workdir)
+
+    imports, lives, readies = [], [], []
+    for _ in range(args.runs):
+        imports.append(time_import(env, workdir))
+        live, ready = time_boot(env, workdir, args.timeout)
+        lives.append(live)
+        readies.append(ready)
+
+    print(f"import main : {summary(imports)}")
+    print(f"/live  200  : {summary(lives)}")
+    print(f"/ready 200  : {summary(readies)}")
+
+
+if __name__ == "__main__":
+    main()
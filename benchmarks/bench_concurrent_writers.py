@@ -0,0 +1,109 @@
+"""
+Concurrency check for the storage profile: many pipeline writers at once.
+
+Each writer mimics the database side of one pipeline run (store the JD, store
+every scored candidate, mark the best one) using the same CRUD calls as the
+graph nodes. Writers run as threads inside several worker processes, like
+uvicorn workers sharing one database file.
+
+Usage:
+    python benchmarks/bench_concurrent_writers.py --processes 4 --threads 8 --candidates 5
+    DATABASE_URL=postgresql://... python benchmarks/bench_concurrent_writers.py
+"""
+import os
+import sys
+import argparse
+import tempfile
+import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def pipeline_writer(writer_id: int, n_candidates: int) -> None:
+    from src.ai_componenet.database.database import get_db_session
+    from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+    from src.ai_componenet.graph.utils.jdinfo import JDInfo
+
+    with get_db_session() as db:
+        job_id = JobDescriptionCRUD.create_job_description(
+            db=db,
+            jd_info=JDInfo(job_title=f"Engineer {writer_id}", technical_skills=["python"]),
+            original_desc=f"Job description {writer_id}"
+        ).id
+
+    candidate_ids = []
+    for i in range(n_candidates):
+        with get_db_session() as db:
+            candidate = LinkedInCandidateCRUD.create_candidate(
+                db=db,
+                job_description_id=job_id,
+                profile_data=f"profile {writer_id}-{i} " * 200,
+                linkedin_url=f"https://www.linkedin.com/in/w{writer_id}-{i}",
+                final_score=float(i),
+                score_breakdown={"Education": 7.0, "Experience_Match": 8.0}
+            )
+            candidate_ids.append(candidate.id)
+
+    with get_db_session() as db:
+        LinkedInCandidateCRUD.update_best_candidate(
+            db=db, candidate_id=candidate_ids[-1], outreach_message="Hello!"
+        )
+
+
+def run_process(process_id: int, threads: int, writers: int, n_candidates: int):
+    ok, errors = 0, []
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(pipeline_writer, process_id * writers + w, n_candidates)
+            for w in range(writers)
+        ]
+        for future in futures:
+            try:
+                future.result()
+                ok += 1
+            except Exception as e:
+                errors.append(repr(e))
+    return ok, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=16, help="pipeline writers per process")
+    parser.add_argument("--candidates", type=int, default=5)
+    args = parser.parse_args()
+
+    if not os.getenv("DATABASE_URL"):
+        db_dir = tempfile.mkdtemp(prefix="bench_writers_")
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+
+    from src.ai_componenet.database.database import create_tables, STORAGE_PROFILE
+    create_tables()
+
+    start = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(args.processes) as pool:
+        results = pool.starmap(
+            run_process,
+            [(p, args.threads, args.writers, args.candidates) for p in range(args.processes)]
+        )
+    elapsed = time.perf_counter() - start
+
+    ok = sum(r[0] for r in results)
+    errors = [e for r in results for e in r[1]]
+    total = args.processes * args.writers
+    print(f"profile={STORAGE_PROFILE} url={os.environ['DATABASE_URL']}")
+    print(f"{ok}/{total} pipeline writers succeeded in {elapsed:.2f}s "
+          f"({total * (args.candidates + 2) / elapsed:.0f} writes/s)")
+    for error in errors[:10]:
+        print(f"  error: {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
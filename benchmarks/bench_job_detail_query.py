@@ -0,0 +1,79 @@
+"""
+Benchmark the job detail read path on a seeded SQLite database.
+
+Compares the lean single-query load (large text columns deferred) against the
+opt-in full-text load for a job with thousands of candidates.
+
+Usage:
+    python benchmarks/bench_job_detail_query.py --candidates 5000 --repeat 20
+"""
+import os
+import sys
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def seed(n_candidates: int, profile_chars: int) -> int:
+    from src.ai_componenet.database.database import get_db_session, create_tables
+    from src.ai_componenet.database.models import JobDescription, LinkedInCandidate
+
+    create_tables()
+    profile_text = ("Senior ML engineer, Python, TensorFlow, AWS. " * (profile_chars // 45 + 1))[:profile_chars]
+    with get_db_session() as db:
+        job = JobDescription(job_title="Machine Learning Engineer", company_name="TechCorp",
+                             original_job_desc="Looking for an ML engineer. " * 200)
+        db.add(job)
+        db.flush()
+        db.bulk_save_objects([
+            LinkedInCandidate(
+                job_description_id=job.id,
+                linkedin_url=f"https://www.linkedin.com/in/candidate-{i}",
+                profile_data=profile_text,
+                final_score=(i % 100) / 10,
+                outreach_message="Hi, we would love to talk to you about a role. " * 20
+            )
+            for i in range(n_candidates)
+        ])
+        return job.id
+
+
+def time_call(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--profile-chars", type=int, default=8000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp(prefix="bench_job_detail_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+
+    from src.ai_componenet.database.utils import DatabaseQueryUtils
+
+    job_id = seed(args.candidates, args.profile_chars)
+    print(f"Seeded job {job_id} with {args.candidates} candidates ({args.profile_chars} chars of profile each)")
+
+    lean = time_call(lambda: DatabaseQueryUtils.get_job_with_candidates(job_id), args.repeat)
+    full = time_call(lambda: DatabaseQueryUtils.get_job_with_candidates(job_id, include_full_text=True), args.repeat)
+
+    print(f"{'mode':<12}{'best (ms)':>12}")
+    print(f"{'lean':<12}{lean * 1000:>12.1f}")
+    print(f"{'full text':<12}{full * 1000:>12.1f}")
+    print(f"speedup: {full / lean:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare payload size and serialization time of /analyze-job responses.
+
+Three variants of the same JobMatchResponse are measured:
+  default   - FastAPI's old path: jsonable_encoder + json.dumps (JSONResponse)
+  orjson    - full payload rendered by ORJSONResponse
+  lean      - ORJSONResponse with a list-view field selection (IDs and scores)
+
+Usage:
+    python benchmarks/bench_response_serialization.py --candidates 10 --repeat 2000
+"""
+import os
+import sys
+import argparse
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+LEAN_FIELDS = "job_id,profiles_found,candidates.candidate_id,candidates.final_score,best_candidate.score"
+
+
+def build_response(n_candidates: int, profile_chars: int):
+    from main import JobMatchResponse, CandidateInfo
+
+    breakdown = {
+        "Education": 8.0, "Career_Trajectory": 7.0, "Company_Relevance": 6.5,
+        "Experience_Match": 9.0, "Location_Match": 10.0, "Tenure": 7.5
+    }
+    profile = ("Senior Machine Learning Engineer at TechCorp. Python, TensorFlow, AWS. " * (profile_chars // 70 + 1))[:profile_chars]
+    return JobMatchResponse(
+        job_id=42,
+        jd_info={
+            "job_title": "Machine Learning Engineer", "company_name": "TechCorp",
+            "job_location": "San Francisco, CA", "work_arrangement": "remote",
+            "employment_type": "full-time", "technical_skills": ["Python", "TensorFlow", "AWS"] * 5,
+            "salary_range": "$150k-$200k", "experience_required": "5+ years"
+        },
+        linkedin_profiles=[f"https://www.linkedin.com/in/candidate-{i}" for i in range(n_candidates)],
+        profiles_found=n_candidates,
+        candidates=[
+            CandidateInfo(
+                candidate_id=i, linkedin_url=f"https://www.linkedin.com/in/candidate-{i}",
+                final_score=7.5, score_breakdown=breakdown, candidate_name=f"Candidate {i}",
+                current_position="ML Engineer", current_company="TechCorp"
+            )
+            for i in range(n_candidates)
+        ],
+        best_candidate={"profile": profile, "score": 8.4, "breakdown": breakdown},
+        outreach_message="Hi, I came across your profile and was impressed by your work. " * 12,
+        processing_time=12.34
+    )
+
+
+def measure(render, repeat: int):
+    body = render()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return len(body), (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10)
+    parser.add_argument("--profile-chars", type=int, default=12000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    for key in ("TAVILY_API_KEY", "RAPID_API_KEY", "GOOGLE_API_KEY"):
+        os.environ.setdefault(key, "benchmark")
+
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from main import select_fields, parse_fields
+
+    response = build_response(args.candidates, args.profile_chars)
+    lean_paths = parse_fields(LEAN_FIELDS)
+
+    variants = {
+        "default": lambda: JSONResponse(jsonable_encoder(response)).body,
+        "orjson": lambda: ORJSONResponse(response.model_dump()).body,
+        "lean": lambda: ORJSONResponse(select_fields(response.model_dump(), lean_paths)).body
+    }
+
+    print(f"{'variant':<10}{'bytes':>10}{'us/response':>14}")
+    results = {name: measure(render, args.repeat) for name, render in variants.items()}
+    for name, (size, seconds) in results.items():
+        print(f"{name:<10}{size:>10}{seconds * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Local stand-ins for Gemini, Tavily and RapidAPI.
+
+- ``fake_get_llm`` / ``fake_get_structured_llm`` have the same signatures as the
+  real factories in ``get_llm.py`` and wrap the deterministic model from
+  ``src/ai_componenet/fakes.py`` (JD info, score breakdowns, outreach text).
+- ``FakeTavilySearch`` replaces ``langchain_tavily.TavilySearch`` and returns
+  deterministic LinkedIn profile URLs.
+- ``FakeRapidAPIServer`` is a local HTTP server speaking the RapidAPI
+  ``get-profile-pdf-cv`` protocol, serving synthetic or fixture PDFs.
+
+``install_fakes`` patches the graph modules; point ``RAPID_API_URL`` at the
+server before ``tools.py`` is imported.
+"""
+import os
+import sys
+import base64
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fixtures import synthetic_profile_text, build_pdf
+from src.ai_componenet import fakes as fake_llm
+from src.ai_componenet.fakes import fake_llm_stats, make_fake_model, text_digest
+
+
+def fake_get_llm(prompt, model_name: str = "gemini-1.5-flash"):
+    """Drop-in for ``get_llm`` returning deterministic outreach text"""
+    from src.ai_componenet.get_llm import TimedChain
+    return TimedChain(prompt | make_fake_model(), model_name, output="text")
+
+
+def fake_get_structured_llm(prompt, output_schema, model_name: str = "gemini-1.5-flash"):
+    """Drop-in for ``get_structured_llm`` returning deterministic schema instances"""
+    from src.ai_componenet.get_llm import TimedChain
+    return TimedChain(prompt | make_fake_model(output_schema), model_name, output=output_schema.__name__)
+
+
+class FakeTavilySearch:
+    """Stand-in for ``TavilySearch`` returning deterministic LinkedIn profile URLs"""
+
+    latency = 0.0
+    calls = 0
+
+    def __init__(self, max_results: int = 5, topic: str = "general", **kwargs):
+        self.max_results = max_results
+
+    def invoke(self, payload: Dict[str, str]) -> Dict[str, List[Dict[str, str]]]:
+        if self.latency:
+            time.sleep(self.latency)
+        FakeTavilySearch.calls += 1
+        query = payload.get("query", "")
+        slug = text_digest(query).hex()[:6]
+        return {
+            "query": query,
+            "results": [
+                {"url": f"https://www.linkedin.com/in/bench-{slug}-{i}", "title": f"Candidate {i}"}
+                for i in range(self.max_results)
+            ]
+        }
+
+
+class FakeRapidAPIServer:
+    """Local HTTP server mimicking the RapidAPI LinkedIn ``get-profile-pdf-cv`` endpoint"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 fixtures_dir: Optional[str] = None, experiences: int = 4):
+        self.latency = latency
+        self.experiences = experiences
+        self.fixture_pdfs = sorted(Path(fixtures_dir).glob("*.pdf")) if fixtures_dir else []
+        self.requests = 0
+        self.bytes_sent = 0
+        self._cache: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/get-profile-pdf-cv"
+
+    def pdf_for(self, linkedin_url: str) -> bytes:
+        seed = zlib.crc32(linkedin_url.encode("utf-8"))
+        with self._lock:
+            if seed not in self._cache:
+                if self.fixture_pdfs:
+                    self._cache[seed] = self.fixture_pdfs[seed % len(self.fixture_pdfs)].read_bytes()
+                else:
+                    self._cache[seed] = build_pdf(synthetic_profile_text(seed, self.experiences))
+            return self._cache[seed]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                linkedin_url = parse_qs(parsed.query).get("linkedin_url", [""])[0]
+                if parsed.path != "/get-profile-pdf-cv" or not linkedin_url:
+                    self.send_error(404)
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                pdf_b64 = base64.b64encode(server.pdf_for(linkedin_url)).decode("ascii")
+                body = json.dumps({
+                    "data": {"base64encoded_pdf": f"data:application/pdf;base64,{pdf_b64}"},
+                    "message": "ok"
+                }).encode("utf-8")
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    return  # client gave up, e.g. its time budget ran out
+                with server._lock:
+                    server.requests += 1
+                    server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeRapidAPIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def install_fakes(llm_latency: float = 0.0, search_latency: float = 0.0) -> None:
+    """Route the graph's LLM and Tavily calls to the local stand-ins"""
+    fake_llm.llm_latency = llm_latency
+    FakeTavilySearch.latency = search_latency
+
+    import src.ai_componenet.graph.nodes as nodes
+    import src.ai_componenet.graph.utils.tools as tools
+
+    nodes.get_llm = fake_get_llm
+    nodes.get_structured_llm = fake_get_structured_llm
+    tools.TavilySearch = FakeTavilySearch
+
+
+def set_offline_env(rapid_api_url: str, workdir: str) -> None:
+    """Environment needed to import the app without real credentials or a shared database"""
+    os.environ.setdefault("GOOGLE_API_KEY", "offline")
+    os.environ.setdefault("TAVILY_API_KEY", "offline")
+    os.environ.setdefault("RAPID_API_KEY", "offline")
+    os.environ["RAPID_API_URL"] = rapid_api_url
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["TRACE_FILE"] = os.path.join(workdir, "traces.jsonl")
+    os.environ["RATE_LIMIT_DB"] = os.path.join(workdir, "rate_limits.db")
+    os.environ["CHECKPOINT_DB"] = os.path.join(workdir, "checkpoints.db")
+    # Stand-ins have no quota; set these explicitly to benchmark the limiter itself
+    for provider in ("GEMINI", "GROQ", "TAVILY", "RAPIDAPI"):
+        os.environ.setdefault(f"RATE_LIMIT_{provider}_PER_MINUTE", "0")
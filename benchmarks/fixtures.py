@@ -0,0 +1,108 @@
+"""
+Synthetic LinkedIn CV corpus shared by the benchmarks.
+
+``synthetic_profile_text`` produces deterministic CV-like text (header, about,
+experience with "Present" markers, education, skills), and ``build_pdf`` renders
+text into a small multi-page PDF that PyPDF2 can extract again, so profile
+fetches can be replayed without calling RapidAPI.
+"""
+import random
+from typing import List
+
+FIRST_NAMES = ["Aarav", "Maria", "Chen", "Fatima", "Lucas", "Priya", "Noah", "Sofia", "Kenji", "Amara"]
+LAST_NAMES = ["Sharma", "Garcia", "Wei", "Khan", "Müller", "Patel", "Smith", "Rossi", "Tanaka", "Okafor"]
+TITLES = ["Machine Learning Engineer", "Senior Software Engineer", "Data Scientist", "Backend Engineer",
+          "Staff ML Engineer", "AI Research Engineer", "Platform Engineer", "MLOps Engineer"]
+COMPANIES = ["Google", "Microsoft", "Amazon", "Flipkart", "Infosys", "Stripe", "Uber", "Swiggy",
+             "Databricks", "NVIDIA", "Zomato", "Atlassian"]
+SCHOOLS = ["IIT Bombay", "Stanford University", "MIT", "BITS Pilani", "University of Toronto",
+           "NIT Trichy", "Carnegie Mellon University", "Delhi University"]
+LOCATIONS = ["Bengaluru, Karnataka, India", "San Francisco, California, United States",
+             "London, England, United Kingdom", "Hyderabad, Telangana, India", "Remote"]
+SKILLS = ["Python", "PyTorch", "TensorFlow", "AWS", "Kubernetes", "SQL", "Spark", "Docker",
+          "LangChain", "FastAPI", "Go", "Java", "Airflow", "MLflow", "GCP", "Scikit-learn"]
+
+
+def synthetic_profile_text(seed: int, experiences: int = 4) -> str:
+    """Deterministic CV text in the layout PyPDF2 extracts from LinkedIn PDF exports"""
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        "Contact",
+        f"www.linkedin.com/in/{name.lower().replace(' ', '-')}-{seed}",
+        "Top Skills",
+        *rng.sample(SKILLS, 3),
+        name,
+        f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        rng.choice(LOCATIONS),
+        "Summary",
+        " ".join(
+            f"Built {rng.choice(['recommendation', 'search', 'fraud', 'ranking', 'forecasting'])} systems "
+            f"with {rng.choice(SKILLS)} serving {rng.randint(1, 500)}M users."
+            for _ in range(3)
+        ),
+        "Experience",
+    ]
+    year = 2025
+    for i in range(experiences):
+        start = year - rng.randint(1, 4)
+        lines += [
+            rng.choice(COMPANIES),
+            rng.choice(TITLES),
+            f"{rng.choice(['January', 'March', 'June', 'September'])} {start} - " + ("Present" if i == 0 else str(year)),
+            rng.choice(LOCATIONS),
+            f"Led a team of {rng.randint(2, 12)} engineers; shipped {rng.choice(SKILLS)} pipelines\xa0and "
+            f"cut latency by {rng.randint(10, 80)}%.",
+        ]
+        year = start
+    school = rng.choice(SCHOOLS)
+    lines += [
+        "Education",
+        school,
+        f"Bachelor of Technology - BTech, Computer Science · ({year - 4} - {year})",
+    ]
+    return "\n".join(lines)
+
+
+def synthetic_corpus(size: int, experiences: int = 4) -> List[str]:
+    return [synthetic_profile_text(seed, experiences) for seed in range(size)]
+
+
+def _pdf_escape(text: str) -> str:
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(text: str, lines_per_page: int = 45) -> bytes:
+    """Render plain text as a minimal multi-page PDF (Helvetica, one text line per row)"""
+    lines = text.split("\n") or [""]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[""]]
+
+    objects = []  # object bodies, object number = index + 1
+    objects.append("<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(None)  # pages tree, filled once kids are known
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    kids = []
+    for page_lines in pages:
+        stream = "BT /F1 10 Tf 14 TL 50 800 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        kids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return bytes(out)
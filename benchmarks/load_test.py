@@ -0,0 +1,132 @@
+"""
+End-to-end load benchmark for /analyze-job, fully offline.
+
+Starts the local RapidAPI stand-in, patches the graph to use the fake LLM and
+fake Tavily search, serves the FastAPI app with uvicorn on a local port and
+fires /analyze-job requests at several concurrency levels. Reports p50/p95/p99
+latency and jobs per second for each level.
+
+Usage:
+    python benchmarks/load_test.py --concurrency 1,4,8 --jobs 16 --llm-latency 0.2 \\
+        --search-latency 0.3 --profile-latency 0.5 --max-profiles 5
+"""
+import os
+import sys
+import argparse
+import math
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fakes import FakeRapidAPIServer, FakeTavilySearch, fake_llm_stats, install_fakes, set_offline_env
+from src.ai_componenet.prompt_cache import prefix_cache
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_app(port: int):
+    import uvicorn
+    from main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    import requests
+    while requests.get(f"http://127.0.0.1:{port}/ready").status_code != 200:
+        time.sleep(0.1)
+    return server
+
+
+def run_level(base_url: str, concurrency: int, jobs: int, max_profiles: int, timeout: float):
+    import requests
+
+    def one_job(i: int):
+        job_desc = (
+            f"Machine Learning Engineer #{concurrency}-{i} at TechCorp. Python, TensorFlow and AWS. "
+            "San Francisco, CA. Full-time, remote friendly."
+        )
+        start = time.perf_counter()
+        response = requests.post(
+            f"{base_url}/analyze-job",
+            json={"job_desc": job_desc, "max_profiles": max_profiles},
+            timeout=timeout
+        )
+        return time.perf_counter() - start, response.status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one_job, range(jobs)))
+    wall = time.perf_counter() - start
+
+    latencies = [latency for latency, status in results if status == 200]
+    errors = sum(1 for _, status in results if status != 200)
+    return latencies, errors, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,4,8", help="comma-separated concurrency levels")
+    parser.add_argument("--jobs", type=int, default=16, help="requests per concurrency level")
+    parser.add_argument("--max-profiles", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="seconds per fake LLM call")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="seconds per fake Tavily search")
+    parser.add_argument("--profile-latency", type=float, default=0.5, help="seconds per fake RapidAPI fetch")
+    parser.add_argument("--fixtures-dir", default=None, help="serve these PDFs instead of synthetic ones")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="load_test_")
+    rapid_api = FakeRapidAPIServer(latency=args.profile_latency, fixtures_dir=args.fixtures_dir).start()
+    set_offline_env(rapid_api.url, workdir)
+    os.chdir(workdir)
+
+    install_fakes(llm_latency=args.llm_latency, search_latency=args.search_latency)
+    port = free_port()
+    server = start_app(port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"fake latencies: llm={args.llm_latency}s search={args.search_latency}s "
+          f"profile={args.profile_latency}s, max_profiles={args.max_profiles}, workdir={workdir}")
+    print(f"{'concurrency':>11} {'jobs':>5} {'errors':>6} {'p50 (s)':>8} {'p95 (s)':>8} {'p99 (s)':>8} {'jobs/s':>7}")
+    try:
+        for concurrency in [int(c) for c in args.concurrency.split(",") if c.strip()]:
+            latencies, errors, wall = run_level(base_url, concurrency, args.jobs, args.max_profiles, args.timeout)
+            print(f"{concurrency:>11} {args.jobs:>5} {errors:>6} {percentile(latencies, 50):>8.2f} "
+                  f"{percentile(latencies, 95):>8.2f} {percentile(latencies, 99):>8.2f} "
+                  f"{len(latencies) / wall:>7.2f}")
+    finally:
+        server.should_exit = True
+        rapid_api.stop()
+
+    print(f"fake calls: llm={fake_llm_stats.calls} search={FakeTavilySearch.calls} "
+          f"profile_fetches={rapid_api.requests} ({rapid_api.bytes_sent} bytes)")
+    print(f"fake llm prompt tokens: {fake_llm_stats.prompt_tokens} (scoring prefixes "
+          f"{prefix_cache.prefix_tokens}, reusable from a prefix cache {prefix_cache.reused_tokens})")
+
+
+if __name__ == "__main__":
+    main()
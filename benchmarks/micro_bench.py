@@ -0,0 +1,205 @@
+"""
+Micro-benchmarks for the CPU hot paths that run on every request.
+
+Covered: clean_text, clean_data_recursively, extract_candidate_name,
+extract_current_position_and_company, PyPDF2 extraction through
+data_of_linkedin_url (network replaced by an in-memory response),
+ScoringOutput parsing, weighted_score, vectorized re-ranking (rank_candidates)
+and LinkedInCandidateCRUD.create_candidate.
+Inputs come from the synthetic CV corpus in benchmarks/fixtures.py.
+
+Results are compared against benchmarks/micro_baseline.json; any benchmark
+slower than baseline by more than --tolerance is flagged and the script exits 1.
+
+Usage:
+    python benchmarks/micro_bench.py                    # compare with the baseline
+    python benchmarks/micro_bench.py --save-baseline    # record a new baseline
+    python benchmarks/micro_bench.py --only clean_text --repeat 10
+"""
+import os
+import sys
+import argparse
+import base64
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fixtures import synthetic_corpus, build_pdf
+
+BASELINE_FILE = Path(__file__).parent / "micro_baseline.json"
+
+
+class _PdfResponse:
+    """Minimal stand-in for requests.Response carrying a base64 PDF payload"""
+
+    def __init__(self, pdf_bytes: bytes):
+        self.content = json.dumps({
+            "data": {"base64encoded_pdf": "data:application/pdf;base64," + base64.b64encode(pdf_bytes).decode("ascii")}
+        }).encode("utf-8")
+        self._json = json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._json
+
+
+def build_benchmarks(corpus_size: int) -> Dict[str, Callable[[], None]]:
+    """Each entry runs one pass over the corpus"""
+    import main
+    import src.ai_componenet.graph.utils.tools as tools
+    from src.ai_componenet.graph.utils.models import ScoringOutput, weighted_score
+    from src.ai_componenet.database.database import get_db_session, create_tables
+    from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+    from src.ai_componenet.graph.utils.jdinfo import JDInfo
+    from src.ai_componenet.ranking import rank_candidates
+    import numpy as np
+
+    corpus = synthetic_corpus(corpus_size, experiences=6)
+    responses = [
+        {
+            "candidate_ids": list(range(10)),
+            "profile_data": corpus[i:i + 10],
+            "score_breakdown": [{"Education": 7.5, "Tenure": 6.0}] * 10,
+            "jd_info": {"job_title": "ML Engineer\xa0", "technical_skills": ["Python​", "AWS"]},
+            "outreach_message": corpus[i]
+        }
+        for i in range(0, corpus_size, 10)
+    ]
+    pdf_responses = [_PdfResponse(build_pdf(text)) for text in corpus]
+    scoring_json = [
+        json.dumps({"education": 7 + i % 3, "career_trajectory": 6.5, "company_relevance": 8,
+                    "experience_match": 9, "location_match": 10, "tenure": 7})
+        for i in range(corpus_size)
+    ]
+    breakdown_example = {"Education": 7.0, "Career_Trajectory": 6.5, "Company_Relevance": 8.0,
+                         "Experience_Match": 9.0, "Location_Match": 10.0, "Tenure": 7.0}
+
+    score_ids = np.arange(corpus_size)
+    score_matrix = np.array([[(i * 7 + d * 3) % 101 / 10 for d in range(6)] for i in range(corpus_size)])
+    score_matrix[::5, 2] = np.nan
+
+    create_tables()
+    with get_db_session() as db:
+        job_id = JobDescriptionCRUD.create_job_description(
+            db=db, jd_info=JDInfo(job_title="ML Engineer"), original_desc="benchmark"
+        ).id
+
+    def pdf_extraction():
+        original_get = tools.requests.get
+        responses_iter = iter(pdf_responses)
+        tools.requests.get = lambda *args, **kwargs: next(responses_iter)
+        try:
+            for i in range(len(pdf_responses)):
+                tools.data_of_linkedin_url(f"https://www.linkedin.com/in/bench-{i}")
+        finally:
+            tools.requests.get = original_get
+
+    def create_candidate():
+        with get_db_session() as db:
+            for i, text in enumerate(corpus):
+                LinkedInCandidateCRUD.create_candidate(
+                    db=db, job_description_id=job_id, profile_data=text,
+                    linkedin_url=f"https://www.linkedin.com/in/bench-{i}",
+                    final_score=7.5, score_breakdown=breakdown_example
+                )
+
+    return {
+        "clean_text": lambda: [main.clean_text(text) for text in corpus],
+        "clean_data_recursively": lambda: [main.clean_data_recursively(r) for r in responses],
+        "extract_candidate_name": lambda: [main.extract_candidate_name(text) for text in corpus],
+        "extract_current_position_and_company": lambda: [
+            main.extract_current_position_and_company(text) for text in corpus
+        ],
+        "pdf_extraction": pdf_extraction,
+        "parse_scoring_output": lambda: [ScoringOutput.model_validate_json(s).final_score for s in scoring_json],
+        "weighted_score": lambda: [weighted_score(breakdown_example) for _ in corpus],
+        "rank_candidates": lambda: rank_candidates(score_ids, score_matrix, {"Tenure": 0.5}, 10),
+        "create_candidate": create_candidate,
+    }
+
+
+def measure(function: Callable[[], None], repeat: int, corpus_size: int, min_time: float = 0.2) -> float:
+    """Best-of-``repeat`` microseconds per corpus item; each sample loops until ``min_time``"""
+    start = time.perf_counter()
+    function()  # warm-up, also sizes the loop
+    loops = max(1, int(min_time / max(time.perf_counter() - start, 1e-9)))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best / corpus_size * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--only", default=None, help="comma-separated benchmark names")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE))
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="micro_bench_")
+    os.environ.update({
+        "GOOGLE_API_KEY": os.getenv("GOOGLE_API_KEY", "offline"),
+        "TAVILY_API_KEY": os.getenv("TAVILY_API_KEY", "offline"),
+        "RAPID_API_KEY": os.getenv("RAPID_API_KEY", "offline"),
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "TRACE_FILE": os.path.join(workdir, "traces.jsonl"),
+        "RATE_LIMIT_DB": os.path.join(workdir, "rate_limits.db"),
+        "CHECKPOINT_DB": os.path.join(workdir, "checkpoints.db"),
+        "RATE_LIMIT_RAPIDAPI_PER_MINUTE": "0",
+    })
+    os.chdir(workdir)
+
+    benchmarks = build_benchmarks(args.corpus_size)
+    selected: List[str] = args.only.split(",") if args.only else list(benchmarks)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    baseline_results = baseline.get("results", {})
+
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<40}{'us/item':>10}{'baseline':>10}{'change':>9}")
+    for name in selected:
+        value = measure(benchmarks[name], args.repeat, args.corpus_size)
+        results[name] = round(value, 3)
+        reference = baseline_results.get(name)
+        if reference:
+            change = value / reference - 1
+            flag = "  REGRESSION" if change > args.tolerance else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:<40}{value:>10.2f}{reference:>10.2f}{change:>+9.1%}{flag}")
+        else:
+            print(f"{name:<40}{value:>10.2f}{'-':>10}{'-':>9}")
+
+    if args.save_baseline:
+        merged = {**baseline_results, **results}
+        baseline_path.write_text(json.dumps({
+            "corpus_size": args.corpus_size,
+            "python": sys.version.split()[0],
+            "results": merged
+        }, indent=2) + "\n")
+        print(f"baseline saved to {baseline_path}")
+        return
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
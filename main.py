@@ -1,7 +1,16 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import time
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi.responses import Response, StreamingResponse, ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Literal
+from contextlib import asynccontextmanager
+import asyncio
+import threading
+import orjson
+import numpy as np
 import logging
 import sys
 import re
@@ -12,9 +21,14 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.ai_componenet.graph.proj_graph import create_graph
 from src.ai_componenet.database.utils import DatabaseQueryUtils
+from src.ai_componenet.database.database import check_connection
+from src.ai_componenet.database.cache import response_cache
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.tracing import start_trace, get_traces
 from src.ai_componenet.exception import CustomException
+from src.ai_componenet.resilience import CircuitOpenError, find_cause
+from src.ai_componenet.deadline import ANALYZE_TIME_BUDGET, DEADLINE_GRACE, DeadlineExceeded, deadline_scope
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -102,10 +116,64 @@ def extract_current_position_and_company(profile_text):
     return position, company
 
 
+# The graph (and with it langchain, Google GenAI, Tavily and PyPDF2) is built in the
+# background at startup so the process can answer liveness probes right away
+graph = None
+graph_ready = threading.Event()
+_graph_init_lock = threading.Lock()
+_graph_init_started = False
+boot_timings: Dict[str, Optional[float]] = {
+    "import_seconds": None,
+    "graph_init_seconds": None
+}
+
+
+def build_graph() -> None:
+    global graph
+    start = time.perf_counter()
+    try:
+        from src.ai_componenet.graph.proj_graph import create_graph
+        graph = create_graph()
+        logger.info("Graph initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize graph: {str(e)}")
+        graph = None
+    finally:
+        boot_timings["graph_init_seconds"] = round(time.perf_counter() - start, 3)
+        graph_ready.set()
+        logger.info(f"Boot timings: {boot_timings}")
+
+
+def start_graph_init() -> None:
+    """Start building the graph in a background thread, once"""
+    global _graph_init_started
+    with _graph_init_lock:
+        if _graph_init_started:
+            return
+        _graph_init_started = True
+    threading.Thread(target=build_graph, name="graph-init", daemon=True).start()
+
+
+async def get_graph():
+    """Wait for startup graph initialization on first use"""
+    if not graph_ready.is_set():
+        start_graph_init()
+        await asyncio.to_thread(graph_ready.wait)
+    return graph
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_graph_init()
+    yield
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="LinkedIn Profile Parser API",
     description="API for parsing job descriptions and matching LinkedIn profiles",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -121,25 +189,113 @@ app.add_middleware(
 class JobDescriptionRequest(BaseModel):
     job_desc: str = Field(..., description="The job description text")
     max_profiles: Optional[int] = Field(5, description="Maximum number of profiles to analyze", ge=1, le=10)
+    adaptive_search: bool = Field(
+        False, description="Fetch and score profiles in small batches, stopping once a candidate reaches score_threshold"
+    )
+    score_threshold: Optional[float] = Field(
+        None, description="Score that ends adaptive search (defaults to ADAPTIVE_SCORE_THRESHOLD)", ge=0, le=10
+    )
+    outreach: Literal["background", "on_demand", "inline"] = Field(
+        "background",
+        description="When to write the outreach message: after the response (background), only when "
+                    "GET /candidates/{id}/outreach is called (on_demand), or before responding (inline)"
+    )
+    time_budget: Optional[float] = Field(
+        None, description="Seconds the analysis may take; unfinished work is dropped and the result marked partial",
+        ge=5, le=600
+    )
+    run_id: Optional[str] = Field(
+        None, description="ID of an earlier run of this job description; a failed run resumes from its last "
+                          "completed step, a finished one returns its result. A new ID is generated when omitted",
+        min_length=1, max_length=64
+    )
 
 class CandidateInfo(BaseModel):
     candidate_id: int
     linkedin_url: Optional[str]
-    final_score: float
-    score_breakdown: Dict[str, float]
+    scored: bool = Field(True, description="False when scoring failed; scores are then null")
+    score_tier: Optional[str] = Field(
+        None, description="'fast' for first-pass scores, 'strong' when rescored, 'reused' when kept from an earlier analysis"
+    )
+    final_score: Optional[float]
+    score_breakdown: Optional[Dict[str, float]]
     candidate_name: Optional[str]
     current_position: Optional[str]
     current_company: Optional[str]
 
 class JobMatchResponse(BaseModel):
     job_id: int
+    run_id: Optional[str] = Field(None, description="Pass it back as run_id to resume this run if it fails")
     jd_info: Dict[str, Any]
     linkedin_profiles: List[str]
     profiles_found: int
     candidates: List[CandidateInfo]
     best_candidate: Dict[str, Any]
-    outreach_message: str
+    outreach_message: Optional[str]
+    outreach_status: str = Field(..., description="ready, pending (being generated), on_demand or unavailable")
+    outreach_url: Optional[str] = None
     processing_time: Optional[float]
+    scoring_stats: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict, description="Scoring calls, errors and seconds per tier (fast, strong)"
+    )
+    partial: bool = Field(False, description="True when the time budget ran out before all work finished")
+    partial_reasons: List[str] = Field(default_factory=list, description="What was skipped to meet the budget")
+    reanalysis: Optional[Dict[str, Any]] = Field(
+        None, description="Re-analysis only: JD fields that changed and, per stage, whether it ran or was reused"
+    )
+
+class RerankRequest(BaseModel):
+    weights: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Weight per score dimension (Education, Career_Trajectory, Company_Relevance, Experience_Match, "
+                    "Location_Match, Tenure); dimensions left out keep their default weight, 0 ignores one"
+    )
+    job_id: Optional[int] = Field(None, description="Rank the candidates of this job; all jobs when omitted")
+    top_k: int = Field(10, description="Number of candidates to return", ge=1, le=1000)
+
+class RankedCandidate(BaseModel):
+    rank: int
+    candidate_id: int
+    job_id: int
+    job_title: Optional[str]
+    score: float = Field(..., description="Weighted score under the requested weights")
+    final_score: Optional[float] = Field(None, description="Score under the default weights, as stored")
+    score_breakdown: Dict[str, float]
+    candidate_name: Optional[str]
+    current_position: Optional[str]
+    current_company: Optional[str]
+    linkedin_url: Optional[str]
+
+class RerankResponse(BaseModel):
+    job_id: Optional[int]
+    weights: Dict[str, float] = Field(..., description="Weights applied, including defaults for dimensions left out")
+    candidates_ranked: int = Field(..., description="Scored candidates the ranking covered")
+    candidates: List[RankedCandidate]
+
+class CandidateQueryRequest(BaseModel):
+    min_scores: Dict[str, float] = Field(
+        default_factory=dict, description="Inclusive lower bound per score (final_score or a dimension name)"
+    )
+    max_scores: Dict[str, float] = Field(default_factory=dict, description="Inclusive upper bound per score")
+    job_title: Optional[str] = Field(None, description="Case-insensitive substring of the job title")
+    industry: Optional[str] = Field(None, description="Case-insensitive substring of the job's industry")
+    seniority_levels: List[str] = Field(default_factory=list, description="Allowed job seniority levels")
+    work_arrangements: List[str] = Field(default_factory=list, description="Allowed job work arrangements")
+    job_ids: List[int] = Field(default_factory=list, description="Restrict to these jobs")
+    days: Optional[float] = Field(None, description="Only candidates found in the last N days", gt=0)
+    best_only: bool = Field(False, description="Only the best candidate of each job")
+    sort_by: str = Field("final_score", description="Score to rank matches by")
+    top_k: int = Field(10, description="Number of candidates to return", ge=1, le=1000)
+
+class CandidateQueryResponse(BaseModel):
+    matched: int = Field(..., description="Candidates matching every filter")
+    snapshot_rows: int = Field(..., description="Candidates in the in-memory snapshot that was queried")
+    query_ms: float
+    candidates: List[Dict[str, Any]]
+
+class OutreachResponse(BaseModel):
+    candidate_id: int
+    outreach_message: str
 
 class DatabaseStatsResponse(BaseModel):
     total_jobs: int
@@ -151,13 +307,42 @@ class ErrorResponse(BaseModel):
     error: str
     details: Optional[str] = None
 
-# Initialize the graph
-try:
-    graph = create_graph()
-    logger.info("Graph initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize graph: {str(e)}")
-    graph = None
+
+def parse_fields(fields: Optional[str]) -> Optional[List[List[str]]]:
+    """Split a ``fields`` query value like ``job_id,candidates.final_score`` into key paths"""
+    if not fields:
+        return None
+    return [path.strip().split(".") for path in fields.split(",") if path.strip()]
+
+
+def select_fields(data: Any, paths: Optional[List[List[str]]]) -> Any:
+    """Keep only the requested key paths; lists are filtered element by element"""
+    if paths is None:
+        return data
+    if isinstance(data, list):
+        return [select_fields(item, paths) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    selected = {}
+    for key in dict.fromkeys(path[0] for path in paths):
+        if key not in data:
+            continue
+        nested = [path[1:] for path in paths if path[0] == key]
+        selected[key] = data[key] if [] in nested else select_fields(data[key], nested)
+    return selected
+
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, e.g. 'job_id,candidates.candidate_id,candidates.final_score'. "
+    "Use it to leave out heavy fields such as profile text, outreach message and raw JD."
+)
+
+def graph_status() -> str:
+    if not graph_ready.is_set():
+        return "initializing"
+    return "initialized" if graph else "failed"
+
 
 @app.get("/")
 async def root():
@@ -165,9 +350,27 @@ async def root():
     return {
         "message": "LinkedIn Profile Parser API", 
         "status": "running",
-        "graph_status": "initialized" if graph else "failed"
+        "graph_status": graph_status()
     }
 
+@app.get("/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+@app.get("/ready")
+async def readiness():
+    """Readiness probe: the graph is compiled and the database answers"""
+    database_ok = await asyncio.to_thread(check_connection)
+    ready = graph is not None and database_ok
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "graph_status": graph_status(),
+        "database": "ok" if database_ok else "unavailable",
+        "boot_timings": boot_timings
+    }
+    return ORJSONResponse(body, status_code=200 if ready else 503)
+
 import re
 def normalize_whitespace(text: str) -> str:
     """
@@ -182,16 +385,194 @@ def normalize_whitespace(text: str) -> str:
 
 
 
+def initial_graph_state(request: JobDescriptionRequest, job_desc: str, start_time: float, time_budget: float) -> Dict[str, Any]:
+    """Graph input for a run starting from scratch; re-analysis overlays what it can reuse"""
+    return {
+        "job_desc": job_desc,
+        "jd_info": None,
+        "job_id": None,
+        "linkedin_profile": None,
+        "profile_found": None,
+        "profile_data": None,
+        "fit_score": None,
+        "score_breakdown": None,
+        "candidate_ids": None,
+        "best_candidate_profile": None,
+        "best_candidate_score": None,
+        "best_candidate_breakdown": None,
+        "outreach_message": None,
+        "max_profiles": request.max_profiles,
+        "adaptive_search": request.adaptive_search,
+        "score_threshold": request.score_threshold,
+        "fetch_offset": 0,
+        "outreach_mode": request.outreach,
+        "deadline": start_time + time_budget,
+        "time_budget": time_budget,
+        "partial": False,
+        "partial_reasons": []
+    }
+
+
+def build_job_match_response(
+    result: Dict[str, Any],
+    outreach_mode: str,
+    background_tasks: BackgroundTasks,
+    run_id: str,
+    processing_time: float,
+    **extra: Any
+) -> JobMatchResponse:
+    """Shape a finished graph run into the API response, scheduling the outreach message if needed"""
+    # Clean all result data to remove problematic characters
+    result = clean_data_recursively(result)
+    
+    # Format candidates data
+    candidates = []
+    if result.get("candidate_ids") and result.get("fit_score") and result.get("score_breakdown"):
+        profile_data_list = result.get("profile_data", [])
+        profile_urls = result.get("profile_urls") or result.get("linkedin_profile") or []
+        score_tiers = result.get("score_tiers") or []
+        
+        for i, candidate_id in enumerate(result["candidate_ids"]):
+            # Extract candidate info from profile data
+            profile_text = profile_data_list[i] if i < len(profile_data_list) else ""
+            candidate_name = extract_candidate_name(profile_text)
+            current_position, current_company = extract_current_position_and_company(profile_text)
+            
+            candidate_info = CandidateInfo(
+                candidate_id=candidate_id,
+                linkedin_url=profile_urls[i] if i < len(profile_urls) else None,
+                scored=result["fit_score"][i] is not None,
+                score_tier=score_tiers[i] if i < len(score_tiers) else None,
+                final_score=result["fit_score"][i],
+                score_breakdown=result["score_breakdown"][i],
+                candidate_name=candidate_name or f"Candidate {i+1}",
+                current_position=current_position,
+                current_company=current_company
+            )
+            candidates.append(candidate_info)
+    
+    # Format best candidate data - clean the profile text
+    best_candidate_profile_clean = clean_text(result.get("best_candidate_profile", ""))
+    best_candidate_id = result.get("best_candidate_id")
+    best_candidate = {
+        "candidate_id": best_candidate_id,
+        "profile": best_candidate_profile_clean,
+        "score": result.get("best_candidate_score"),
+        "breakdown": result.get("best_candidate_breakdown")
+    }
+    
+    # Format JD info
+    jd_info = {}
+    if result.get("jd_info"):
+        jd_info = {
+            "job_title": clean_text(getattr(result["jd_info"], "job_title", "") or ""),
+            "company_name": clean_text(getattr(result["jd_info"], "company_name", "") or ""),
+            "job_location": clean_text(getattr(result["jd_info"], "job_location", "") or ""),
+            "work_arrangement": clean_text(getattr(result["jd_info"], "work_arrangement", "") or ""),
+            "employment_type": clean_text(getattr(result["jd_info"], "employment_type", "") or ""),
+            "technical_skills": [clean_text(skill) for skill in (getattr(result["jd_info"], "technical_skills", []) or [])],
+            "salary_range": clean_text(getattr(result["jd_info"], "salary_range", "") or ""),
+            "experience_required": clean_text(getattr(result["jd_info"], "experience_required", "") or "")
+        }
+    
+    # Clean outreach message
+    outreach_message_clean = clean_text(result.get("outreach_message", ""))
+    
+    # Scores are returned as soon as ranking is done; the outreach message follows separately
+    outreach_url = f"/candidates/{best_candidate_id}/outreach" if best_candidate_id is not None else None
+    # Without a best candidate the node's message is an error description, not an outreach message
+    if best_candidate_id is None:
+        outreach_status = "unavailable"
+    elif outreach_message_clean:
+        outreach_status = "ready"
+    elif outreach_mode == "inline":
+        outreach_status = "unavailable"
+    elif outreach_mode == "background":
+        background_tasks.add_task(generate_outreach_in_background, best_candidate_id)
+        outreach_status = "pending"
+    else:
+        outreach_status = "on_demand"
+    
+    return JobMatchResponse(
+        job_id=result.get("job_id", 0),
+        run_id=run_id,
+        jd_info=jd_info,
+        linkedin_profiles=result.get("linkedin_profile", []),
+        profiles_found=result.get("profile_found", 0),
+        candidates=candidates,
+        best_candidate=best_candidate,
+        outreach_message=outreach_message_clean,
+        outreach_status=outreach_status,
+        outreach_url=outreach_url,
+        scoring_stats=result.get("scoring_stats") or {},
+        processing_time=round(processing_time, 2),
+        partial=bool(result.get("partial")),
+        partial_reasons=result.get("partial_reasons") or [],
+        **extra
+    )
+
+
+def graph_failure(e: Exception, endpoint: str, time_budget: float, run_headers: Dict[str, str]) -> HTTPException:
+    """HTTP error for a failed graph run; the run ID header lets the client resume it"""
+    from src.ai_componenet.graph.proj_graph import RunConflict
+    
+    if isinstance(e, RunConflict):
+        return HTTPException(status_code=409, detail=str(e))
+    if not isinstance(e, CustomException):
+        logger.error(f"Unexpected error in {endpoint}: {str(e)}")
+        return HTTPException(status_code=500, detail=f"Internal server error: {str(e)}", headers=run_headers)
+    circuit_open = find_cause(e, CircuitOpenError)
+    if circuit_open:
+        logger.error(f"Dependency unavailable in {endpoint}: {circuit_open}")
+        return HTTPException(
+            status_code=503,
+            detail=f"Upstream service unavailable: {circuit_open}",
+            headers={"Retry-After": str(max(1, round(circuit_open.retry_after))), **run_headers}
+        )
+    if find_cause(e, DeadlineExceeded):
+        logger.error(f"Time budget exhausted in {endpoint}: {str(e)}")
+        return HTTPException(status_code=504, detail=f"Time budget of {time_budget:g}s exhausted before any result",
+                             headers=run_headers)
+    logger.error(f"Custom exception in {endpoint}: {str(e)}")
+    return HTTPException(status_code=400, detail=f"Processing error: {str(e)}", headers=run_headers)
+
+
+async def run_within_budget(run_graph, deadline: float, time_budget: float, run_headers: Dict[str, str]):
+    """Run ``run_graph`` in a worker thread and wait for it until the budget (plus a grace) is spent.
+
+    A run still going after that answers 504; it keeps checkpointing in its thread, so a
+    retry with the same run ID resumes where it got to.
+    """
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(run_graph), timeout=max(0.0, deadline - time.time()) + DEADLINE_GRACE
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"Run {run_headers.get('X-Run-ID')} still running after its {time_budget:g}s budget")
+        raise HTTPException(status_code=504, detail=f"Time budget of {time_budget:g}s exhausted",
+                            headers=run_headers)
+
+
 @app.post("/analyze-job", response_model=JobMatchResponse)
-async def analyze_job_description(request: JobDescriptionRequest):
+async def analyze_job_description(
+    request: JobDescriptionRequest,
+    background_tasks: BackgroundTasks,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
     """
     Analyze a job description and find matching LinkedIn profiles
     """
+    graph = await get_graph()
     if not graph:
         raise HTTPException(status_code=500, detail="Graph not initialized")
     
+    # Each run is checkpointed under its run ID; a retry with the same ID resumes it
+    from src.ai_componenet.graph.proj_graph import run_checkpointed, new_run_id
+    run_id = request.run_id or new_run_id()
+    run_headers = {"X-Run-ID": run_id}
+    time_budget = request.time_budget or ANALYZE_TIME_BUDGET
+    
     try:
-        import time
         start_time = time.time()
         
         logger.info(f"Processing job description: {request.job_desc[:100]}...")
@@ -200,112 +581,191 @@ async def analyze_job_description(request: JobDescriptionRequest):
         cleaned_job_desc = normalize_whitespace(request.job_desc)
         
         # Initialize state for the graph
-        initial_state = {
-            "job_desc": cleaned_job_desc,
-            "jd_info": None,
-            "job_id": None,
-            "linkedin_profile": None,
-            "profile_found": None,
-            "profile_data": None,
-            "fit_score": None,
-            "score_breakdown": None,
-            "candidate_ids": None,
-            "best_candidate_profile": None,
-            "best_candidate_score": None,
-            "best_candidate_breakdown": None,
-            "outreach_message": None
-        }
+        initial_state = initial_graph_state(request, cleaned_job_desc, start_time, time_budget)
         
-        # Run the workflow
-        result = graph.invoke(initial_state)
-        
-        # Clean all result data to remove problematic characters
-        result = clean_data_recursively(result)
+        # Run the workflow in a worker thread, inside a trace exported per job_id, so the
+        # event loop keeps serving (and identical concurrent runs can share in-flight calls)
+        def run_graph():
+            with start_trace("analyze_job", max_profiles=request.max_profiles, time_budget=time_budget, run_id=run_id), \
+                    deadline_scope(initial_state["deadline"]):
+                return run_checkpointed(graph, run_id, initial_state, resume_update={
+                    "deadline": initial_state["deadline"], "time_budget": time_budget
+                })
+
+        result = await run_within_budget(run_graph, initial_state["deadline"], time_budget, run_headers)
         
         processing_time = time.time() - start_time
+        response = build_job_match_response(result, request.outreach, background_tasks, run_id, processing_time)
         
-        # Format candidates data
-        candidates = []
-        if result.get("candidate_ids") and result.get("fit_score") and result.get("score_breakdown"):
-            profile_data_list = result.get("profile_data", [])
-            
-            for i, candidate_id in enumerate(result["candidate_ids"]):
-                # Extract candidate info from profile data
-                profile_text = profile_data_list[i] if i < len(profile_data_list) else ""
-                candidate_name = extract_candidate_name(profile_text)
-                current_position, current_company = extract_current_position_and_company(profile_text)
-                
-                candidate_info = CandidateInfo(
-                    candidate_id=candidate_id,
-                    linkedin_url=result["linkedin_profile"][i] if i < len(result["linkedin_profile"]) else None,
-                    final_score=result["fit_score"][i],
-                    score_breakdown=result["score_breakdown"][i],
-                    candidate_name=candidate_name or f"Candidate {i+1}",
-                    current_position=current_position,
-                    current_company=current_company
-                )
-                candidates.append(candidate_info)
+        logger.info(f"Successfully processed job description in {processing_time:.2f} seconds")
+        return ORJSONResponse(select_fields(response.model_dump(), parse_fields(fields)))
         
-        # Format best candidate data - clean the profile text
-        best_candidate_profile_clean = clean_text(result.get("best_candidate_profile", ""))
-        best_candidate = {
-            "profile": best_candidate_profile_clean,
-            "score": result.get("best_candidate_score"),
-            "breakdown": result.get("best_candidate_breakdown")
-        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise graph_failure(e, "analyze_job_description", time_budget, run_headers)
+
+
+@app.post("/job/{job_id}/reanalyze", response_model=JobMatchResponse)
+async def reanalyze_job_description(
+    job_id: int,
+    request: JobDescriptionRequest,
+    background_tasks: BackgroundTasks,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """
+    Re-run an edited job description for an existing job, skipping the stages whose inputs
+    did not change: stored candidates are reused unless the job title changed, and they are
+    only rescored when scoring-relevant JD fields changed
+    """
+    graph = await get_graph()
+    if not graph:
+        raise HTTPException(status_code=500, detail="Graph not initialized")
+    
+    from src.ai_componenet.graph.proj_graph import run_checkpointed, run_started, new_run_id
+    from src.ai_componenet.graph.reanalysis import prepare_reanalysis
+    run_id = request.run_id or new_run_id()
+    run_headers = {"X-Run-ID": run_id}
+    time_budget = request.time_budget or ANALYZE_TIME_BUDGET
+    
+    try:
+        start_time = time.time()
+        cleaned_job_desc = normalize_whitespace(request.job_desc)
+        initial_state = initial_graph_state(request, cleaned_job_desc, start_time, time_budget)
         
-        # Format JD info
-        jd_info = {}
-        if result.get("jd_info"):
-            jd_info = {
-                "job_title": clean_text(getattr(result["jd_info"], "job_title", "") or ""),
-                "company_name": clean_text(getattr(result["jd_info"], "company_name", "") or ""),
-                "job_location": clean_text(getattr(result["jd_info"], "job_location", "") or ""),
-                "work_arrangement": clean_text(getattr(result["jd_info"], "work_arrangement", "") or ""),
-                "employment_type": clean_text(getattr(result["jd_info"], "employment_type", "") or ""),
-                "technical_skills": [clean_text(skill) for skill in (getattr(result["jd_info"], "technical_skills", []) or [])],
-                "salary_range": clean_text(getattr(result["jd_info"], "salary_range", "") or ""),
-                "experience_required": clean_text(getattr(result["jd_info"], "experience_required", "") or "")
-            }
+        def run_graph():
+            with start_trace("reanalyze_job", job_id=job_id, time_budget=time_budget, run_id=run_id), \
+                    deadline_scope(initial_state["deadline"]):
+                # A resumed run keeps the plan (and the job changes) from its checkpoint
+                if not run_started(graph, run_id):
+                    plan_state = prepare_reanalysis(job_id, cleaned_job_desc)
+                    if plan_state is None:
+                        return None
+                    initial_state.update(plan_state)
+                return run_checkpointed(graph, run_id, initial_state, resume_update={
+                    "deadline": initial_state["deadline"], "time_budget": time_budget
+                })
         
-        # Clean outreach message
-        outreach_message_clean = clean_text(result.get("outreach_message", ""))
+        result = await run_within_budget(run_graph, initial_state["deadline"], time_budget, run_headers)
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
         
-        response = JobMatchResponse(
-            job_id=result.get("job_id", 0),
-            jd_info=jd_info,
-            linkedin_profiles=result.get("linkedin_profile", []),
-            profiles_found=result.get("profile_found", 0),
-            candidates=candidates,
-            best_candidate=best_candidate,
-            outreach_message=outreach_message_clean,
-            processing_time=round(processing_time, 2)
+        processing_time = time.time() - start_time
+        plan = result.get("reanalysis") or {}
+        response = build_job_match_response(
+            result, request.outreach, background_tasks, run_id, processing_time,
+            reanalysis={"changed_fields": plan.get("changed_fields", []), "stages": plan.get("stages", {})}
         )
-        
-        logger.info(f"Successfully processed job description in {processing_time:.2f} seconds")
-        return response
-        
-    except CustomException as e:
-        logger.error(f"Custom exception in analyze_job_description: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Processing error: {str(e)}")
+        logger.info(f"Re-analyzed job {job_id} in {processing_time:.2f} seconds: {plan.get('stages')}")
+        return ORJSONResponse(select_fields(response.model_dump(), parse_fields(fields)))
+    
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error in analyze_job_description: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        raise graph_failure(e, "reanalyze_job_description", time_budget, run_headers)
+
+def generate_outreach_in_background(candidate_id: int) -> None:
+    from src.ai_componenet.graph.nodes import ensure_outreach_message
+    try:
+        ensure_outreach_message(candidate_id)
+    except Exception as e:
+        logger.error(f"Background outreach generation failed for candidate {candidate_id}: {str(e)}")
+
+
+@app.get("/candidates/{candidate_id}/outreach", response_model=OutreachResponse)
+async def get_candidate_outreach(candidate_id: int):
+    """
+    Get the outreach message for a candidate, generating and storing it on first request
+    """
+    if await get_graph() is None:
+        raise HTTPException(status_code=500, detail="Graph not initialized")
+    from src.ai_componenet.graph.nodes import ensure_outreach_message
+    
+    try:
+        outreach_message = await asyncio.to_thread(ensure_outreach_message, candidate_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except CustomException as e:
+        circuit_open = find_cause(e, CircuitOpenError)
+        if circuit_open:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Upstream service unavailable: {circuit_open}",
+                headers={"Retry-After": str(max(1, round(circuit_open.retry_after)))}
+            )
+        logger.error(f"Error generating outreach for candidate {candidate_id}: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Outreach generation failed: {str(e)}")
+    
+    if outreach_message is None:
+        raise HTTPException(status_code=404, detail=f"Candidate with ID {candidate_id} not found")
+    return OutreachResponse(candidate_id=candidate_id, outreach_message=clean_text(outreach_message))
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode('utf-8')}\n\n"
+
+
+@app.get("/candidates/{candidate_id}/outreach/stream")
+async def stream_candidate_outreach(candidate_id: int):
+    """
+    Stream the outreach message as Server-Sent Events: ``token`` events carry text as the
+    LLM writes it, ``done`` carries the full stored message, ``error`` ends a failed stream
+    """
+    if await get_graph() is None:
+        raise HTTPException(status_code=500, detail="Graph not initialized")
+    from src.ai_componenet.graph.nodes import load_outreach_inputs, stream_outreach_message
+    
+    try:
+        loaded = await asyncio.to_thread(load_outreach_inputs, candidate_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if loaded is None:
+        raise HTTPException(status_code=404, detail=f"Candidate with ID {candidate_id} not found")
+    
+    def events() -> Iterator[str]:
+        # A stored message, or one being generated elsewhere, arrives as a single token event
+        chunks = []
+        try:
+            for text in stream_outreach_message(candidate_id):
+                chunks.append(text)
+                yield sse_event("token", {"text": text})
+        except Exception as e:
+            logger.error(f"Error streaming outreach for candidate {candidate_id}: {str(e)}")
+            yield sse_event("error", {"detail": str(e)})
+            return
+        yield sse_event("done", {"candidate_id": candidate_id, "outreach_message": clean_text("".join(chunks))})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/job/{job_id}", response_model=Dict[str, Any])
-async def get_job_details(job_id: int):
+async def get_job_details(
+    job_id: int,
+    include_full_text: bool = Query(False, description="Include raw JD, profile data and outreach messages"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
     """
     Get detailed information about a specific job and its candidates
     """
     try:
-        job_data = DatabaseQueryUtils.get_job_with_candidates(job_id)
+        cache_key = ("job", job_id, include_full_text, fields)
+        cached = response_cache.get(cache_key)
+        if cached:
+            return Response(content=cached[0], media_type="application/json")
+
+        generation = response_cache.generation
+        job_data = DatabaseQueryUtils.get_job_with_candidates(job_id, include_full_text=include_full_text)
         
         if not job_data:
             raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
         
         # Clean the job data before returning
-        cleaned_job_data = clean_data_recursively(job_data)
-        return cleaned_job_data
+        cleaned_job_data = select_fields(clean_data_recursively(job_data), parse_fields(fields))
+        body = orjson.dumps(cleaned_job_data)
+        response_cache.set(cache_key, body, generation=generation)
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
@@ -313,16 +773,168 @@ async def get_job_details(job_id: int):
         logger.error(f"Error retrieving job {job_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+def rerank_candidates(request: RerankRequest) -> Optional[RerankResponse]:
+    """Rank stored candidates under custom weights in one vectorized pass; no LLM calls.
+
+    Returns None when ``request.job_id`` does not exist; raises ValueError for invalid weights.
+    """
+    from src.ai_componenet.ranking import DIMENSIONS, weight_vector, rank_candidates
+    weights = weight_vector(request.weights)
+    ids, job_ids, scores = DatabaseQueryUtils.get_score_matrix(request.job_id)
+    if request.job_id is not None and not len(ids) and not DatabaseQueryUtils.job_exists(request.job_id):
+        return None
+
+    top, values = rank_candidates(ids, scores, dict(zip(DIMENSIONS, weights)), request.top_k)
+    summaries = DatabaseQueryUtils.get_candidate_summaries(ids[top].tolist())
+    ranked = []
+    for rank, i in enumerate(top, start=1):
+        summary = summaries.get(int(ids[i]), {})
+        ranked.append(RankedCandidate(
+            rank=rank,
+            candidate_id=int(ids[i]),
+            job_id=int(job_ids[i]),
+            job_title=summary.get("job_title"),
+            score=round(float(values[i]), 2),
+            final_score=summary.get("final_score"),
+            score_breakdown={
+                name: float(score) for name, score in zip(DIMENSIONS, scores[i]) if not np.isnan(score)
+            },
+            candidate_name=summary.get("candidate_name"),
+            current_position=summary.get("current_position"),
+            current_company=summary.get("current_company"),
+            linkedin_url=summary.get("linkedin_url")
+        ))
+    return RerankResponse(
+        job_id=request.job_id,
+        weights=dict(zip(DIMENSIONS, weights.tolist())),
+        candidates_ranked=int((~np.isnan(values)).sum()),
+        candidates=ranked
+    )
+
+
+@app.post("/candidates/rerank", response_model=RerankResponse)
+async def rerank_stored_candidates(request: RerankRequest):
+    """
+    Re-rank stored candidates of one job (or of all jobs) under custom score weights,
+    from the persisted dimension scores only, and return the top K
+    """
+    try:
+        response = await asyncio.to_thread(rerank_candidates, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error re-ranking candidates: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    if response is None:
+        raise HTTPException(status_code=404, detail=f"Job with ID {request.job_id} not found")
+    return ORJSONResponse(response.model_dump())
+
+
+def query_candidate_snapshot(request: CandidateQueryRequest) -> CandidateQueryResponse:
+    """Filter and rank candidates over the columnar snapshot; raises ValueError for unknown fields"""
+    from src.ai_componenet.database.snapshot import candidate_snapshot
+    start = time.perf_counter()
+    result = candidate_snapshot.query(
+        min_scores=request.min_scores,
+        max_scores=request.max_scores,
+        job_title=request.job_title,
+        industry=request.industry,
+        seniority_levels=request.seniority_levels,
+        work_arrangements=request.work_arrangements,
+        job_ids=request.job_ids,
+        since=time.time() - request.days * 86400 if request.days else None,
+        best_only=request.best_only,
+        sort_by=request.sort_by,
+        k=request.top_k
+    )
+    summaries = DatabaseQueryUtils.get_candidate_summaries([row["candidate_id"] for row in result["top"]])
+    candidates = []
+    for row in result["top"]:
+        summary = summaries.get(row["candidate_id"], {})
+        candidates.append({
+            **row,
+            "candidate_name": summary.get("candidate_name"),
+            "current_position": summary.get("current_position"),
+            "current_company": summary.get("current_company"),
+            "linkedin_url": summary.get("linkedin_url")
+        })
+    return CandidateQueryResponse(
+        matched=result["matched"],
+        snapshot_rows=result["rows"],
+        query_ms=round((time.perf_counter() - start) * 1000, 2),
+        candidates=candidates
+    )
+
+
+@app.post("/candidates/query", response_model=CandidateQueryResponse)
+async def query_candidates(request: CandidateQueryRequest):
+    """
+    Filter candidates across all jobs by score bounds and job attributes, ranked by a score,
+    from an in-memory columnar snapshot of the candidate table
+    """
+    try:
+        response = await asyncio.to_thread(query_candidate_snapshot, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error querying candidates: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(response.model_dump())
+
+
+def stream_best_candidates(cursor: int, limit: Optional[int], fmt: str) -> Iterator[str]:
+    """Serialize best candidates row by row as NDJSON lines or as one JSON array"""
+    rows = DatabaseQueryUtils.iter_best_candidates_summary(cursor=cursor, limit=limit)
+    if fmt == "ndjson":
+        for row in rows:
+            yield orjson.dumps(clean_data_recursively(row)).decode("utf-8") + "\n"
+        return
+
+    yield "["
+    for i, row in enumerate(rows):
+        yield ("," if i else "") + orjson.dumps(clean_data_recursively(row)).decode("utf-8")
+    yield "]"
+
+
+def cache_stream(cache_key, chunks: Iterator[str], headers: Dict[str, str], generation: int) -> Iterator[str]:
+    """Pass chunks through while collecting them, then cache the body if it stayed small enough"""
+    body = []
+    size = 0
+    for chunk in chunks:
+        if body is not None:
+            body.append(chunk)
+            size += len(chunk)
+            if size > response_cache.max_bytes // 4:
+                body = None
+        yield chunk
+    if body is not None:
+        response_cache.set(cache_key, "".join(body).encode("utf-8"), headers, generation=generation)
+
+
 @app.get("/best-candidates", response_model=List[Dict[str, Any]])
-async def get_best_candidates():
+async def get_best_candidates(
+    cursor: int = Query(0, ge=0, description="Last candidate_id already received"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of rows in this page"),
+    format: Literal["json", "ndjson"] = Query("json", description="Stream as a JSON array or as NDJSON lines")
+):
     """
-    Get summary of all best candidates across all jobs
+    Get summary of all best candidates across all jobs, streamed page by page
     """
     try:
-        best_candidates = DatabaseQueryUtils.get_best_candidates_summary()
-        # Clean the data before returning
-        cleaned_candidates = clean_data_recursively(best_candidates)
-        return cleaned_candidates
+        media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+        cache_key = ("best-candidates", cursor, limit, format)
+        cached = response_cache.get(cache_key)
+        if cached:
+            return Response(content=cached[0], media_type=media_type, headers=cached[1])
+
+        generation = response_cache.generation
+        next_cursor = DatabaseQueryUtils.get_best_candidates_next_cursor(cursor=cursor, limit=limit)
+        headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor is not None else {}
+        return StreamingResponse(
+            cache_stream(cache_key, stream_best_candidates(cursor, limit, format), headers, generation),
+            media_type=media_type,
+            headers=headers
+        )
         
     except Exception as e:
         logger.error(f"Error retrieving best candidates: {str(e)}")
@@ -334,13 +946,53 @@ async def get_database_stats():
     Get statistics about jobs and candidates in the database
     """
     try:
+        cached = response_cache.get(("stats",))
+        if cached:
+            return Response(content=cached[0], media_type="application/json")
+
+        generation = response_cache.generation
         stats = DatabaseQueryUtils.get_job_statistics()
-        return DatabaseStatsResponse(**stats)
+        body = DatabaseStatsResponse(**stats).model_dump_json().encode("utf-8")
+        response_cache.set(("stats",), body, generation=generation)
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error retrieving database stats: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats():
+    """
+    Get hit-rate counters for the in-process response cache
+    """
+    return response_cache.stats()
+
+RESPONSE_CACHE_STATS = registry.gauge(
+    "response_cache_stats", "Response cache counters (hits, misses, evictions, invalidations) and size", ["stat"]
+)
+RESPONSE_CACHE_STATS.set_function(lambda: {
+    (stat,): value for stat, value in response_cache.stats().items()
+    if stat in ("hits", "misses", "evictions", "invalidations", "entries", "bytes")
+})
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Prometheus scrape endpoint with per-node, external call, LLM and DB session latencies
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/traces/{job_id}", response_model=List[Dict[str, Any]])
+async def get_job_traces(job_id: int):
+    """
+    Get the recorded span trees (LLM tokens, downloaded bytes, PDF pages, retries) for a job's runs
+    """
+    # Scans the trace files; kept off the event loop
+    traces = await asyncio.to_thread(get_traces, job_id)
+    if not traces:
+        raise HTTPException(status_code=404, detail=f"No traces recorded for job {job_id}")
+    return traces
+
 @app.get("/jobs", response_model=List[Dict[str, Any]])
 async def get_all_jobs():
     """
@@ -374,6 +1026,8 @@ async def general_exception_handler(request, exc: Exception):
         "status_code": 500
     }
 
+boot_timings["import_seconds"] = round(time.perf_counter() - _import_started, 3)
+
 if __name__ == "__main__":
     import uvicorn
     
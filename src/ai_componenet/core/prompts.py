@@ -12,57 +12,62 @@ jd_template="""
         
         Extract all relevant information from this job description including company details, requirements, responsibilities, etc.
         """
-scoring_template = """
+# The scoring prompt is the rubric and the job description, identical for every candidate
+# of a job, followed by the candidate's profile. Keeping the shared part first lets
+# providers serve it from their prompt (prefix) cache on every call after the first.
+scoring_prefix_template = """
 You are a helpful scoring AI Assistant. Your task is to score the individual based on their profile data and job description.
 
-PROFILE DATA: {profile_data}
-
-JOB DESCRIPTION: {job_desc}
+SCORING CRITERIA:
 
-SCORING CRITERIA (with weightings):
-
-** Education (20%) **
+** Education **
 - Elite schools (MIT, Stanford, etc.): 9-10
 - Strong schools: 7-8
 - Standard universities: 5-6
 - Clear progression: 8-10
 
-** Career Trajectory (20%) **
+** Career Trajectory **
 - Steady growth: 6-8
 - Limited progression: 3-5
 
-** Company Relevance (15%) **
+** Company Relevance **
 - Top tech companies: 9-10
 - Relevant industry: 7-8
 - Any experience: 5-6
 
-** Experience Match (25%) **
+** Experience Match **
 - Perfect skill match: 9-10
 - Strong overlap: 7-8
 - Some relevant skills: 5-6
 
-** Location Match (10%) **
+** Location Match **
 - Exact city: 10
 - Same metro: 8
 - Remote-friendly: 6
 
-** Tenure (10%) **
+** Tenure **
 - 2-3 years average: 9-10
 - 1-2 years: 6-8
 - Job hopping: 3-5
 
 INSTRUCTIONS:
-1. Analyze the profile against each criterion
-2. Assign scores (0-10) for each category
-3. Calculate the weighted final score
-4. Return the results in the exact format specified
+1. Analyze the profile below against each criterion
+2. Assign a score (0-10) for each category
+3. Return only the six category scores in the exact format specified
 
 IMPORTANT: 
 - If specific data is missing, assign average scores (5-6) for that category
 - Provide scores as numbers, not text
-- Use the category names exactly as shown: "Education", "Career_Trajectory", "Company_Relevance", "Experience_Match", "Location_Match", "Tenure"
+
+JOB DESCRIPTION: {job_desc}
 """
 
+scoring_candidate_template = """
+PROFILE DATA: {profile_data}
+"""
+
+scoring_template = scoring_prefix_template + scoring_candidate_template
+
 
 outreach_template = """
 You are an expert recruiter writing a personalized outreach message for a top candidate.
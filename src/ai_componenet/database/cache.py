@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ResponseCache:
+    """Size-bounded in-process LRU cache for serialized API responses.
+
+    Keys are tuples whose first element is a namespace (e.g. ``("job", 3, False)``),
+    so writers can drop everything under a namespace or a key prefix. Entries also
+    expire after ``ttl`` seconds, which bounds staleness across worker processes
+    that don't see each other's invalidations.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, bytes, Dict[str, str]]]" = OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation; lets callers detect writes that raced a fill"""
+        return self._generation
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Return ``(body, headers)`` for a fresh entry, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, key: Tuple[Hashable, ...], body: bytes, headers: Optional[Dict[str, str]] = None,
+            generation: Optional[int] = None) -> bool:
+        """Store a response body; skipped if too large or if an invalidation happened since ``generation``"""
+        if len(body) > self.max_bytes // 4:
+            return False
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, body, dict(headers or {}))
+            self._size += len(body)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """Drop every entry whose key starts with ``prefix`` (everything when empty)"""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def _remove(self, key: Tuple[Hashable, ...]) -> None:
+        _, body, _ = self._entries.pop(key)
+        self._size -= len(body)
+
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256")),
+    max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    ttl=float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+)
@@ -6,6 +6,8 @@ sys.path.insert(0, str(project_root))
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 from src.ai_componenet.database.models import JobDescription, LinkedInCandidate
+from src.ai_componenet.database.cache import response_cache
+from src.ai_componenet.database.snapshot import candidate_snapshot
 from src.ai_componenet.graph.utils.jdinfo import JDInfo
 
 class JobDescriptionCRUD:
@@ -35,6 +37,22 @@ class JobDescriptionCRUD:
         db.add(db_job)
         db.commit()
         db.refresh(db_job)
+        response_cache.invalidate("stats")
+        return db_job
+    
+    @staticmethod
+    def update_job_description(db: Session, job_id: int, jd_info: JDInfo, original_desc: str) -> Optional[JobDescription]:
+        """Replace the extracted fields and text of an edited job description"""
+        db_job = db.query(JobDescription).filter(JobDescription.id == job_id).first()
+        if db_job:
+            for field, value in jd_info.model_dump().items():
+                setattr(db_job, field, value)
+            db_job.original_job_desc = original_desc
+            db.commit()
+            db.refresh(db_job)
+            candidate_snapshot.mark_changed()
+            response_cache.invalidate("best-candidates")
+            response_cache.invalidate("job", job_id)
         return db_job
     
     @staticmethod
@@ -94,8 +112,16 @@ class LinkedInCandidateCRUD:
         db.add(db_candidate)
         db.commit()
         db.refresh(db_candidate)
+        candidate_snapshot.mark_changed()
+        response_cache.invalidate("stats")
+        response_cache.invalidate("job", job_description_id)
         return db_candidate
     
+    @staticmethod
+    def get_candidate(db: Session, candidate_id: int) -> Optional[LinkedInCandidate]:
+        """Get candidate by ID"""
+        return db.query(LinkedInCandidate).filter(LinkedInCandidate.id == candidate_id).first()
+    
     @staticmethod
     def get_candidates_by_job(db: Session, job_description_id: int) -> List[LinkedInCandidate]:
         """Get all candidates for a specific job"""
@@ -113,11 +139,77 @@ class LinkedInCandidateCRUD:
     
     @staticmethod
     def update_best_candidate(db: Session, candidate_id: int, outreach_message: str):
-        """Update candidate as best candidate with outreach message"""
+        """Update candidate as best candidate with outreach message, unflagging the job's previous best"""
         candidate = db.query(LinkedInCandidate).filter(LinkedInCandidate.id == candidate_id).first()
         if candidate:
+            db.query(LinkedInCandidate).filter(
+                LinkedInCandidate.job_description_id == candidate.job_description_id,
+                LinkedInCandidate.id != candidate_id,
+                LinkedInCandidate.is_best_candidate == "Yes"
+            ).update({"is_best_candidate": "No"}, synchronize_session=False)
             candidate.is_best_candidate = "Yes"
+            # A deferred message (None) keeps one already stored for this candidate
+            if outreach_message is not None:
+                candidate.outreach_message = outreach_message
+            db.commit()
+            db.refresh(candidate)
+            candidate_snapshot.mark_changed()
+            response_cache.invalidate("stats")
+            response_cache.invalidate("best-candidates")
+            response_cache.invalidate("job", candidate.job_description_id)
+        return candidate
+    
+    @staticmethod
+    def set_outreach_message(db: Session, candidate_id: int, outreach_message: str):
+        """Store a generated outreach message without changing the best-candidate flag"""
+        candidate = db.query(LinkedInCandidate).filter(LinkedInCandidate.id == candidate_id).first()
+        if candidate:
             candidate.outreach_message = outreach_message
             db.commit()
             db.refresh(candidate)
-        return candidate
\ No newline at end of file
+            response_cache.invalidate("job", candidate.job_description_id)
+        return candidate
+    
+    @staticmethod
+    def update_candidate_scores(db: Session, candidate_id: int, final_score: float, score_breakdown: Dict[str, float]):
+        """Replace a candidate's scores, e.g. after rescoring with a stronger model"""
+        candidate = db.query(LinkedInCandidate).filter(LinkedInCandidate.id == candidate_id).first()
+        if candidate:
+            candidate.final_score = final_score
+            candidate.education_score = score_breakdown.get("Education")
+            candidate.career_trajectory_score = score_breakdown.get("Career_Trajectory")
+            candidate.company_relevance_score = score_breakdown.get("Company_Relevance")
+            candidate.experience_match_score = score_breakdown.get("Experience_Match")
+            candidate.location_match_score = score_breakdown.get("Location_Match")
+            candidate.tenure_score = score_breakdown.get("Tenure")
+            db.commit()
+            db.refresh(candidate)
+            candidate_snapshot.mark_changed()
+            response_cache.invalidate("stats")
+            response_cache.invalidate("best-candidates")
+            response_cache.invalidate("job", candidate.job_description_id)
+        return candidate
+    
+    @staticmethod
+    def clear_outreach_messages(db: Session, job_description_id: int) -> int:
+        """Drop the outreach messages of a job's candidates, e.g. after its description changed"""
+        cleared = db.query(LinkedInCandidate).filter(
+            LinkedInCandidate.job_description_id == job_description_id,
+            LinkedInCandidate.outreach_message.isnot(None)
+        ).update({"outreach_message": None}, synchronize_session=False)
+        db.commit()
+        response_cache.invalidate("job", job_description_id)
+        return cleared
+    
+    @staticmethod
+    def delete_candidates_by_job(db: Session, job_description_id: int) -> int:
+        """Delete all candidates of a job, e.g. before searching again for a new job title"""
+        deleted = db.query(LinkedInCandidate).filter(
+            LinkedInCandidate.job_description_id == job_description_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        candidate_snapshot.remove_job(job_description_id)
+        response_cache.invalidate("stats")
+        response_cache.invalidate("best-candidates")
+        response_cache.invalidate("job", job_description_id)
+        return deleted
@@ -1,25 +1,125 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
 from contextlib import contextmanager
+from typing import Any, Dict
 import os
+import threading
+import time
 from dotenv import load_dotenv
+from src.ai_componenet.metrics import DB_SESSION_DURATION
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./job_matching.db")
+# Heroku-style postgres:// URLs name no SQLAlchemy dialect
+if DATABASE_URL.startswith("postgres://"):
+    DATABASE_URL = "postgresql://" + DATABASE_URL[len("postgres://"):]
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+# "sqlite", "postgresql" or "default"; picked from DATABASE_URL when not set
+STORAGE_PROFILE = os.getenv("STORAGE_PROFILE") or (
+    "sqlite" if DATABASE_URL.startswith("sqlite")
+    else "postgresql" if DATABASE_URL.startswith("postgresql")
+    else "default"
 )
 
+# SQLite profile settings
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "30000"))
+
+# PostgreSQL profile settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Serializes writers inside this process; SQLite allows one writer at a time
+_sqlite_write_lock = threading.RLock()
+
+
+def _sqlite_engine_options() -> Dict[str, Any]:
+    return {
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000
+        }
+    }
+
+
+def _postgresql_engine_options() -> Dict[str, Any]:
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True
+    }
+
+
+STORAGE_PROFILES = {
+    "sqlite": _sqlite_engine_options,
+    "postgresql": _postgresql_engine_options,
+    "default": lambda: {}
+}
+
+if STORAGE_PROFILE not in STORAGE_PROFILES:
+    raise ValueError(f"Unknown STORAGE_PROFILE '{STORAGE_PROFILE}', expected one of {list(STORAGE_PROFILES)}")
+
+engine = create_engine(DATABASE_URL, **STORAGE_PROFILES[STORAGE_PROFILE]())
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+if STORAGE_PROFILE == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        """Enable WAL and a busy timeout on every new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+    def _acquire_write_lock(session) -> None:
+        """Hold the process write lock from the first write until the transaction ends.
+
+        Taken before SQLite's own write lock, so two threads of this process never wait
+        on each other in opposite orders.
+        """
+        if not session.info.get("holds_write_lock"):
+            _sqlite_write_lock.acquire()
+            session.info["holds_write_lock"] = True
+
+    @event.listens_for(SessionLocal, "before_flush")
+    def _lock_before_flush(session, flush_context, instances):
+        _acquire_write_lock(session)
+
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _lock_before_bulk_write(orm_execute_state):
+        """Bulk ``query.update()`` / ``delete()`` and DML statements write without a flush"""
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            _acquire_write_lock(orm_execute_state.session)
+
+    @event.listens_for(SessionLocal, "after_transaction_end")
+    def _release_write_lock(session, transaction):
+        if transaction.parent is None and session.info.pop("holds_write_lock", False):
+            _sqlite_write_lock.release()
+
+
 def create_tables():
     from .models import Base
     Base.metadata.create_all(bind=engine)
 
+def check_connection() -> bool:
+    """Cheap readiness check: can we open a connection and run a trivial query"""
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
 def get_db() -> Session:
     db = SessionLocal()
     try:
@@ -30,11 +130,15 @@ def get_db() -> Session:
 @contextmanager
 def get_db_session():
     db = SessionLocal()
+    start = time.perf_counter()
+    outcome = "error"
     try:
         yield db
         db.commit()
+        outcome = "success"
     except Exception as e:
         db.rollback()
         raise e
     finally:
         db.close()
+        DB_SESSION_DURATION.observe(time.perf_counter() - start, outcome=outcome)
@@ -0,0 +1,271 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from dotenv import load_dotenv
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.models import JobDescription, LinkedInCandidate
+from src.ai_componenet.graph.utils.models import SCORE_DIMENSIONS
+from src.ai_componenet.metrics import registry
+
+load_dotenv()
+
+# Seconds a query may go without checking the database for writes by other worker processes
+SNAPSHOT_SYNC_INTERVAL = float(os.getenv("CANDIDATE_SNAPSHOT_SYNC", "5"))
+# Seconds between full rebuilds; they pick up deletions made by other worker processes
+SNAPSHOT_REBUILD_INTERVAL = float(os.getenv("CANDIDATE_SNAPSHOT_REBUILD", "300"))
+
+# Score columns: final score plus one per dimension, keyed like score breakdowns
+SCORE_FIELDS = {"final_score": LinkedInCandidate.final_score, **{
+    name: getattr(LinkedInCandidate, f"{field}_score") for name, field in SCORE_DIMENSIONS.items()
+}}
+# Job attributes copied to every candidate row, dictionary-encoded
+JOB_FIELDS = {
+    "job_title": JobDescription.job_title,
+    "seniority_level": JobDescription.seniority_level,
+    "work_arrangement": JobDescription.work_arrangement,
+    "industry": JobDescription.industry,
+    "job_location": JobDescription.job_location,
+}
+
+CANDIDATE_SNAPSHOT_ROWS = registry.gauge(
+    "candidate_snapshot_rows", "Candidates held in this process's columnar snapshot"
+)
+
+
+def _epoch(value: Optional[datetime]) -> float:
+    """Seconds since the epoch for the naive UTC datetimes the models store"""
+    if value is None:
+        return np.nan
+    return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+
+
+class CandidateSnapshot:
+    """Columnar in-memory copy of candidate scores and the key attributes of their job.
+
+    Every column is a NumPy array, so filters over all candidates are vectorized mask
+    operations. The snapshot is built on first use and kept current incrementally: after
+    a write in this process (``mark_changed``), and at least every ``CANDIDATE_SNAPSHOT_SYNC``
+    seconds for other processes, a query first loads the candidates and jobs written
+    since the previous sync (``updated_at`` watermarks, re-read with some overlap because
+    ``updated_at`` is set at flush, before commit). Deletions made in this process
+    are applied directly; a full rebuild every ``CANDIDATE_SNAPSHOT_REBUILD`` seconds
+    picks up the others.
+    """
+
+    def __init__(self, sync_interval: float = SNAPSHOT_SYNC_INTERVAL,
+                 rebuild_interval: float = SNAPSHOT_REBUILD_INTERVAL):
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self._changed = True
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.size = 0
+        self.built_at = None
+        self._row_of: Dict[int, int] = {}
+        self._candidate_watermark = None
+        self._job_watermark = None
+        self.columns: Dict[str, np.ndarray] = {}
+        self._allocate(1024)
+        # Per job attribute: value -> code, and code -> value; code 0 is "missing"
+        self._codes: Dict[str, Dict[Optional[str], int]] = {field: {None: 0} for field in JOB_FIELDS}
+        self.vocabulary: Dict[str, List[Optional[str]]] = {field: [None] for field in JOB_FIELDS}
+
+    def _allocate(self, capacity: int) -> None:
+        specs = {"candidate_id": np.int64, "job_id": np.int64, "created_at": np.float64, "is_best": np.bool_}
+        specs.update({field: np.float64 for field in SCORE_FIELDS})
+        specs.update({field: np.int32 for field in JOB_FIELDS})
+        grown = {}
+        for name, dtype in specs.items():
+            column = np.full(capacity, np.nan) if dtype is np.float64 else np.zeros(capacity, dtype=dtype)
+            if name in self.columns:
+                column[:self.size] = self.columns[name][:self.size]
+            grown[name] = column
+        self.columns = grown
+
+    def _code(self, field: str, value: Optional[str]) -> int:
+        codes = self._codes[field]
+        if value not in codes:
+            codes[value] = len(self.vocabulary[field])
+            self.vocabulary[field].append(value)
+        return codes[value]
+
+    def _upsert(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Insert or replace rows of (candidate_id, job_id, created_at, is_best, *scores, *job attributes)"""
+        score_names = list(SCORE_FIELDS)
+        job_names = list(JOB_FIELDS)
+        for row in rows:
+            candidate_id, job_id, created_at, is_best = row[:4]
+            scores = row[4:4 + len(score_names)]
+            job_values = row[4 + len(score_names):]
+            index = self._row_of.get(candidate_id)
+            if index is None:
+                if self.size == len(self.columns["candidate_id"]):
+                    self._allocate(2 * self.size)
+                index = self._row_of[candidate_id] = self.size
+                self.size += 1
+            self.columns["candidate_id"][index] = candidate_id
+            self.columns["job_id"][index] = job_id
+            self.columns["created_at"][index] = _epoch(created_at)
+            self.columns["is_best"][index] = is_best == "Yes"
+            for name, value in zip(score_names, scores):
+                self.columns[name][index] = np.nan if value is None else value
+            for name, value in zip(job_names, job_values):
+                self.columns[name][index] = self._code(name, value)
+
+    def _set_job(self, job_id: int, job_values: Sequence[Optional[str]]) -> None:
+        rows = self.columns["job_id"][:self.size] == job_id
+        for name, value in zip(JOB_FIELDS, job_values):
+            self.columns[name][:self.size][rows] = self._code(name, value)
+
+    def _remove(self, keep: np.ndarray) -> None:
+        kept = int(keep.sum())
+        for name, column in self.columns.items():
+            column[:kept] = column[:self.size][keep]
+        self.size = kept
+        self._row_of = {int(candidate_id): i for i, candidate_id in enumerate(self.columns["candidate_id"][:kept])}
+
+    def remove_job(self, job_id: int) -> None:
+        """Drop the candidates of a job, after they were deleted from the database"""
+        with self._lock:
+            if self.built_at is not None:
+                self._remove(self.columns["job_id"][:self.size] != job_id)
+
+    def mark_changed(self) -> None:
+        """Called after candidates or jobs are written, so the next query syncs first"""
+        self._changed = True
+
+    def sync(self) -> None:
+        """Load what was written since the last sync; rebuild from scratch when due"""
+        with self._lock:
+            now = time.monotonic()
+            if self.built_at is None or now - self.built_at > self.rebuild_interval:
+                self._reset()
+                self.built_at = now
+            elif not self._changed and now - self._synced_at <= self.sync_interval:
+                return
+            # Cleared before reading, so a write committed during the sync triggers another
+            self._changed = False
+            self._synced_at = now
+            # A row flushed before the watermark may commit after the previous sync read past it.
+            # Re-reading a sync interval (at least a second) back catches it; upserts are idempotent.
+            lookback = timedelta(seconds=max(self.sync_interval, 1.0))
+            with get_db_session() as db:
+                query = db.query(
+                    LinkedInCandidate.id,
+                    LinkedInCandidate.job_description_id,
+                    LinkedInCandidate.created_at,
+                    LinkedInCandidate.is_best_candidate,
+                    *SCORE_FIELDS.values(),
+                    *JOB_FIELDS.values(),
+                    LinkedInCandidate.updated_at
+                ).join(JobDescription, LinkedInCandidate.job_description_id == JobDescription.id)
+                if self._candidate_watermark is not None:
+                    query = query.filter(LinkedInCandidate.updated_at >= self._candidate_watermark - lookback)
+                rows = query.all()
+                self._upsert(row[:-1] for row in rows)
+                watermarks = [row[-1] for row in rows if row[-1] is not None]
+                if watermarks:
+                    self._candidate_watermark = max(watermarks + [self._candidate_watermark or watermarks[0]])
+
+                # Edited jobs (re-analysis) change the attributes of candidates that were not rewritten
+                job_query = db.query(JobDescription.id, *JOB_FIELDS.values(), JobDescription.updated_at)
+                if self._job_watermark is not None:
+                    job_query = job_query.filter(JobDescription.updated_at >= self._job_watermark - lookback)
+                jobs = job_query.all()
+                if self._job_watermark is not None:
+                    for job in jobs:
+                        self._set_job(job[0], job[1:-1])
+                job_watermarks = [job[-1] for job in jobs if job[-1] is not None]
+                if job_watermarks:
+                    self._job_watermark = max(job_watermarks + [self._job_watermark or job_watermarks[0]])
+
+    def query(
+        self,
+        min_scores: Optional[Dict[str, float]] = None,
+        max_scores: Optional[Dict[str, float]] = None,
+        job_title: Optional[str] = None,
+        industry: Optional[str] = None,
+        seniority_levels: Optional[List[str]] = None,
+        work_arrangements: Optional[List[str]] = None,
+        job_ids: Optional[List[int]] = None,
+        since: Optional[float] = None,
+        best_only: bool = False,
+        sort_by: str = "final_score",
+        k: int = 10
+    ) -> Dict[str, Any]:
+        """Candidates matching every predicate, best ``sort_by`` first.
+
+        Score bounds are inclusive and exclude candidates missing that score; ``job_title``
+        and ``industry`` match case-insensitive substrings; ``since`` is an epoch time.
+        Returns the ``matched`` count and the ``top`` rows as dicts.
+        """
+        from src.ai_componenet.ranking import top_k
+
+        for bounds in (min_scores or {}, max_scores or {}):
+            unknown = sorted(set(bounds) - set(SCORE_FIELDS))
+            if unknown:
+                raise ValueError(f"Unknown score fields {unknown}; expected some of {list(SCORE_FIELDS)}")
+        if sort_by not in SCORE_FIELDS:
+            raise ValueError(f"Cannot sort by {sort_by}; expected one of {list(SCORE_FIELDS)}")
+
+        self.sync()
+        with self._lock:
+            n = self.size
+            columns = {name: column[:n] for name, column in self.columns.items()}
+            mask = np.ones(n, dtype=bool)
+            # NaN compares False, so unscored candidates fail every score bound
+            for name, bound in (min_scores or {}).items():
+                mask &= columns[name] >= bound
+            for name, bound in (max_scores or {}).items():
+                mask &= columns[name] <= bound
+            for field, needle in (("job_title", job_title), ("industry", industry)):
+                if needle:
+                    needle = needle.casefold()
+                    codes = [code for code, value in enumerate(self.vocabulary[field]) if value and needle in value.casefold()]
+                    mask &= np.isin(columns[field], codes)
+            for field, allowed in (("seniority_level", seniority_levels), ("work_arrangement", work_arrangements)):
+                if allowed:
+                    codes = [self._codes[field][value] for value in allowed if value in self._codes[field]]
+                    mask &= np.isin(columns[field], codes)
+            if job_ids:
+                mask &= np.isin(columns["job_id"], job_ids)
+            if since is not None:
+                mask &= columns["created_at"] >= since
+            if best_only:
+                mask &= columns["is_best"]
+
+            matched = np.flatnonzero(mask)
+            order = matched[top_k(columns[sort_by][matched], columns["candidate_id"][matched], k)]
+            top = [
+                {
+                    "candidate_id": int(columns["candidate_id"][i]),
+                    "job_id": int(columns["job_id"][i]),
+                    "job_title": self.vocabulary["job_title"][columns["job_title"][i]],
+                    "seniority_level": self.vocabulary["seniority_level"][columns["seniority_level"][i]],
+                    "is_best_candidate": bool(columns["is_best"][i]),
+                    "created_at": datetime.fromtimestamp(columns["created_at"][i], timezone.utc).isoformat()
+                    if not np.isnan(columns["created_at"][i]) else None,
+                    "final_score": None if np.isnan(columns["final_score"][i]) else float(columns["final_score"][i]),
+                    "score_breakdown": {
+                        name: float(columns[name][i]) for name in SCORE_DIMENSIONS if not np.isnan(columns[name][i])
+                    }
+                }
+                for i in order
+            ]
+            return {"matched": len(matched), "rows": n, "top": top}
+
+
+candidate_snapshot = CandidateSnapshot()
+
+CANDIDATE_SNAPSHOT_ROWS.set_function(lambda: {(): candidate_snapshot.size})
@@ -3,26 +3,44 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session, joinedload, defer
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+import numpy as np
 from src.ai_componenet.database.database import get_db_session
-from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
 from src.ai_componenet.database.models import JobDescription, LinkedInCandidate
+from src.ai_componenet.graph.utils.models import SCORE_DIMENSIONS
+
+# Candidate column holding each score dimension, in SCORE_DIMENSIONS order
+SCORE_MATRIX_COLUMNS = [getattr(LinkedInCandidate, f"{field}_score") for field in SCORE_DIMENSIONS.values()]
 
 class DatabaseQueryUtils:
     """Utility class for common database queries"""
     
     @staticmethod
-    def get_job_with_candidates(job_id: int) -> Optional[Dict[str, Any]]:
-        """Get job description with all its candidates"""
+    def get_job_with_candidates(job_id: int, include_full_text: bool = False) -> Optional[Dict[str, Any]]:
+        """Get job description with all its candidates in a single query.
+
+        Large text columns (raw JD, profile data, outreach message) are deferred
+        and left out of the result unless ``include_full_text`` is set.
+        """
         with get_db_session() as db:
-            job = JobDescriptionCRUD.get_job_description(db, job_id)
+            candidates_loader = joinedload(JobDescription.candidates)
+            query = db.query(JobDescription).filter(JobDescription.id == job_id)
+            if include_full_text:
+                query = query.options(candidates_loader)
+            else:
+                query = query.options(
+                    defer(JobDescription.original_job_desc),
+                    defer(JobDescription.company_description),
+                    candidates_loader.defer(LinkedInCandidate.profile_data),
+                    candidates_loader.defer(LinkedInCandidate.outreach_message)
+                )
+
+            job = query.first()
             if not job:
                 return None
             
-            candidates = LinkedInCandidateCRUD.get_candidates_by_job(db, job_id)
-            
-            return {
+            result = {
                 "job": {
                     "id": job.id,
                     "job_title": job.job_title,
@@ -40,6 +58,7 @@ class DatabaseQueryUtils:
                         "id": candidate.id,
                         "linkedin_url": candidate.linkedin_url,
                         "final_score": candidate.final_score,
+                        "scored": candidate.final_score is not None,
                         "education_score": candidate.education_score,
                         "career_trajectory_score": candidate.career_trajectory_score,
                         "company_relevance_score": candidate.company_relevance_score,
@@ -52,35 +71,134 @@ class DatabaseQueryUtils:
                         "is_best_candidate": candidate.is_best_candidate,
                         "created_at": candidate.created_at.isoformat() if candidate.created_at else None
                     }
-                    for candidate in candidates
+                    for candidate in job.candidates
                 ]
             }
+
+            if include_full_text:
+                result["job"]["company_description"] = job.company_description
+                result["job"]["original_job_desc"] = job.original_job_desc
+                for entry, candidate in zip(result["candidates"], job.candidates):
+                    entry["profile_data"] = candidate.profile_data
+                    entry["outreach_message"] = candidate.outreach_message
+
+            return result
     
     @staticmethod
-    def get_best_candidates_summary() -> List[Dict[str, Any]]:
+    def _best_candidates_query(db: Session, cursor: int = 0):
+        """Column-only query for best candidates after ``cursor``, ordered by candidate id"""
+        return db.query(
+            LinkedInCandidate.id,
+            JobDescription.id,
+            JobDescription.job_title,
+            JobDescription.company_name,
+            LinkedInCandidate.candidate_name,
+            LinkedInCandidate.current_position,
+            LinkedInCandidate.current_company,
+            LinkedInCandidate.final_score,
+            LinkedInCandidate.linkedin_url,
+            LinkedInCandidate.created_at
+        ).join(
+            JobDescription, LinkedInCandidate.job_description_id == JobDescription.id
+        ).filter(
+            LinkedInCandidate.is_best_candidate == "Yes",
+            LinkedInCandidate.id > cursor
+        ).order_by(LinkedInCandidate.id)
+
+    @staticmethod
+    def iter_best_candidates_summary(
+        cursor: int = 0,
+        limit: Optional[int] = None,
+        chunk_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream best candidates with their job details, fetching ``chunk_size`` rows at a time.
+
+        ``cursor`` is the last ``candidate_id`` already seen; pass ``limit`` to page.
+        """
+        with get_db_session() as db:
+            query = DatabaseQueryUtils._best_candidates_query(db, cursor)
+            if limit is not None:
+                query = query.limit(limit)
+
+            for row in query.yield_per(chunk_size):
+                (candidate_id, job_id, job_title, company_name, candidate_name,
+                 current_position, current_company, final_score, linkedin_url, created_at) = row
+                yield {
+                    "candidate_id": candidate_id,
+                    "job_id": job_id,
+                    "job_title": job_title,
+                    "company_name": company_name,
+                    "candidate_name": candidate_name,
+                    "current_position": current_position,
+                    "current_company": current_company,
+                    "final_score": final_score,
+                    "linkedin_url": linkedin_url,
+                    "created_at": created_at.isoformat() if created_at else None
+                }
+
+    @staticmethod
+    def get_best_candidates_next_cursor(cursor: int = 0, limit: Optional[int] = None) -> Optional[int]:
+        """Cursor for the page after ``(cursor, limit)``, or None when that page is the last one"""
+        if limit is None:
+            return None
+        with get_db_session() as db:
+            ids = DatabaseQueryUtils._best_candidates_query(db, cursor).with_entities(
+                LinkedInCandidate.id
+            ).offset(limit - 1).limit(2).all()
+            return ids[0][0] if len(ids) == 2 else None
+
+    @staticmethod
+    def get_best_candidates_summary(cursor: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get summary of all best candidates across all jobs"""
+        return list(DatabaseQueryUtils.iter_best_candidates_summary(cursor=cursor, limit=limit))
+    
+    @staticmethod
+    def job_exists(job_id: int) -> bool:
+        with get_db_session() as db:
+            return db.query(JobDescription.id).filter(JobDescription.id == job_id).first() is not None
+
+    @staticmethod
+    def get_score_matrix(job_id: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Candidate ids, job ids and an (n, dimensions) score matrix, NaN where a score is missing.
+
+        Covers the candidates of ``job_id``, or of every job when it is None.
+        """
+        with get_db_session() as db:
+            query = db.query(LinkedInCandidate.id, LinkedInCandidate.job_description_id, *SCORE_MATRIX_COLUMNS)
+            if job_id is not None:
+                query = query.filter(LinkedInCandidate.job_description_id == job_id)
+            # NULL becomes NaN when the rows are converted to floats
+            matrix = np.array(query.all(), dtype=float).reshape(-1, 2 + len(SCORE_MATRIX_COLUMNS))
+        return matrix[:, 0].astype(np.int64), matrix[:, 1].astype(np.int64), matrix[:, 2:]
+
+    @staticmethod
+    def get_candidate_summaries(candidate_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Name, position, URL and job title of the given candidates, keyed by candidate id"""
+        if not candidate_ids:
+            return {}
         with get_db_session() as db:
-            # Query to get all best candidates with their job details
-            query = db.query(LinkedInCandidate, JobDescription).join(
+            rows = db.query(
+                LinkedInCandidate.id,
+                JobDescription.job_title,
+                LinkedInCandidate.candidate_name,
+                LinkedInCandidate.current_position,
+                LinkedInCandidate.current_company,
+                LinkedInCandidate.linkedin_url,
+                LinkedInCandidate.final_score
+            ).join(
                 JobDescription, LinkedInCandidate.job_description_id == JobDescription.id
-            ).filter(LinkedInCandidate.is_best_candidate == "Yes")
-            
-            results = []
-            for candidate, job in query.all():
-                results.append({
-                    "candidate_id": candidate.id,
-                    "job_id": job.id,
-                    "job_title": job.job_title,
-                    "company_name": job.company_name,
-                    "candidate_name": candidate.candidate_name,
-                    "current_position": candidate.current_position,
-                    "current_company": candidate.current_company,
-                    "final_score": candidate.final_score,
-                    "linkedin_url": candidate.linkedin_url,
-                    "created_at": candidate.created_at.isoformat() if candidate.created_at else None
-                })
-            
-            return results
+            ).filter(LinkedInCandidate.id.in_(candidate_ids)).all()
+            return {
+                candidate_id: {
+                    "job_title": job_title,
+                    "candidate_name": candidate_name,
+                    "current_position": current_position,
+                    "current_company": current_company,
+                    "linkedin_url": linkedin_url,
+                    "final_score": final_score
+                }
+                for candidate_id, job_title, candidate_name, current_position, current_company, linkedin_url, final_score in rows
+            }
     
     @staticmethod
     def get_job_statistics() -> Dict[str, Any]:
@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+from dotenv import load_dotenv
+from src.ai_componenet.tracing import set_span_attributes
+
+load_dotenv()
+
+# Default per-request budget for /analyze-job, in seconds
+ANALYZE_TIME_BUDGET = float(os.getenv("ANALYZE_TIME_BUDGET", "120"))
+
+# Seconds past the budget an endpoint still waits for its run to wrap up before answering 504
+DEADLINE_GRACE = float(os.getenv("DEADLINE_GRACE", "2"))
+
+# Share of the budget by which each stage must be done, so later stages keep some time:
+# profile fetches stop at 60% of the budget, scoring at 90%, outreach uses the rest
+STAGE_SHARES: Dict[str, float] = {
+    "fetch": float(os.getenv("DEADLINE_FETCH_SHARE", "0.6")),
+    "scoring": float(os.getenv("DEADLINE_SCORING_SHARE", "0.9")),
+}
+
+# Absolute (wall clock) deadline for the calls made in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised instead of starting external work once the request's time budget is spent"""
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """Bound the calls made inside the block by ``deadline``; nested scopes only tighten it"""
+    current = _deadline.get()
+    if deadline is None or (current is not None and current <= deadline):
+        yield
+        return
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current deadline, or None when the work is unbounded"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+def check_deadline() -> None:
+    left = time_left()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Time budget exhausted {-left:.2f}s ago")
+
+
+def clamp_timeout(timeout: float) -> float:
+    """``timeout`` shortened to the time left, but never below a small floor"""
+    left = time_left()
+    return timeout if left is None else max(0.1, min(timeout, left))
+
+
+def stage_deadline(state: Dict[str, Any], stage: Optional[str] = None) -> Optional[float]:
+    """Deadline for a graph stage: the request deadline minus the share kept for later stages"""
+    deadline = state.get("deadline")
+    if deadline is None or stage not in STAGE_SHARES:
+        return deadline
+    budget = state.get("time_budget") or 0.0
+    return deadline - budget * (1 - STAGE_SHARES[stage])
+
+
+@contextmanager
+def stage_budget(state: Dict[str, Any], stage: Optional[str] = None) -> Iterator[Optional[float]]:
+    """Run a node's calls under its stage deadline and record the remaining budget on its span"""
+    deadline = stage_deadline(state, stage)
+    if deadline is not None:
+        set_span_attributes(budget_remaining=round(state["deadline"] - time.time(), 3))
+    with deadline_scope(deadline):
+        yield deadline
+
+
+def mark_partial(state: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    """State update flagging the run as partial, keeping the reasons of earlier stages"""
+    return {"partial": True, "partial_reasons": list(state.get("partial_reasons") or []) + [reason]}
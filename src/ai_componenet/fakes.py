@@ -0,0 +1,105 @@
+"""
+Deterministic offline LLM used by the ``fake`` provider, tests and the benchmarks.
+
+``make_fake_model`` stands in for a chat model: structured answers (JD info, score
+breakdowns) derived from a hash of the prompt, or streamed outreach text, after
+``llm_latency`` seconds. Every call is counted in ``fake_llm_stats``.
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import hashlib
+import threading
+import time
+from src.ai_componenet.prompt_cache import estimate_tokens
+
+
+def text_digest(text: str) -> bytes:
+    """Stable hash the deterministic answers are derived from"""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class FakeLLMStats:
+    """Call and token counters shared by every fake chain, so drivers can report them.
+
+    The fake caches nothing; prefix reuse is measured by ``prompt_cache.prefix_cache``.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, prompt: str, completion: str) -> None:
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += estimate_tokens(prompt)
+            self.completion_tokens += estimate_tokens(completion)
+
+
+fake_llm_stats = FakeLLMStats()
+llm_latency = 0.0
+
+
+def _fake_structured_answer(output_schema, prompt_text: str):
+    from src.ai_componenet.graph.utils.jdinfo import JDInfo
+    from src.ai_componenet.graph.utils.models import ScoringOutput, SCORE_DIMENSIONS
+
+    digest = text_digest(prompt_text)
+    if output_schema is JDInfo:
+        return JDInfo(
+            job_title="Machine Learning Engineer",
+            company_name="TechCorp",
+            job_location="San Francisco, CA",
+            work_arrangement="remote",
+            employment_type="full-time",
+            experience_required=f"{digest[0] % 8 + 1}+ years",
+            technical_skills=["Python", "TensorFlow", "AWS"],
+            seniority_level="senior"
+        )
+    if output_schema is ScoringOutput:
+        scores = [round(4 + (b % 61) / 10, 1) for b in digest[:len(SCORE_DIMENSIONS)]]
+        return ScoringOutput(**dict(zip(SCORE_DIMENSIONS.values(), scores)))
+    return output_schema.model_construct()
+
+
+def make_fake_model(output_schema=None):
+    """Stand-in for a chat model: streamed outreach text, or deterministic ``output_schema`` answers"""
+    from langchain_core.messages import AIMessageChunk
+    from langchain_core.runnables import RunnableGenerator, RunnableLambda
+
+    def respond(prompt_value):
+        prompt_text = prompt_value.to_string() if hasattr(prompt_value, "to_string") else str(prompt_value)
+        if llm_latency:
+            time.sleep(llm_latency)
+        answer = _fake_structured_answer(output_schema, prompt_text)
+        fake_llm_stats.record(prompt_text, answer.model_dump_json())
+        return answer
+
+    def stream_text(prompt_values):
+        # First chunk after 20% of the latency, the rest spread over the remainder
+        for prompt_value in prompt_values:
+            prompt_text = prompt_value.to_string() if hasattr(prompt_value, "to_string") else str(prompt_value)
+            text = (
+                "Hi there, your background in building production ML systems stood out to us. "
+                "We are hiring for a role that matches your experience closely and would love to chat. "
+                f"Reference {text_digest(prompt_text).hex()[:8]}."
+            )
+            words = text.split(" ")
+            for i, word in enumerate(words):
+                if llm_latency:
+                    time.sleep(llm_latency * (0.2 if i == 0 else 0.8 / (len(words) - 1)))
+                yield AIMessageChunk(content=word if i == 0 else " " + word)
+            fake_llm_stats.record(prompt_text, text)
+            yield AIMessageChunk(content="", usage_metadata={
+                "input_tokens": estimate_tokens(prompt_text),
+                "output_tokens": estimate_tokens(text),
+                "total_tokens": estimate_tokens(prompt_text) + estimate_tokens(text)
+            })
+
+    if output_schema is None:
+        return RunnableGenerator(stream_text)
+    return RunnableLambda(respond)
@@ -1,12 +1,291 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain.prompts import PromptTemplate
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import os
+import sys
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Callable, Optional
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+from src.ai_componenet.metrics import LLM_CALL_DURATION, LLM_TIME_TO_FIRST_TOKEN
+from src.ai_componenet.tracing import span
+from src.ai_componenet.rate_limiter import acquire
+from src.ai_componenet.resilience import call_with_retry, stream_with_breaker
+from src.ai_componenet.deadline import DeadlineExceeded, clamp_timeout, time_left
+from src.ai_componenet.llm_providers import LLM_FAILOVERS, LLM_HEDGES, configured_providers, router
+from src.ai_componenet.logger import logging
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Backups racing a running call run here; other attempts get a thread of their own (``_start``)
+_hedge_executor = ThreadPoolExecutor(max_workers=int(os.getenv("LLM_HEDGE_WORKERS", "8")), thread_name_prefix="llm-hedge")
+
+# Seconds an LLM request may take; each attempt gets at most the time left in the request budget
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+
+# Model used by each graph step, overridable per deployment with MODEL_<STEP>;
+# "rescoring" is the stronger model that rescores the shortlist in two-tier scoring
+DEFAULT_MODELS = {
+    "jd_extraction": "gemini-1.5-flash",
+    "scoring": "gemini-1.5-flash",
+    "rescoring": "gemini-1.5-pro",
+    "outreach": "gemini-1.5-flash",
+}
+
+
+def model_for(step: str) -> str:
+    return os.getenv(f"MODEL_{step.upper()}", DEFAULT_MODELS.get(step, "gemini-1.5-flash"))
+
+
+def _start(function, *args, **kwargs) -> Future:
+    """Run ``function`` in a copy of this context on a new thread, starting now.
+
+    Attempts of hedged calls that race nothing run here rather than on the shared pool,
+    so they are never capped or queued and the hedge delay measures the call alone.
+    """
+    future = Future()
+    context = copy_context()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(context.run(function, *args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="llm-call", daemon=True).start()
+    return future
+
+
+class SpanUsageHandler(BaseCallbackHandler):
+    """Copies token usage (including cached prompt tokens) and retries reported by the model onto a tracing span"""
+
+    def __init__(self, span):
+        self.span = span
+
+    def on_llm_end(self, response, **kwargs):
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.span.add(
+                        prompt_tokens=usage.get("input_tokens", 0),
+                        completion_tokens=usage.get("output_tokens", 0),
+                        # Prompt tokens the provider served from its prefix cache, where it reports them
+                        cached_prompt_tokens=(usage.get("input_token_details") or {}).get("cache_read", 0)
+                    )
+
+    def on_retry(self, retry_state, **kwargs):
+        self.span.add(retries=1)
+
+
+class TimedChain:
+    """Thin wrapper around a runnable chain that records latency, tokens and a span for every invoke.
+
+    Each attempt takes a rate limiter permit; transient provider errors are retried with
+    backoff behind the provider's circuit breaker. Given ``build``, a function of the
+    request timeout, each attempt runs a chain built with ``LLM_TIMEOUT`` clamped to the
+    time left, so a hung provider cannot outlast the request budget.
+    """
+
+    def __init__(self, chain, model_name: str, output: str, provider: str = "gemini",
+                 build: Optional[Callable[[float], Any]] = None):
+        self.chain = chain
+        self.model_name = model_name
+        self.output = output
+        self.provider = provider
+        self.build = build
+
+    def _chain(self):
+        return self.chain if self.build is None else self.build(clamp_timeout(LLM_TIMEOUT))
+
+    def invoke(self, input, config=None, **kwargs):
+        with span("llm_call", model=self.model_name, output=self.output, provider=self.provider) as llm_span:
+            if llm_span is not None:
+                config = dict(config or {})
+                config["callbacks"] = list(config.get("callbacks") or []) + [SpanUsageHandler(llm_span)]
+            start = time.perf_counter()
+            try:
+                response = call_with_retry(self.provider, self._attempt, input, config, **kwargs)
+            except DeadlineExceeded:
+                raise
+            except Exception:
+                router.observe(self.provider, time.perf_counter() - start, ok=False)
+                raise
+            router.observe(self.provider, time.perf_counter() - start, ok=True)
+            return response
+
+    def _attempt(self, input, config, **kwargs):
+        # Permit wait is tracked by the limiter, so it stays out of the call latency
+        acquire(self.provider)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = self._chain().invoke(input, config, **kwargs)
+            outcome = "success"
+            return response
+        finally:
+            LLM_CALL_DURATION.observe(
+                time.perf_counter() - start, model=self.model_name, output=self.output, outcome=outcome
+            )
+
+    def stream(self, input, config=None, **kwargs):
+        """Yield chunks as the model produces them, recording time to first chunk and total latency"""
+        return stream_with_breaker(self.provider, self._stream, input, config, **kwargs)
+
+    def _stream(self, input, config, **kwargs):
+        acquire(self.provider)
+        start = time.perf_counter()
+        first_chunk = True
+        outcome = "error"
+        try:
+            for chunk in self._chain().stream(input, config, **kwargs):
+                if first_chunk:
+                    LLM_TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start, model=self.model_name, output=self.output)
+                    first_chunk = False
+                yield chunk
+            outcome = "success"
+        except GeneratorExit:
+            outcome = "cancelled"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            LLM_CALL_DURATION.observe(elapsed, model=self.model_name, output=self.output, outcome=outcome)
+            if outcome != "cancelled":
+                router.observe(self.provider, elapsed, ok=outcome == "success")
+
+    def __getattr__(self, name):
+        return getattr(self.chain if self.build is None else self._chain(), name)
+
+
+class RoutedChain:
+    """The same chain on several providers, run on the healthiest one first.
+
+    A failed call fails over to the next provider. When hedging is enabled a call that
+    is still running after ``router.hedge_after`` is raced against the next provider and
+    the first answer wins; the slower call is left to finish in the background.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.model_name = routes[0].model_name
+        self.output = routes[0].output
+
+    def invoke(self, input, config=None, **kwargs):
+        routes = router.order(self.routes)
+        hedge_after = router.hedge_after(routes[0].provider)
+        if hedge_after is None:
+            return self._failover(routes, input, config, **kwargs)
+        return self._hedged(routes, hedge_after, input, config, **kwargs)
+
+    def _failover(self, routes, input, config, **kwargs):
+        error = None
+        for route in routes:
+            try:
+                return route.invoke(input, config, **kwargs)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                error = self._failed(route, e)
+        raise error
+
+    def _hedged(self, routes, hedge_after, input, config, **kwargs):
+        pending = {}
+        remaining = list(routes)
+        can_hedge = True
+        error = None
+
+        def launch():
+            route = remaining.pop(0)
+            # Each call runs in a copy of this context, keeping the trace and the deadline
+            # Only a backup racing a running call uses the pool
+            if not pending:
+                future = _start(route.invoke, input, config, **kwargs)
+            else:
+                future = _hedge_executor.submit(copy_context().run, route.invoke, input, config, **kwargs)
+            pending[future] = route
+
+        launch()
+        while pending:
+            timeout = hedge_after if can_hedge and remaining else None
+            left = time_left()
+            if left is not None:
+                timeout = max(0.0, left) if timeout is None else min(timeout, max(0.0, left))
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if left is not None and time_left() <= 0:
+                    raise DeadlineExceeded("Time budget exhausted while waiting for the LLM")
+                can_hedge = False
+                logger.info(f"{routes[0].provider} slower than {hedge_after:.2f}s, hedging on {remaining[0].provider}")
+                launch()
+                continue
+            for future in done:
+                route = pending.pop(future)
+                try:
+                    result = future.result()
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    error = self._failed(route, e)
+                    if remaining and not pending:
+                        can_hedge = False
+                        launch()
+                    continue
+                if not can_hedge:
+                    LLM_HEDGES.inc(provider=routes[0].provider, winner=route.provider)
+                return result
+        raise error
+
+    def _failed(self, route, error):
+        LLM_FAILOVERS.inc(provider=route.provider)
+        logger.warning(f"{route.provider} call for {self.output} failed ({error}), trying the next provider")
+        return error
+
+    def stream(self, input, config=None, **kwargs):
+        """Stream from the first provider that produces a chunk; failing over is only possible before that"""
+        error = None
+        for route in router.order(self.routes):
+            started = False
+            try:
+                for chunk in route.stream(input, config, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                if started:
+                    raise
+                error = self._failed(route, e)
+        raise error
+
+    def __getattr__(self, name):
+        return getattr(self.routes[0], name)
+
+
+def _routed(build, model_name: str, output: str):
+    """One ``TimedChain`` per configured provider, behind a ``RoutedChain`` when there are several.
+
+    ``build(provider, model, timeout)`` makes the chain for one attempt.
+    """
+    routes = []
+    for provider in configured_providers():
+        provider_model = provider.resolve_model(model_name)
+        routes.append(TimedChain(
+            None, provider_model, output, provider=provider.name,
+            build=lambda timeout, provider=provider, model=provider_model: build(provider, model, timeout)
+        ))
+    return routes[0] if len(routes) == 1 else RoutedChain(routes)
+
+
 ### Simple LLM model that takes prompt and returns the response
 def get_llm(prompt: PromptTemplate, model_name: str = "gemini-1.5-flash"):
     """
@@ -14,21 +293,13 @@ def get_llm(prompt: PromptTemplate, model_name: str = "gemini-1.5-flash"):
     
     Args:
         prompt: PromptTemplate object
-        model_name: Name of the Google Generative AI model to use
+        model_name: Name of the model to use; providers that do not serve it use their own model
     
     Returns:
         A chain that can be invoked with input variables
     """
-    # Initialize the Google Generative AI model
-    llm = ChatGoogleGenerativeAI(
-        model=model_name,
-        google_api_key=os.getenv("GOOGLE_API_KEY")
-    )
-    
-    # Create the chain by combining prompt and model
-    chain = prompt | llm
-    
-    return chain
+    # Create the chain by combining prompt and each provider's model
+    return _routed(lambda provider, model, timeout: prompt | provider.chat_model(model, timeout), model_name, output="text")
 
 
 ### LLM model with structured output using pydantic BaseModel
@@ -39,24 +310,15 @@ def get_structured_llm(prompt: PromptTemplate, output_schema: BaseModel, model_n
     Args:
         prompt: PromptTemplate object
         output_schema: Pydantic BaseModel class defining the output structure
-        model_name: Name of the Google Generative AI model to use
+        model_name: Name of the model to use; providers that do not serve it use their own model
     
     Returns:
         A chain that returns structured output according to the schema
     """
-    # Initialize the Google Generative AI model
-    llm = ChatGoogleGenerativeAI(
-        model=model_name,
-        google_api_key=os.getenv("GOOGLE_API_KEY")
+    return _routed(
+        lambda provider, model, timeout: prompt | provider.structured_model(model, output_schema, timeout),
+        model_name, output=output_schema.__name__
     )
-    
-    # Create structured LLM with output parser
-    structured_llm = llm.with_structured_output(output_schema)
-    
-    # Create the chain
-    chain = prompt | structured_llm
-    
-    return chain
 
 
 # Example usage and demonstrations
@@ -0,0 +1,227 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Sequence
+from dotenv import load_dotenv
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+load_dotenv()
+
+# Local SQLite file holding graph checkpoints, shared by all worker processes
+CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "./checkpoints.db")
+# Runs untouched for longer than this are deleted when the graph is built
+CHECKPOINT_RETENTION = float(os.getenv("CHECKPOINT_RETENTION", str(7 * 24 * 3600)))
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """LangGraph checkpointer storing every step of a run (thread) in a SQLite file.
+
+    Each checkpoint is stored whole, with its channel values, so resuming a run needs
+    a single row. ``prune`` keeps only the latest checkpoint of a finished run.
+    """
+
+    def __init__(self, path: str = CHECKPOINT_DB):
+        super().__init__()
+        self.path = path
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        if not self._initialized:
+            with self._init_lock:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS checkpoints ("
+                    "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, "
+                    "parent_checkpoint_id TEXT, type TEXT, checkpoint BLOB, metadata_type TEXT, metadata BLOB, "
+                    "created REAL NOT NULL, "
+                    "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS writes ("
+                    "thread_id TEXT NOT NULL, checkpoint_ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, "
+                    "task_id TEXT NOT NULL, idx INTEGER NOT NULL, channel TEXT NOT NULL, type TEXT, value BLOB, "
+                    "task_path TEXT NOT NULL DEFAULT '', "
+                    "PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))"
+                )
+                self._initialized = True
+        return connection
+
+    def _tuple(self, row: Sequence[Any]) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, checkpoint, metadata_type, metadata = row
+        writes = self._connection().execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id)
+        ).fetchall()
+        return CheckpointTuple(
+            config={"configurable": {
+                "thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id
+            }},
+            checkpoint=self.serde.loads_typed((type_, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {"configurable": {
+                    "thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": parent_id
+                }}
+                if parent_id else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ]
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        configurable = config["configurable"]
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata "
+            "FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params = [configurable["thread_id"], configurable.get("checkpoint_ns", "")]
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        row = self._connection().execute(query + " ORDER BY checkpoint_id DESC LIMIT 1", params).fetchone()
+        return self._tuple(row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata "
+            "FROM checkpoints WHERE 1 = 1"
+        )
+        params = []
+        if config:
+            query += " AND thread_id = ?"
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id < ?"
+            params.append(before_id)
+        rows = self._connection().execute(query + " ORDER BY checkpoint_id DESC", params).fetchall()
+        for row in rows:
+            checkpoint_tuple = self._tuple(row)
+            if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+            yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        type_, serialized = self.serde.dumps_typed(checkpoint)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        self._connection().execute(
+            "INSERT OR REPLACE INTO checkpoints "
+            "(thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata, created) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (thread_id, checkpoint_ns, checkpoint["id"], configurable.get("checkpoint_id"),
+             type_, serialized, metadata_type, serialized_metadata, time.time())
+        )
+        return {"configurable": {
+            "thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]
+        }}
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized = self.serde.dumps_typed(value)
+            rows.append((
+                configurable["thread_id"], configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"],
+                task_id, WRITES_IDX_MAP.get(channel, idx), channel, type_, serialized, task_path
+            ))
+        # Special writes (errors, interrupts) replace earlier ones; regular writes are kept once
+        verb = "INSERT OR REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "INSERT OR IGNORE"
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                f"{verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def delete_thread(self, thread_id: str) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+        connection.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+    def prune(self, thread_id: str) -> None:
+        """Drop all but the latest checkpoint of a finished run, and its pending writes"""
+        connection = self._connection()
+        latest = connection.execute(
+            "SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ''", (thread_id,)
+        ).fetchone()[0]
+        if latest is None:
+            return
+        connection.execute(
+            "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_id != ?", (thread_id, latest)
+        )
+        connection.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+    def delete_older_than(self, seconds: float) -> int:
+        """Delete runs whose latest checkpoint is older than ``seconds``; returns how many"""
+        connection = self._connection()
+        cutoff = time.time() - seconds
+        stale = [row[0] for row in connection.execute(
+            "SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(created) < ?", (cutoff,)
+        ).fetchall()]
+        for thread_id in stale:
+            self.delete_thread(thread_id)
+        return len(stale)
@@ -3,38 +3,58 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import os
+import time
 import logging
 from langgraph.graph import StateGraph, START, END
 from src.ai_componenet.graph.state import AgentState
-from src.ai_componenet.get_llm import get_structured_llm, get_llm
+from src.ai_componenet.get_llm import get_structured_llm, get_llm, model_for
+from src.ai_componenet.metrics import SCORING_DURATION
 from src.ai_componenet.graph.utils.jdinfo import JDInfo
 from src.ai_componenet.graph.utils.models import ScoringOutput, OutreachOutput
-from src.ai_componenet.core.prompts import jd_template, scoring_template, outreach_template
+from src.ai_componenet.core.prompts import jd_template, scoring_template, scoring_prefix_template, outreach_template
 from src.ai_componenet.graph.utils.tools import tavily_tool, data_of_linkedin_url
 from src.ai_componenet.exception import CustomException
+from src.ai_componenet.tracing import traced, set_span_attributes, set_trace_attributes
+from src.ai_componenet.single_flight import coalesced, normalized_text_key
+from src.ai_componenet.deadline import stage_budget, time_left, mark_partial, DeadlineExceeded
+from src.ai_componenet.prompt_cache import prefix_cache
 from langchain_core.prompts import PromptTemplate
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 
-from src.ai_componenet.database.database import get_db_session, create_tables
+from src.ai_componenet.database.database import get_db_session
 from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
 
 logger = logging.getLogger(__name__)
 
-# Ensure tables are created
-create_tables()
+# Adaptive search: profiles fetched and scored per round, and the score that ends the search
+ADAPTIVE_BATCH_SIZE = int(os.getenv("ADAPTIVE_BATCH_SIZE", "2"))
+ADAPTIVE_SCORE_THRESHOLD = float(os.getenv("ADAPTIVE_SCORE_THRESHOLD", "7.5"))
 
+# Two-tier scoring: the top N first-pass scores are rescored with the "rescoring" model (0 disables)
+RESCORE_TOP_N = int(os.getenv("RESCORE_TOP_N", "0"))
+SCORING_TIER_MODELS = {"fast": "scoring", "strong": "rescoring"}
 
+
+@coalesced("jd_extraction", key=normalized_text_key)
+def extract_jd_info(job_desc: str) -> JDInfo:
+    """Extract structured JD info; identical JDs submitted concurrently share one LLM call"""
+    prompt = PromptTemplate(
+        template=jd_template,
+        input_variables=["job_description"]
+    )
+    
+    llm = get_structured_llm(prompt, JDInfo, model_name=model_for("jd_extraction"))
+    return llm.invoke({"job_description": job_desc})
+
+
+@traced("JobDescriptionNode")
 def JobDescriptionNode(state: AgentState) -> Dict[str, Any]:
     """Get the job description and store the important information data from that"""
     try:
         logger.info("Enter JobDescriptionNode ------------> ")
-        prompt = PromptTemplate(
-            template=jd_template,
-            input_variables=["job_description"]
-        )
-        
-        llm = get_structured_llm(prompt, JDInfo, model_name="gemini-1.5-flash")
-        response = llm.invoke({"job_description": state["job_desc"]})
+        with stage_budget(state):
+            response = extract_jd_info(state["job_desc"])
         
         # Store in database
         with get_db_session() as db:
@@ -45,6 +65,7 @@ def JobDescriptionNode(state: AgentState) -> Dict[str, Any]:
             )
             job_id = db_job.id
             logger.info(f"Job description stored in database with ID: {job_id}")
+        set_trace_attributes(job_id=job_id)
         
         return {
             "jd_info": response,
@@ -55,6 +76,7 @@ def JobDescriptionNode(state: AgentState) -> Dict[str, Any]:
         raise CustomException(e, sys) from e 
 
 
+@traced("LinkedInProfileNode")
 def LinkedInProfileNode(state: AgentState) -> Dict[str, Any]:
     """Get the linkedin profile of the user on the basis of the JD"""
     try:
@@ -64,7 +86,10 @@ def LinkedInProfileNode(state: AgentState) -> Dict[str, Any]:
         if state.get("jd_info") and state["jd_info"].job_title:
             job_title = state["jd_info"].job_title
         
-        urls, count = tavily_tool(job_title)
+        max_profiles = state.get("max_profiles") or 5
+        with stage_budget(state):
+            urls, count = tavily_tool(job_title, max_result=max_profiles)
+        urls = urls[:max_profiles]
         
         return {
             "linkedin_profile": urls,
@@ -75,48 +100,97 @@ def LinkedInProfileNode(state: AgentState) -> Dict[str, Any]:
         raise CustomException(e, sys) from e 
         
 
+@traced("FetchURLNode")
 def FetchURLNode(state: AgentState) -> Dict[str, Any]:
-    """Get the user data using LinkedIn URLs"""
+    """Get the user data using LinkedIn URLs.
+
+    Fetches the next batch of URLs after ``fetch_offset`` (all of them unless adaptive
+    search is on) and appends to the profiles fetched in earlier rounds.
+    """
     try:
         logger.info("Enter FetchURLNode ------> ")
-        urls = state.get("linkedin_profile", [])
-        data = []
+        all_urls = [url for url in (state.get("linkedin_profile") or []) if url]
+        offset = state.get("fetch_offset") or 0
+        batch_size = ADAPTIVE_BATCH_SIZE if state.get("adaptive_search") else len(all_urls)
+        urls = all_urls[offset:offset + batch_size]
+        data = list(state.get("profile_data") or [])
+        fetched_urls = list(state.get("profile_urls") or [])
+        update = {}
+        set_span_attributes(batch=len(urls), offset=offset)
         
-        if urls:  # Check if urls exist and is not None
-            for url in urls:
-                if url:  # Check if individual URL is not None/empty
-                    result = data_of_linkedin_url(url)
-                    if result:  # Only append non-empty results
-                        data.append(result)
+        with stage_budget(state, "fetch"):
+            for i, url in enumerate(urls):
+                left = time_left()
+                if left is not None and left <= 0:
+                    skipped = len(all_urls) - offset - i
+                    logger.warning(f"Time budget low, skipping {skipped} profile fetches")
+                    update = mark_partial(state, f"fetch: {skipped} of {len(all_urls)} profiles skipped (time budget)")
+                    break
+                # Fetches are bounded by the stage deadline, so a slow one is dropped, not waited on
+                result = data_of_linkedin_url(url)
+                if result:  # Only append non-empty results
+                    data.append(result)
+                    fetched_urls.append(url)
         
         return {
-            "profile_data": data
+            "profile_data": data,
+            "profile_urls": fetched_urls,
+            "fetch_offset": offset + len(urls),
+            **update
         }
     except Exception as e:
         logger.error(f"Error Occurred at FetchURLNode : {str(e)}")
         raise CustomException(e, sys) from e 
 
 
+def score_profile(profile_data: str, job_desc: str, tier: str, stats: Dict[str, Dict[str, float]]) -> ScoringOutput:
+    """Score one profile with the model of the given tier, counting calls and latency per tier"""
+    prompt = PromptTemplate(
+        template=scoring_template,
+        input_variables=["profile_data", "job_desc"]
+    )
+    model_name = model_for(SCORING_TIER_MODELS[tier])
+    llm = get_structured_llm(prompt, ScoringOutput, model_name=model_name)
+    # Rubric + JD is the same for every candidate of the job; count what a prefix cache can reuse
+    prefix_cache.record(model_name, scoring_prefix_template.format(job_desc=job_desc))
+    tier_stats = stats.setdefault(tier, {"calls": 0, "errors": 0, "seconds": 0.0})
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        response = llm.invoke({
+            "profile_data": profile_data, 
+            "job_desc": job_desc
+        })
+        outcome = "success"
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        SCORING_DURATION.observe(elapsed, tier=tier, outcome=outcome)
+        tier_stats["calls"] += 1
+        tier_stats["errors"] += outcome == "error"
+        tier_stats["seconds"] = round(tier_stats["seconds"] + elapsed, 3)
+
+
+@traced("ScoringNode")
 def ScoringNode(state: AgentState) -> Dict[str, Any]:
     """Score each profile based on their background and JD"""
     try:
         logger.info("Enter ScoringNode --------> ")
-        prompt = PromptTemplate(
-            template=scoring_template,
-            input_variables=["profile_data", "job_desc"]
-        )
         
-        fit_scores = []
-        score_breakdowns = []
-        candidate_ids = []  # Store database IDs
+        # Profiles scored in earlier adaptive rounds are kept; only new ones are scored
+        fit_scores = list(state.get("fit_score") or [])
+        score_breakdowns = list(state.get("score_breakdown") or [])
+        score_tiers = list(state.get("score_tiers") or [])
+        scoring_stats = {tier: dict(values) for tier, values in (state.get("scoring_stats") or {}).items()}
+        candidate_ids = list(state.get("candidate_ids") or [])  # Store database IDs
         
         # Check if profile_data exists
         if not state.get("profile_data"):
             logger.warning("No profile data found in state")
             return {
-                "fit_score": [],
-                "score_breakdown": [],
-                "candidate_ids": []
+                "fit_score": fit_scores,
+                "score_breakdown": score_breakdowns,
+                "candidate_ids": candidate_ids
             }
         
         job_id = state.get("job_id")
@@ -124,72 +198,220 @@ def ScoringNode(state: AgentState) -> Dict[str, Any]:
             logger.error("No job_id found in state")
             raise CustomException("Job ID not found in state", sys)
     
-        for i, data in enumerate(state["profile_data"]):
-            try:
-                llm = get_structured_llm(prompt, ScoringOutput, model_name="gemini-1.5-flash")
-                response = llm.invoke({
-                    "profile_data": data, 
-                    "job_desc": state["job_desc"]
-                })
-                
-                fit_scores.append(response.final_score)
-                score_breakdowns.append(response.score_breakdown)
-                
-                # Store candidate data in database
-                with get_db_session() as db:
-                    linkedin_url = state["linkedin_profile"][i] if i < len(state["linkedin_profile"]) else None
+        start = len(fit_scores)
+        set_span_attributes(profiles=len(state["profile_data"]) - start)
+        profile_urls = state.get("profile_urls") or state.get("linkedin_profile") or []
+        update = {}
+        with stage_budget(state, "scoring"):
+            for i, data in enumerate(state["profile_data"][start:], start=start):
+                linkedin_url = profile_urls[i] if i < len(profile_urls) else None
+                left = time_left()
+                if left is not None and left <= 0:
+                    skipped = len(state["profile_data"]) - i
+                    logger.warning(f"Time budget low, skipping scoring of {skipped} profiles")
+                    update = mark_partial(state, f"scoring: {skipped} of {len(state['profile_data'])} profiles skipped (time budget)")
+                    break
+                try:
+                    response = score_profile(data, state["job_desc"], "fast", scoring_stats)
                     
-                    db_candidate = LinkedInCandidateCRUD.create_candidate(
-                        db=db,
-                        job_description_id=job_id,
-                        profile_data=data,
-                        linkedin_url=linkedin_url,
-                        final_score=response.final_score,
-                        score_breakdown=response.score_breakdown
-                    )
-                    candidate_ids.append(db_candidate.id)
-                    logger.info(f"Candidate {i+1} stored in database with ID: {db_candidate.id}")
-            
-            except Exception as e:
-                logger.error(f"Error scoring profile {i}: {str(e)}")
-                # Provide default scores if scoring fails
-                default_breakdown = {
-                    "Education": 6.0,
-                    "Career_Trajectory": 6.0, 
-                    "Company_Relevance": 6.0,
-                    "Experience_Match": 6.0,
-                    "Location_Match": 6.0,
-                    "Tenure": 6.0
-                }
-                fit_scores.append(6.0)
-                score_breakdowns.append(default_breakdown)
+                    fit_scores.append(response.final_score)
+                    score_breakdowns.append(response.score_breakdown)
+                    score_tiers.append("fast")
+                    
+                    # Store candidate data in database; candidates kept by a re-analysis are updated
+                    with get_db_session() as db:
+                        if i < len(candidate_ids):
+                            LinkedInCandidateCRUD.update_candidate_scores(
+                                db=db,
+                                candidate_id=candidate_ids[i],
+                                final_score=response.final_score,
+                                score_breakdown=response.score_breakdown
+                            )
+                        else:
+                            db_candidate = LinkedInCandidateCRUD.create_candidate(
+                                db=db,
+                                job_description_id=job_id,
+                                profile_data=data,
+                                linkedin_url=linkedin_url,
+                                final_score=response.final_score,
+                                score_breakdown=response.score_breakdown
+                            )
+                            candidate_ids.append(db_candidate.id)
+                            logger.info(f"Candidate {i+1} stored in database with ID: {db_candidate.id}")
                 
-                # Store failed candidate with default scores
-                with get_db_session() as db:
-                    linkedin_url = state["linkedin_profile"][i] if i < len(state["linkedin_profile"]) else None
+                except DeadlineExceeded:
+                    skipped = len(state["profile_data"]) - i
+                    update = mark_partial(state, f"scoring: {skipped} of {len(state['profile_data'])} profiles skipped (time budget)")
+                    break
+                except Exception as e:
+                    logger.error(f"Error scoring profile {i}: {str(e)}")
+                    # Keep the candidate but leave it unscored (NULL scores) instead of inventing defaults
+                    fit_scores.append(None)
+                    score_breakdowns.append(None)
+                    score_tiers.append(None)
                     
-                    db_candidate = LinkedInCandidateCRUD.create_candidate(
-                        db=db,
-                        job_description_id=job_id,
-                        profile_data=data,
-                        linkedin_url=linkedin_url,
-                        final_score=6.0,
-                        score_breakdown=default_breakdown
-                    )
-                    candidate_ids.append(db_candidate.id)
+                    with get_db_session() as db:
+                        if i < len(candidate_ids):
+                            LinkedInCandidateCRUD.update_candidate_scores(
+                                db=db, candidate_id=candidate_ids[i], final_score=None, score_breakdown={}
+                            )
+                        else:
+                            db_candidate = LinkedInCandidateCRUD.create_candidate(
+                                db=db,
+                                job_description_id=job_id,
+                                profile_data=data,
+                                linkedin_url=linkedin_url
+                            )
+                            candidate_ids.append(db_candidate.id)
+
+        unscored = fit_scores.count(None)
+        if unscored:
+            logger.warning(f"{unscored} of {len(fit_scores)} profiles could not be scored")
+        set_span_attributes(unscored=unscored)
 
         return {
             "fit_score": fit_scores,
             "score_breakdown": score_breakdowns,
-            "candidate_ids": candidate_ids
+            "candidate_ids": candidate_ids,
+            "score_tiers": score_tiers,
+            "scoring_stats": scoring_stats,
+            **update
         }
     except Exception as e:
         logger.error(f"Error Occurred at ScoringNode : {str(e)}")
         raise CustomException(e, sys) from e 
 
+@traced("ReanalysisNode")
+def ReanalysisNode(state: AgentState) -> Dict[str, Any]:
+    """Apply an edited JD to the stored job, after the new search of a re-analysis succeeded.
+
+    Stores the new text and extraction, drops the outreach messages written for the old
+    one and, when the job was searched again, the candidates found for the old title.
+    """
+    try:
+        logger.info("Enter ReanalysisNode ----------> ")
+        reanalysis = state["reanalysis"]
+        job_id = state["job_id"]
+        with get_db_session() as db:
+            if reanalysis.get("update_job"):
+                JobDescriptionCRUD.update_job_description(db, job_id, state["jd_info"], state["job_desc"])
+                # Stored outreach messages were written for the old JD
+                LinkedInCandidateCRUD.clear_outreach_messages(db, job_id)
+            if reanalysis.get("drop_candidates"):
+                deleted = LinkedInCandidateCRUD.delete_candidates_by_job(db, job_id)
+                logger.info(f"Job {job_id} was searched again, {deleted} stored candidates dropped")
+        return {"reanalysis": {**reanalysis, "applied": True}}
+    except Exception as e:
+        logger.error(f"Error Occurred at ReanalysisNode : {str(e)}")
+        raise CustomException(e, sys) from e
+
+
+def reanalysis_pending(state: AgentState) -> bool:
+    reanalysis = state.get("reanalysis")
+    return bool(reanalysis) and not reanalysis.get("applied")
+
+
+def entry_stage(state: AgentState) -> str:
+    """First stage to run: stages whose output is already in the state (re-analysis) are skipped"""
+    if state.get("jd_info") is None or state.get("job_id") is None:
+        return "job_description"
+    if state.get("linkedin_profile") is None:
+        return "linkedin_profile"
+    if reanalysis_pending(state):
+        return "apply_reanalysis"
+    if state.get("profile_data") is None:
+        return "fetch_url"
+    return "scoring_user"
+
+
+def after_search(state: AgentState) -> str:
+    """A re-analysis updates the stored job only once its new search succeeded"""
+    return "apply_reanalysis" if reanalysis_pending(state) else "fetch_url"
+
+
+def should_fetch_more(state: AgentState) -> str:
+    """Adaptive search: fetch another batch while no candidate reached the score threshold"""
+    if not state.get("adaptive_search") or state.get("partial"):
+        return "rescore"
+    threshold = state.get("score_threshold")
+    threshold = ADAPTIVE_SCORE_THRESHOLD if threshold is None else threshold
+    if any(score is not None and score >= threshold for score in state.get("fit_score") or []):
+        return "rescore"
+    if (state.get("fetch_offset") or 0) >= len(state.get("linkedin_profile") or []):
+        return "rescore"
+    left = time_left()
+    if left is not None and left <= 0:
+        return "rescore"
+    logger.info(f"No candidate scored {threshold} or more yet, fetching the next batch")
+    return "fetch_url"
+
+
+@traced("RescoreNode")
+def RescoreNode(state: AgentState) -> Dict[str, Any]:
+    """Two-tier scoring: rescore the top ``RESCORE_TOP_N`` first-pass candidates with the strong model"""
+    try:
+        if RESCORE_TOP_N <= 0 or not state.get("fit_score"):
+            return {}
+        logger.info("Enter RescoreNode --------> ")
+        
+        fit_scores = list(state["fit_score"])
+        score_breakdowns = list(state.get("score_breakdown") or [])
+        score_tiers = list(state.get("score_tiers") or [])
+        scoring_stats = {tier: dict(values) for tier, values in (state.get("scoring_stats") or {}).items()}
+        candidate_ids = state.get("candidate_ids") or []
+        
+        # Only first-pass scores from this run; scores reused by a re-analysis are left as they are
+        shortlist = [i for i in sorted(
+            (i for i, score in enumerate(fit_scores) if score is not None),
+            key=lambda i: fit_scores[i], reverse=True
+        )[:RESCORE_TOP_N] if i < len(score_tiers) and score_tiers[i] == "fast"]
+        set_span_attributes(shortlist=len(shortlist))
+        update = {}
+        with stage_budget(state, "scoring"):
+            for rank, i in enumerate(shortlist):
+                left = time_left()
+                if left is not None and left <= 0:
+                    update = mark_partial(state, f"rescoring: {len(shortlist) - rank} of {len(shortlist)} shortlisted profiles kept their first-pass score (time budget)")
+                    break
+                try:
+                    response = score_profile(state["profile_data"][i], state["job_desc"], "strong", scoring_stats)
+                except DeadlineExceeded:
+                    update = mark_partial(state, f"rescoring: {len(shortlist) - rank} of {len(shortlist)} shortlisted profiles kept their first-pass score (time budget)")
+                    break
+                except Exception as e:
+                    # The first-pass score stays; it is still a real score
+                    logger.error(f"Error rescoring profile {i}: {str(e)}")
+                    continue
+                
+                fit_scores[i] = response.final_score
+                score_breakdowns[i] = response.score_breakdown
+                score_tiers[i] = "strong"
+                if i < len(candidate_ids):
+                    with get_db_session() as db:
+                        LinkedInCandidateCRUD.update_candidate_scores(
+                            db=db,
+                            candidate_id=candidate_ids[i],
+                            final_score=response.final_score,
+                            score_breakdown=response.score_breakdown
+                        )
+        
+        return {
+            "fit_score": fit_scores,
+            "score_breakdown": score_breakdowns,
+            "score_tiers": score_tiers,
+            "scoring_stats": scoring_stats,
+            **update
+        }
+    except Exception as e:
+        logger.error(f"Error Occurred at RescoreNode : {str(e)}")
+        raise CustomException(e, sys) from e
+
+
+@traced("BestCandidateNode")
 def BestCandidateNode(state: AgentState) -> Dict[str, Any]:
     """
-    Find the best candidate with highest score and generate outreach message
+    Find the best candidate with highest score. The outreach message is only generated
+    here in "inline" mode; otherwise it is produced later by ``ensure_outreach_message``.
     """
     try:
         logger.info("Enter BestCandidateNode  ---------> ")
@@ -212,9 +434,18 @@ def BestCandidateNode(state: AgentState) -> Dict[str, Any]:
                 "outreach_message": "Error: No score breakdown available"
             }
         
-        # Find the index of the candidate with the highest score
+        # Find the index of the candidate with the highest score, skipping unscored ones
         fit_scores = state["fit_score"]
-        best_index = fit_scores.index(max(fit_scores))
+        scored = [i for i, score in enumerate(fit_scores) if score is not None]
+        if not scored:
+            logger.error("None of the candidates could be scored")
+            return {
+                "best_candidate_profile": None,
+                "best_candidate_score": None,
+                "best_candidate_breakdown": None,
+                "outreach_message": "Error: No candidate could be scored"
+            }
+        best_index = max(scored, key=lambda i: fit_scores[i])
         
         # Extract best candidate data
         best_candidate_profile = state["profile_data"][best_index]
@@ -223,18 +454,47 @@ def BestCandidateNode(state: AgentState) -> Dict[str, Any]:
         
         logger.info(f"Best candidate found at index {best_index} with score {best_candidate_score}")
         
-        # Generate outreach message
-        logger.info("Enter generate_outreach_message function ----> ")
-        outreach_message = generate_outreach_message(
-            candidate_profile=best_candidate_profile,
-            job_desc=state["job_desc"],
-            candidate_score=best_candidate_score,
-            score_breakdown=best_candidate_breakdown
-        )
-        
-        # Update the best candidate in database
+        best_candidate_id = None
         if state.get("candidate_ids") and len(state["candidate_ids"]) > best_index:
             best_candidate_id = state["candidate_ids"][best_index]
+        
+        # A re-analysis that kept the JD and scores also keeps the stored message
+        stored_message = None
+        score_tiers = state.get("score_tiers") or []
+        if best_candidate_id is not None and best_index < len(score_tiers) and score_tiers[best_index] == "reused":
+            with get_db_session() as db:
+                candidate = LinkedInCandidateCRUD.get_candidate(db, best_candidate_id)
+                stored_message = candidate.outreach_message if candidate else None
+        
+        # Generate outreach message inline only when asked to, and unless the time budget is spent
+        update = {}
+        outreach_message = None
+        with stage_budget(state):
+            left = time_left()
+            if state.get("outreach_mode", "inline") != "inline":
+                logger.info("Outreach message deferred")
+            elif stored_message:
+                logger.info("Reusing stored outreach message")
+                outreach_message = stored_message
+            elif left is not None and left <= 0:
+                logger.warning("Time budget spent, skipping outreach message")
+                update = mark_partial(state, "outreach: skipped (time budget)")
+            else:
+                logger.info("Enter generate_outreach_message function ----> ")
+                try:
+                    outreach_message = generate_outreach_message(
+                        candidate_profile=best_candidate_profile,
+                        job_desc=state["job_desc"],
+                        candidate_score=best_candidate_score,
+                        score_breakdown=best_candidate_breakdown
+                    )
+                except CustomException as e:
+                    if not isinstance(e.__cause__, DeadlineExceeded):
+                        raise
+                    update = mark_partial(state, "outreach: skipped (time budget)")
+        
+        # Update the best candidate in database
+        if best_candidate_id is not None:
             with get_db_session() as db:
                 LinkedInCandidateCRUD.update_best_candidate(
                     db=db,
@@ -247,7 +507,9 @@ def BestCandidateNode(state: AgentState) -> Dict[str, Any]:
             "best_candidate_profile": best_candidate_profile,
             "best_candidate_score": best_candidate_score,
             "best_candidate_breakdown": best_candidate_breakdown,
-            "outreach_message": outreach_message
+            "best_candidate_id": best_candidate_id,
+            "outreach_message": outreach_message,
+            **update
         }
             
     except Exception as e:
@@ -255,20 +517,21 @@ def BestCandidateNode(state: AgentState) -> Dict[str, Any]:
         raise CustomException(e, sys) from e 
 
 
+def outreach_chain():
+    """Free-text LLM chain writing the outreach message"""
+    prompt = PromptTemplate(
+        template=outreach_template,
+        input_variables=["candidate_profile", "job_desc", "candidate_score", "score_breakdown"]
+    )
+    return get_llm(prompt, model_name=model_for("outreach"))
+
+
 def generate_outreach_message(candidate_profile: str, job_desc: str, 
                             candidate_score: float, score_breakdown: Dict[str, float]) -> str:
     """Generate personalized outreach message for the best candidate"""
     
     try:
-        prompt = PromptTemplate(
-            template=outreach_template,
-            input_variables=["candidate_profile", "job_desc", "candidate_score", "score_breakdown"]
-        )
-        
-        # Format score breakdown for readability
-        breakdown_text = "\n".join([f"- {k.replace('_', ' ')}: {v}/10" for k, v in score_breakdown.items()])
-        
-        llm = get_llm(prompt, model_name="gemini-1.5-flash")
+        llm = outreach_chain()
         response = llm.invoke(
             {
                 "candidate_profile": candidate_profile,
@@ -288,4 +551,100 @@ def generate_outreach_message(candidate_profile: str, job_desc: str,
         
     except Exception as e:
         logger.error(f"Error Occurred at generate_outreach_message function : {str(e)}")
-        raise CustomException(e, sys) from e
\ No newline at end of file
+        raise CustomException(e, sys) from e
+
+
+SCORE_COLUMNS = {
+    "Education": "education_score",
+    "Career_Trajectory": "career_trajectory_score",
+    "Company_Relevance": "company_relevance_score",
+    "Experience_Match": "experience_match_score",
+    "Location_Match": "location_match_score",
+    "Tenure": "tenure_score"
+}
+
+
+def load_outreach_inputs(candidate_id: int) -> Optional[Dict[str, Any]]:
+    """Stored outreach message, best-candidate flag and prompt inputs for a candidate.
+
+    Returns None when the candidate does not exist; raises ValueError when it has neither
+    a stored message nor a score to write one from.
+    """
+    with get_db_session() as db:
+        candidate = LinkedInCandidateCRUD.get_candidate(db, candidate_id)
+        if candidate is None:
+            return None
+        if not candidate.outreach_message and candidate.final_score is None:
+            raise ValueError(f"Candidate {candidate_id} has not been scored")
+        return {
+            "outreach_message": candidate.outreach_message,
+            "is_best_candidate": candidate.is_best_candidate == "Yes",
+            "inputs": {
+                "candidate_profile": candidate.profile_data or "",
+                "job_desc": candidate.job_description.original_job_desc,
+                "candidate_score": candidate.final_score,
+                "score_breakdown": {
+                    name: getattr(candidate, column) for name, column in SCORE_COLUMNS.items()
+                    if getattr(candidate, column) is not None
+                }
+            }
+        }
+
+
+def store_outreach_message(candidate_id: int, outreach_message: str, is_best_candidate: bool) -> None:
+    with get_db_session() as db:
+        if is_best_candidate:
+            LinkedInCandidateCRUD.update_best_candidate(db=db, candidate_id=candidate_id, outreach_message=outreach_message)
+        else:
+            LinkedInCandidateCRUD.set_outreach_message(db, candidate_id, outreach_message)
+    logger.info(f"Outreach message stored for candidate {candidate_id}")
+
+
+@coalesced("outreach", key=lambda candidate_id: candidate_id)
+def ensure_outreach_message(candidate_id: int) -> Optional[str]:
+    """Return the stored outreach message for a candidate, generating and storing it on first use.
+
+    Returns None when the candidate does not exist; raises ValueError for unscored candidates.
+    """
+    loaded = load_outreach_inputs(candidate_id)
+    if loaded is None:
+        return None
+    if loaded["outreach_message"]:
+        return loaded["outreach_message"]
+
+    outreach_message = generate_outreach_message(**loaded["inputs"])
+    store_outreach_message(candidate_id, outreach_message, loaded["is_best_candidate"])
+    return outreach_message
+
+
+def stream_outreach_message(candidate_id: int) -> Iterator[str]:
+    """Yield the outreach message chunk by chunk as the LLM writes it, then store the full text.
+
+    Shares ``ensure_outreach_message``'s single flight: while another generation for the
+    candidate is in flight, waits for it and yields the stored message in one piece.
+    """
+    with ensure_outreach_message.single_flight.lead(candidate_id) as call:
+        if call is None:
+            # None when the candidate was deleted meanwhile, like the leader's check below
+            message = ensure_outreach_message(candidate_id)
+            if message:
+                yield message
+            return
+        
+        # Checked again as leader: a generation may have finished since the caller looked
+        loaded = load_outreach_inputs(candidate_id)
+        if loaded is None:
+            return
+        if loaded["outreach_message"]:
+            call.result = loaded["outreach_message"]
+            yield call.result
+            return
+        
+        chunks = []
+        for chunk in outreach_chain().stream(loaded["inputs"]):
+            text = chunk.content if hasattr(chunk, "content") else str(chunk)
+            if text:
+                chunks.append(text)
+                yield text
+        call.result = "".join(chunks)
+        store_outreach_message(candidate_id, call.result, loaded["is_best_candidate"])
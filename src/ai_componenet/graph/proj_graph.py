@@ -3,40 +3,108 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import uuid
 from functools import lru_cache
+from typing import Any, Dict, Optional
 from langgraph.graph import END, START, StateGraph
-from src.ai_componenet.graph.nodes import JobDescriptionNode, LinkedInProfileNode, FetchURLNode, ScoringNode, BestCandidateNode
+from src.ai_componenet.graph.nodes import JobDescriptionNode, LinkedInProfileNode, FetchURLNode, ScoringNode, BestCandidateNode, RescoreNode, ReanalysisNode, should_fetch_more, entry_stage, after_search
 from src.ai_componenet.graph.state import AgentState
 from src.ai_componenet.database.database import create_tables
 from src.ai_componenet.database.utils import DatabaseQueryUtils
+from src.ai_componenet.graph.checkpointer import SQLiteCheckpointSaver, CHECKPOINT_RETENTION
+from src.ai_componenet.metrics import timed_node, GRAPH_RUNS
+from src.ai_componenet.logger import logging
 
+logger = logging.getLogger(__name__)
 
-def create_graph():
-    """Create and compile the LangGraph workflow"""
+
+def create_graph(checkpointer: Optional[SQLiteCheckpointSaver] = None):
+    """Create and compile the LangGraph workflow, checkpointing every step of each run"""
     
     # Ensure database tables exist
     create_tables()
     
+    # Every completed node is checkpointed per run ID, so a failed run can be resumed
+    if checkpointer is None:
+        checkpointer = SQLiteCheckpointSaver()
+        removed = checkpointer.delete_older_than(CHECKPOINT_RETENTION)
+        if removed:
+            logger.info(f"Removed checkpoints of {removed} expired runs")
+    
     # Create the state graph
     workflow = StateGraph(AgentState)
     
-    # Add nodes
-    workflow.add_node("job_description", JobDescriptionNode)
-    workflow.add_node("linkedin_profile", LinkedInProfileNode)
-    workflow.add_node("fetch_url", FetchURLNode)
-    workflow.add_node("scoring_user", ScoringNode)
-    workflow.add_node("best_candidate", BestCandidateNode)
+    # Add nodes, each wrapped with latency and outcome metrics
+    workflow.add_node("job_description", timed_node("job_description", JobDescriptionNode))
+    workflow.add_node("linkedin_profile", timed_node("linkedin_profile", LinkedInProfileNode))
+    workflow.add_node("apply_reanalysis", timed_node("apply_reanalysis", ReanalysisNode))
+    workflow.add_node("fetch_url", timed_node("fetch_url", FetchURLNode))
+    workflow.add_node("scoring_user", timed_node("scoring_user", ScoringNode))
+    workflow.add_node("rescore", timed_node("rescore", RescoreNode))
+    workflow.add_node("best_candidate", timed_node("best_candidate", BestCandidateNode))
     
     # Add edges to define the flow
-    workflow.add_edge(START, "job_description")
+    # Runs start at the JD extraction unless a re-analysis supplies the earlier stages' output
+    workflow.add_conditional_edges(
+        START, entry_stage, ["job_description", "linkedin_profile", "apply_reanalysis", "fetch_url", "scoring_user"]
+    )
     workflow.add_edge("job_description", "linkedin_profile")
-    workflow.add_edge("linkedin_profile", "fetch_url")
+    # A re-analysis changes the stored job inside the run, after its new search (if any)
+    workflow.add_conditional_edges("linkedin_profile", after_search, ["apply_reanalysis", "fetch_url"])
+    workflow.add_conditional_edges("apply_reanalysis", entry_stage, ["fetch_url", "scoring_user"])
     workflow.add_edge("fetch_url", "scoring_user")
-    workflow.add_edge("scoring_user", "best_candidate")
+    # Adaptive search loops back for another batch until a candidate is good enough
+    workflow.add_conditional_edges(
+        "scoring_user", should_fetch_more, {"fetch_url": "fetch_url", "rescore": "rescore"}
+    )
+    # Two-tier scoring rescores the shortlist before the winner is picked (no-op when disabled)
+    workflow.add_edge("rescore", "best_candidate")
     workflow.add_edge("best_candidate", END)
     
     # Compile the graph
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)
+
+
+class RunConflict(ValueError):
+    """Raised when a run ID is reused for a different job description"""
+
+
+def run_checkpointed(graph, run_id: str, initial_state: Dict[str, Any], resume_update: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run the graph as run ``run_id``, resuming from its last completed node if it failed before.
+
+    A new run starts from ``initial_state``. A failed run continues with the state it had
+    after its last completed node, with ``resume_update`` (e.g. a fresh deadline) applied
+    first; the JD extraction, search and profile fetches it already did are not repeated.
+    A run that already finished returns its final state.
+    """
+    config = {"configurable": {"thread_id": run_id}}
+    snapshot = graph.get_state(config)
+    if not snapshot.values:
+        GRAPH_RUNS.inc(start="new")
+        result = graph.invoke(initial_state, config)
+    else:
+        if snapshot.values.get("job_desc") != initial_state.get("job_desc"):
+            raise RunConflict(f"Run {run_id} was started for a different job description")
+        if not snapshot.next:
+            GRAPH_RUNS.inc(start="complete")
+            return snapshot.values
+        logger.info(f"Resuming run {run_id} at {', '.join(snapshot.next)}")
+        GRAPH_RUNS.inc(start="resumed")
+        if resume_update:
+            graph.update_state(config, resume_update)
+        result = graph.invoke(None, config)
+    # Only the final state is needed once the run is complete
+    graph.checkpointer.prune(run_id)
+    return result
+
+
+def run_started(graph, run_id: str) -> bool:
+    """Whether run ``run_id`` has a checkpoint, i.e. a retry resumes it instead of starting over"""
+    return bool(graph.get_state({"configurable": {"thread_id": run_id}}).values)
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex
 
 
 # Example usage and testing
@@ -68,7 +136,7 @@ if __name__ == "__main__":
     }
     
     # Run the workflow
-    result = graph.invoke(initial_state)
+    result = run_checkpointed(graph, new_run_id(), initial_state)
     
     # Display results
     print("="*50)
@@ -0,0 +1,112 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from typing import Any, Dict, List, Optional
+from src.ai_componenet.logger import logging
+from src.ai_componenet.graph.utils.jdinfo import JDInfo
+from src.ai_componenet.graph.nodes import extract_jd_info, SCORE_COLUMNS
+from src.ai_componenet.single_flight import normalized_text_key
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+
+logger = logging.getLogger(__name__)
+
+# JD fields that can move a candidate's score; salary and company blurbs do not
+SCORING_FIELDS = [
+    field for field in JDInfo.model_fields
+    if field not in {"salary_range", "company_name", "company_description", "employment_type"}
+]
+
+
+def _normalize(value: Any) -> Any:
+    """Comparable form of a JD field: case, whitespace and list order are ignored"""
+    if isinstance(value, str):
+        value = " ".join(value.split()).casefold()
+        return value or None
+    if isinstance(value, (list, tuple)):
+        items = sorted({item for item in (_normalize(v) for v in value) if item is not None})
+        return items or None
+    return value
+
+
+def diff_jd_info(job_row, jd_info: JDInfo) -> List[str]:
+    """Names of the JDInfo fields that differ from the stored ``JobDescription`` columns"""
+    return [
+        field for field, value in jd_info.model_dump().items()
+        if _normalize(getattr(job_row, field)) != _normalize(value)
+    ]
+
+
+def prepare_reanalysis(job_id: int, job_desc: str) -> Optional[Dict[str, Any]]:
+    """Diff an edited JD against the stored job and seed the graph state with what can be reused.
+
+    Returns None when the job does not exist, otherwise the state to overlay on the graph
+    input. Its ``reanalysis`` entry holds the ``changed_fields``, the ``stages`` that run or
+    are reused, and the changes the graph applies to the stored job once its new search (if
+    any) succeeded. Stored candidates are kept unless the job title changed (or none were
+    stored); their scores are kept unless a scoring-relevant field changed, in which case
+    they are rescored in place. Nothing is written here.
+    """
+    with get_db_session() as db:
+        job = JobDescriptionCRUD.get_job_description(db, job_id)
+        if job is None:
+            return None
+        stored_jd = JDInfo.model_validate({field: getattr(job, field) for field in JDInfo.model_fields})
+        text_changed = normalized_text_key(job.original_job_desc) != normalized_text_key(job_desc)
+
+    # The same text (up to case and whitespace) yields the same extraction; skip the LLM call
+    jd_info = extract_jd_info(job_desc) if text_changed else stored_jd
+
+    with get_db_session() as db:
+        job = JobDescriptionCRUD.get_job_description(db, job_id)
+        changed_fields = diff_jd_info(job, jd_info)
+
+        state: Dict[str, Any] = {"jd_info": jd_info, "job_id": job_id}
+        candidates = sorted(
+            (c for c in LinkedInCandidateCRUD.get_candidates_by_job(db, job_id) if c.profile_data),
+            key=lambda c: c.id
+        )
+        drop_candidates = "job_title" in changed_fields or not candidates
+        if drop_candidates:
+            logger.info(f"Job {job_id} needs a new search ({len(candidates)} stored candidates replaced once it succeeds)")
+            stages = {"search": "ran", "fetch": "ran", "scoring": "ran"}
+        else:
+            urls = [c.linkedin_url for c in candidates]
+            state.update({
+                "linkedin_profile": urls,
+                "profile_urls": urls,
+                "profile_data": [c.profile_data for c in candidates],
+                "fetch_offset": len(candidates),
+                "profile_found": len(candidates),
+                "candidate_ids": [c.id for c in candidates]
+            })
+            stages = {"search": "reused", "fetch": "reused"}
+            if any(field in SCORING_FIELDS for field in changed_fields):
+                state.update({"fit_score": [], "score_breakdown": [], "score_tiers": []})
+                stages["scoring"] = "rescored"
+            else:
+                state.update({
+                    "fit_score": [c.final_score for c in candidates],
+                    "score_breakdown": [
+                        {name: getattr(c, column) for name, column in SCORE_COLUMNS.items() if getattr(c, column) is not None}
+                        if c.final_score is not None else None
+                        for c in candidates
+                    ],
+                    "score_tiers": ["reused" if c.final_score is not None else None for c in candidates]
+                })
+                stages["scoring"] = "reused"
+
+    stages = {"jd_extraction": "ran" if text_changed else "skipped", **stages,
+              "outreach": "regenerated" if text_changed else "kept"}
+    logger.info(f"Re-analysis of job {job_id}: changed {changed_fields or 'nothing'}, stages {stages}")
+    state["reanalysis"] = {
+        "changed_fields": changed_fields,
+        "stages": stages,
+        # Applied by ReanalysisNode, inside the checkpointed run
+        "update_job": text_changed,
+        "drop_candidates": drop_candidates,
+        "applied": False
+    }
+    return state
@@ -1,4 +1,4 @@
-from typing import Optional, List, TypedDict, Dict, Union
+from typing import Any, Optional, List, TypedDict, Dict, Union
 from src.ai_componenet.graph.utils.jdinfo import JDInfo
 
 class AgentState(TypedDict):
@@ -8,11 +8,28 @@ class AgentState(TypedDict):
     linkedin_profile: Optional[List[str]]
     profile_found: Optional[int]
     profile_data: Optional[List[str]]
-    fit_score: Optional[List[float]]
-    score_breakdown: Optional[List[Dict[str, float]]]
+    profile_urls: Optional[List[str]]  # URL of each entry in profile_data
+    # Profile budget and adaptive search depth
+    max_profiles: Optional[int]
+    adaptive_search: Optional[bool]
+    score_threshold: Optional[float]
+    fetch_offset: Optional[int]  # linkedin_profile entries already fetched
+    fit_score: Optional[List[Optional[float]]]  # None marks a profile that could not be scored
+    score_breakdown: Optional[List[Optional[Dict[str, float]]]]
     candidate_ids: Optional[List[int]] 
+    score_tiers: Optional[List[Optional[str]]]  # "fast" or "strong" per profile, None if unscored
+    scoring_stats: Optional[Dict[str, Dict[str, float]]]  # per tier: calls, errors, seconds
     # New fields for best candidate
     best_candidate_profile: Optional[str]
     best_candidate_score: Optional[float]
     best_candidate_breakdown: Optional[Dict[str, float]]
-    outreach_message: Optional[str]
\ No newline at end of file
+    best_candidate_id: Optional[int]
+    outreach_mode: Optional[str]  # "inline", "background" or "on_demand"
+    outreach_message: Optional[str]
+    # Time budget: absolute wall-clock deadline and its length in seconds
+    deadline: Optional[float]
+    time_budget: Optional[float]
+    partial: Optional[bool]
+    partial_reasons: Optional[List[str]]
+    # Re-analysis only: changed_fields, stages, and the changes to apply to the stored job
+    reanalysis: Optional[Dict[str, Any]]
@@ -1,36 +1,68 @@
-from pydantic import BaseModel, Field, field_validator
+import math
+import os
+from pydantic import BaseModel, Field
 from typing import Dict, List, Union, Optional
-import json
+
+# Score dimension -> ScoringOutput field; the dimension names are the keys of every score breakdown
+SCORE_DIMENSIONS = {
+    "Education": "education",
+    "Career_Trajectory": "career_trajectory",
+    "Company_Relevance": "company_relevance",
+    "Experience_Match": "experience_match",
+    "Location_Match": "location_match",
+    "Tenure": "tenure",
+}
+
+# Weight of each dimension in the final score, overridable with SCORE_WEIGHT_<DIMENSION>
+SCORE_WEIGHTS: Dict[str, float] = {
+    name: float(os.getenv(f"SCORE_WEIGHT_{name.upper()}", default))
+    for name, default in {
+        "Education": 0.20,
+        "Career_Trajectory": 0.20,
+        "Company_Relevance": 0.15,
+        "Experience_Match": 0.25,
+        "Location_Match": 0.10,
+        "Tenure": 0.10,
+    }.items()
+}
+# Misconfigured weights would skew or null every final score; refuse them at import
+if any(not math.isfinite(weight) or weight < 0 for weight in SCORE_WEIGHTS.values()):
+    raise ValueError(f"SCORE_WEIGHT_<DIMENSION> values must be finite and non-negative, got {SCORE_WEIGHTS}")
+if not any(SCORE_WEIGHTS.values()):
+    raise ValueError("At least one SCORE_WEIGHT_<DIMENSION> must be positive")
+
+
+def weighted_score(score_breakdown: Dict[str, Optional[float]], weights: Optional[Dict[str, float]] = None) -> Optional[float]:
+    """Final score from dimension scores; weights are renormalised over the dimensions present"""
+    weights = SCORE_WEIGHTS if weights is None else weights
+    present = {name: score for name, score in (score_breakdown or {}).items()
+               if score is not None and weights.get(name)}
+    total_weight = sum(weights[name] for name in present)
+    if not total_weight:
+        return None
+    return round(sum(score * weights[name] for name, score in present.items()) / total_weight, 2)
+
+
+def _dimension(description: str):
+    return Field(..., description=f"{description}, scored 0-10", ge=0, le=10)
+
 
 class ScoringOutput(BaseModel):
-    final_score: float = Field(
-        ..., 
-        description="Store the final fit_score of the individual as a number between 0-10",
-        ge=0,
-        le=10
-    )
-    score_breakdown: Dict[str, float] = Field(
-        ..., 
-        description="Store the breakdown scores as a dictionary with categories as keys and scores as values"
-    )
-    
-    @field_validator('score_breakdown', mode='before')
-    @classmethod
-    def parse_score_breakdown(cls, v):
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                import re
-                scores = {}
-                patterns = re.findall(r'"([^"]+)":\s*(\d+\.?\d*)', v)
-                for key, value in patterns:
-                    scores[key] = float(value)
-                return scores if scores else {}
-        elif isinstance(v, dict):
-            return v
-        else:
-            return {}
+    """The six dimension scores; the weighted final score is computed locally"""
+    education: float = _dimension("Education")
+    career_trajectory: float = _dimension("Career trajectory")
+    company_relevance: float = _dimension("Relevance of the companies worked at")
+    experience_match: float = _dimension("Match of skills and experience with the job")
+    location_match: float = _dimension("Location match")
+    tenure: float = _dimension("Average tenure per role")
+
+    @property
+    def score_breakdown(self) -> Dict[str, float]:
+        return {name: getattr(self, field) for name, field in SCORE_DIMENSIONS.items()}
+
+    @property
+    def final_score(self) -> float:
+        return weighted_score(self.score_breakdown)
 
 class OutreachOutput(BaseModel):
     outreach_message: str = Field(
@@ -13,27 +13,46 @@ from io import BytesIO
 from typing import List
 from PyPDF2 import PdfReader
 from langchain_tavily import TavilySearch
+from langchain_core.tools import ToolException
 from src.ai_componenet.logger import logging
 from src.ai_componenet.exception import CustomException
+from src.ai_componenet.metrics import timed_call
+from src.ai_componenet.tracing import traced, set_span_attributes
+from src.ai_componenet.rate_limiter import acquire, RateLimitTimeout
+from src.ai_componenet.deadline import DeadlineExceeded, clamp_timeout
+from src.ai_componenet.resilience import call_with_retry, CircuitOpenError
+from src.ai_componenet.single_flight import coalesced, normalized_text_key, canonical_profile_url
 from dotenv import load_dotenv
 load_dotenv()
 
 
 logger = logging.getLogger(__name__)
 
+# Missing keys are reported when a tool is first used, so importing this module never fails
 tavily_api_key = os.getenv("TAVILY_API_KEY")
-if not tavily_api_key:
-    raise ValueError("TAVILY_API_KEY environment variable is not set")
+rapid_api_key = os.getenv("RAPID_API_KEY")
 
-os.environ["TAVILY_API_KEY"] = tavily_api_key
 
+def require_api_key(name: str, value: str) -> str:
+    if not value:
+        raise ValueError(f"{name} environment variable is not set")
+    return value
 
-rapid_api_key = os.getenv("RAPID_API_KEY")
-if not rapid_api_key:
-    raise ValueError("RAPID_API_KEY environment variable is not set")
+# Overridable so benchmarks can point profile fetches at a local stand-in
+rapid_api_url = os.getenv(
+    "RAPID_API_URL", "https://fresh-linkedin-profile-data.p.rapidapi.com/get-profile-pdf-cv"
+)
+# (connect, read) seconds; a profile PDF can take a while to render upstream
+rapid_api_timeout = (
+    float(os.getenv("RAPID_API_CONNECT_TIMEOUT", "5")),
+    float(os.getenv("RAPID_API_READ_TIMEOUT", "30"))
+)
 
 
 
+@timed_call("tavily_tool")
+@traced("tavily_tool")
+@coalesced("tavily_tool", key=lambda job_position, max_result=5: (normalized_text_key(job_position), max_result))
 def tavily_tool(job_position: str, max_result: int = 5) -> List[str]:
     """Search top Job seekers on linkedin according to job description and get the LinkedIn URLs
 
@@ -46,6 +65,7 @@ def tavily_tool(job_position: str, max_result: int = 5) -> List[str]:
     """
     try:
         logger.info("Enter Tavily tool ----> ")
+        os.environ["TAVILY_API_KEY"] = require_api_key("TAVILY_API_KEY", tavily_api_key)
         tool = TavilySearch(max_results=max_result, topic="general")
         query = (
             f'site:linkedin.com/in '
@@ -53,7 +73,20 @@ def tavily_tool(job_position: str, max_result: int = 5) -> List[str]:
             f'"Open to work" '
             f'-jobs -company -post'
         )
-        result = tool.invoke({"query": query})
+
+        def search():
+            acquire("tavily")
+            result = tool.invoke({"query": query})
+            # The tool returns HTTP and network failures as {"error": exc} instead of raising
+            if isinstance(result, dict) and isinstance(result.get("error"), BaseException):
+                raise result["error"]
+            return result
+
+        try:
+            result = call_with_retry("tavily", search)
+        except ToolException as e:
+            logger.warning(f"Tavily returned no results: {e}")
+            result = {}
         
         urls = []
         if 'results' in result:
@@ -61,16 +94,20 @@ def tavily_tool(job_position: str, max_result: int = 5) -> List[str]:
                 if 'url' in item:
                     urls.append(item['url'])
         count = len(urls)
+        set_span_attributes(results=count)
         logger.info(f"tavily tool Executed completed successfully and total  {count} profile found <------------")
         
         return urls, count
     
-    except CustomException as e:
-        print(f"Error in tavily_tool: {e}")
-        return []  # Return empty list on error rather than crashing
+    except Exception as e:
+        logger.error(f"Error in tavily_tool: {e}")
+        raise CustomException(e, sys) from e
 
 
 
+@timed_call("data_of_linkedin_url")
+@traced("data_of_linkedin_url")
+@coalesced("data_of_linkedin_url", key=canonical_profile_url)
 def data_of_linkedin_url(linkedin_url: str) -> str:
     """Get the User data using LinkedIn URL
     
@@ -82,15 +119,24 @@ def data_of_linkedin_url(linkedin_url: str) -> str:
     """
     try:
         logger.info("Enter data_of_linkedin_url tool -----------> ")
-        url = "https://fresh-linkedin-profile-data.p.rapidapi.com/get-profile-pdf-cv"
+        set_span_attributes(linkedin_url=linkedin_url)
+        url = rapid_api_url
         querystring = {"linkedin_url": linkedin_url}
         headers = {
-            "x-rapidapi-key": rapid_api_key,
+            "x-rapidapi-key": require_api_key("RAPID_API_KEY", rapid_api_key),
             "x-rapidapi-host": "fresh-linkedin-profile-data.p.rapidapi.com"
         }
         
-        response = requests.get(url, headers=headers, params=querystring)
-        response.raise_for_status()  # Raise an exception for bad status codes
+
+        def fetch():
+            acquire("rapidapi")
+            timeout = tuple(clamp_timeout(t) for t in rapid_api_timeout)
+            response = requests.get(url, headers=headers, params=querystring, timeout=timeout)
+            response.raise_for_status()  # Raise an exception for bad status codes
+            return response
+
+        response = call_with_retry("rapidapi", fetch)
+        set_span_attributes(downloaded_bytes=len(response.content))
         
         data = response.json().get("data", {})
         
@@ -117,12 +163,16 @@ def data_of_linkedin_url(linkedin_url: str) -> str:
                 full_text.append(text)
         
         text = "\n".join(full_text)
+        set_span_attributes(pdf_bytes=len(pdf_bytes), pdf_pages=len(reader.pages), text_chars=len(text))
         logger.info("data_of_linkedin_url successfully executed successfully")
         return text
         
     except requests.RequestException as e:
         print(f"Request error for URL {linkedin_url}: {e}")
         return ""
+    except (CircuitOpenError, DeadlineExceeded, RateLimitTimeout) as e:
+        logger.warning(f"Skipping profile fetch for {linkedin_url}: {e}")
+        return ""
     except CustomException as e:
         print(f"Error processing URL {linkedin_url}: {e}")
         return ""
\ No newline at end of file
@@ -0,0 +1,218 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.resilience import get_breaker
+
+load_dotenv()
+
+LLM_PROVIDER_ERROR_RATE = registry.gauge(
+    "llm_provider_error_rate", "Share of failed calls in the router's rolling window, per provider", ["provider"]
+)
+LLM_PROVIDER_LATENCY_P95 = registry.gauge(
+    "llm_provider_latency_p95_seconds", "95th percentile call latency in the router's rolling window", ["provider"]
+)
+LLM_FAILOVERS = registry.counter(
+    "llm_failovers_total", "LLM calls handed to the next provider after this one failed", ["provider"]
+)
+LLM_HEDGES = registry.counter(
+    "llm_hedged_calls_total", "Slow LLM calls raced against a backup provider, by the provider that answered",
+    ["provider", "winner"]
+)
+
+
+class LLMProvider:
+    """One LLM backend: builds chat models for the model names it serves.
+
+    Model names are chosen per graph step (``model_for``); a provider that does not
+    serve the requested model falls back to its own model from ``<NAME>_MODEL``.
+    """
+
+    name = ""
+    default_model = ""
+
+    def serves(self, model_name: str) -> bool:
+        raise NotImplementedError
+
+    def resolve_model(self, model_name: str) -> str:
+        if self.serves(model_name):
+            return model_name
+        return os.getenv(f"{self.name.upper()}_MODEL", self.default_model)
+
+    def chat_model(self, model_name: str, timeout: Optional[float] = None):
+        """Chat model whose requests give up after ``timeout`` seconds"""
+        raise NotImplementedError
+
+    def structured_model(self, model_name: str, output_schema: type, timeout: Optional[float] = None):
+        return self.chat_model(model_name, timeout).with_structured_output(output_schema)
+
+
+@lru_cache(maxsize=None)
+def _timed_gemini() -> type:
+    """``ChatGoogleGenerativeAI`` sending its ``timeout`` with every request, which the chat model leaves unset"""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    class TimedGemini(ChatGoogleGenerativeAI):
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            return super()._generate(messages, stop, run_manager, **{"timeout": self.timeout, **kwargs})
+
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            return super()._stream(messages, stop, run_manager, **{"timeout": self.timeout, **kwargs})
+
+    return TimedGemini
+
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+    default_model = "gemini-1.5-flash"
+
+    def serves(self, model_name: str) -> bool:
+        return model_name.startswith("gemini")
+
+    def chat_model(self, model_name: str, timeout: Optional[float] = None):
+        return _timed_gemini()(model=model_name, google_api_key=os.getenv("GOOGLE_API_KEY"), timeout=timeout)
+
+
+class GroqProvider(LLMProvider):
+    name = "groq"
+    default_model = "llama-3.3-70b-versatile"
+
+    def serves(self, model_name: str) -> bool:
+        return not model_name.startswith(("gemini", "fake"))
+
+    def chat_model(self, model_name: str, timeout: Optional[float] = None):
+        from langchain_groq import ChatGroq
+        return ChatGroq(model=model_name, api_key=os.getenv("GROQ_API_KEY"), timeout=timeout)
+
+
+class FakeProvider(LLMProvider):
+    """Offline backend answering with the deterministic stand-in from ``fakes.py``"""
+
+    name = "fake"
+    default_model = "fake-deterministic"
+
+    def serves(self, model_name: str) -> bool:
+        return model_name.startswith("fake")
+
+    def chat_model(self, model_name: str, timeout: Optional[float] = None):
+        from src.ai_componenet.fakes import make_fake_model
+        return make_fake_model()
+
+    def structured_model(self, model_name: str, output_schema: type, timeout: Optional[float] = None):
+        from src.ai_componenet.fakes import make_fake_model
+        return make_fake_model(output_schema)
+
+
+PROVIDERS: Dict[str, LLMProvider] = {
+    provider.name: provider for provider in (GeminiProvider(), GroqProvider(), FakeProvider())
+}
+
+
+def configured_providers() -> List[LLMProvider]:
+    """Providers from ``LLM_PROVIDERS`` (comma separated, primary first); Gemini alone by default"""
+    names = [name.strip().lower() for name in os.getenv("LLM_PROVIDERS", "gemini").split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROVIDERS]
+    if unknown:
+        raise ValueError(f"Unknown LLM providers {unknown}; expected some of {sorted(PROVIDERS)}")
+    return [PROVIDERS[name] for name in names] or [PROVIDERS["gemini"]]
+
+
+class ProviderStats:
+    """Rolling window of the latest call latencies and outcomes of one provider"""
+
+    def __init__(self, window: int):
+        self.calls: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.calls.append((latency, ok))
+
+    def error_rate(self) -> float:
+        with self._lock:
+            calls = list(self.calls)
+        return sum(1 for _, ok in calls if not ok) / len(calls) if calls else 0.0
+
+    def latency_quantile(self, quantile: float) -> Optional[float]:
+        """Quantile of successful call latencies, None before any call succeeded"""
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self.calls if ok)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(quantile * len(latencies)))]
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+
+class ProviderRouter:
+    """Orders providers by health and decides when a slow call gets a hedge.
+
+    A provider is degraded while its circuit is open, or once its rolling window has
+    ``LLM_ROUTER_MIN_SAMPLES`` calls and either the error rate reaches
+    ``LLM_ROUTER_MAX_ERROR_RATE`` or the median latency exceeds ``LLM_ROUTER_MAX_LATENCY``.
+    Degraded providers move behind healthy ones; otherwise the configured order is kept.
+    """
+
+    def __init__(self):
+        self.window = int(os.getenv("LLM_ROUTER_WINDOW", "50"))
+        self.min_samples = int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "5"))
+        self.max_error_rate = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", "0.5"))
+        self.max_latency = float(os.getenv("LLM_ROUTER_MAX_LATENCY", "0"))
+        self._stats: Dict[str, ProviderStats] = {}
+        self._lock = threading.Lock()
+
+    def stats(self, provider: str) -> ProviderStats:
+        with self._lock:
+            if provider not in self._stats:
+                self._stats[provider] = ProviderStats(self.window)
+            return self._stats[provider]
+
+    def observe(self, provider: str, latency: float, ok: bool) -> None:
+        self.stats(provider).observe(latency, ok)
+
+    def degraded(self, provider: str) -> bool:
+        if get_breaker(provider).is_rejecting():
+            return True
+        stats = self.stats(provider)
+        if len(stats) < self.min_samples:
+            return False
+        median = stats.latency_quantile(0.5)
+        return stats.error_rate() >= self.max_error_rate or bool(
+            self.max_latency and median is not None and median > self.max_latency
+        )
+
+    def order(self, routes: List[Any]) -> List[Any]:
+        """``routes`` (anything with a ``provider`` attribute) with degraded providers last"""
+        return sorted(routes, key=lambda route: self.degraded(route.provider))
+
+    def hedge_after(self, provider: str) -> Optional[float]:
+        """Seconds after which a call to ``provider`` is raced against the next provider.
+
+        ``LLM_HEDGE_AFTER`` is a number of seconds, or ``auto`` for the provider's rolling
+        p95 latency (once it has enough samples); empty or 0 disables hedging.
+        """
+        setting = os.getenv("LLM_HEDGE_AFTER", "").strip().lower()
+        if setting == "auto":
+            stats = self.stats(provider)
+            return stats.latency_quantile(0.95) if len(stats) >= self.min_samples else None
+        return float(setting) if setting and float(setting) > 0 else None
+
+
+router = ProviderRouter()
+
+LLM_PROVIDER_ERROR_RATE.set_function(lambda: {
+    (provider,): stats.error_rate() for provider, stats in list(router._stats.items())
+})
+LLM_PROVIDER_LATENCY_P95.set_function(lambda: {
+    (provider,): latency for provider, stats in list(router._stats.items())
+    if (latency := stats.latency_quantile(0.95)) is not None
+})
@@ -0,0 +1,240 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Latency buckets (seconds) sized for everything from DB sessions to long LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter, optionally split by labels"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down; ``set_function`` makes it computed at scrape time"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], Dict[Tuple[str, ...], float]]) -> None:
+        """``function`` returns ``{label_values_tuple: value}`` each time the gauge is scraped"""
+        self._function = function
+
+    def _samples(self) -> Iterator[str]:
+        if self._function is not None:
+            items = list(self._function().items())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with ``_sum`` and ``_count`` series"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # bucket counts, then sum, then count
+            state = self._values.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in items:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets, state):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', _format_value(bound)))} {_format_value(cumulative)}"
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {_format_value(state[-1])}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(state[-1])}"
+
+
+class MetricsRegistry:
+    """Holds every metric of the process and renders the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+GRAPH_NODE_DURATION = registry.histogram(
+    "graph_node_duration_seconds", "Time spent in each LangGraph node", ["node"]
+)
+GRAPH_NODE_RUNS = registry.counter(
+    "graph_node_runs_total", "LangGraph node executions by outcome", ["node", "outcome"]
+)
+GRAPH_RUNS = registry.counter(
+    "graph_runs_total", "Graph runs by how they started: new, resumed from a checkpoint or already complete", ["start"]
+)
+EXTERNAL_CALL_DURATION = registry.histogram(
+    "external_call_duration_seconds", "Latency of calls to external services", ["call", "outcome"]
+)
+LLM_CALL_DURATION = registry.histogram(
+    "llm_call_duration_seconds", "Latency of LLM chain invocations", ["model", "output", "outcome"]
+)
+SCORING_DURATION = registry.histogram(
+    "scoring_call_duration_seconds", "Latency of scoring one profile, per scoring tier", ["tier", "outcome"]
+)
+LLM_TIME_TO_FIRST_TOKEN = registry.histogram(
+    "llm_time_to_first_token_seconds", "Time until a streamed LLM response produced its first chunk", ["model", "output"]
+)
+DB_SESSION_DURATION = registry.histogram(
+    "db_session_duration_seconds", "Lifetime of database sessions opened through get_db_session", ["outcome"]
+)
+
+
+def timed_node(name: str, node: Callable) -> Callable:
+    """Wrap a graph node so every run is timed and counted by outcome"""
+    @wraps(node)
+    def wrapper(state):
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = node(state)
+            outcome = "success"
+            return result
+        finally:
+            GRAPH_NODE_DURATION.observe(time.perf_counter() - start, node=name)
+            GRAPH_NODE_RUNS.inc(node=name, outcome=outcome)
+    return wrapper
+
+
+def timed_call(call: str, histogram: Histogram = EXTERNAL_CALL_DURATION) -> Callable:
+    """Decorator recording the latency of an external call, labelled with its outcome"""
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = function(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                histogram.observe(time.perf_counter() - start, call=call, outcome=outcome)
+        return wrapper
+    return decorator
@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+from dotenv import load_dotenv
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.tracing import add_span_counters
+
+load_dotenv()
+
+PROMPT_PREFIX_TOKENS = registry.counter(
+    "llm_prompt_prefix_tokens_total",
+    "Estimated tokens of shared prompt prefixes, by whether a provider prefix cache could serve them",
+    ["model", "outcome"]
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token), enough to compare prompt parts"""
+    return max(1, len(text) // 4)
+
+
+class PrefixCacheTracker:
+    """Local stand-in for a provider's implicit prompt cache.
+
+    Remembers the prefixes sent to each model for ``ttl`` seconds, like Gemini and Groq
+    keep cached prefixes, so the tokens a provider could reuse are measured even when it
+    does not report them (reported ``cache_read`` tokens land on the ``llm_call`` span).
+    Prefixes shorter than ``min_tokens`` count as ``below_minimum``; set it to the
+    provider's own minimum to count only what that provider would actually serve.
+    """
+
+    def __init__(self, ttl: float, min_tokens: int, max_entries: int = 1024):
+        self.ttl = ttl
+        self.min_tokens = min_tokens
+        self.max_entries = max_entries
+        self._seen: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self.prefix_tokens = 0
+        self.reused_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, model: str, prefix: str) -> int:
+        """Count a call starting with ``prefix``; returns the prefix tokens that were reusable"""
+        tokens = estimate_tokens(prefix)
+        if tokens < self.min_tokens:
+            outcome = "below_minimum"
+        else:
+            key = (model, hashlib.sha256(prefix.encode("utf-8")).hexdigest())
+            now = time.monotonic()
+            with self._lock:
+                last_seen = self._seen.pop(key, None)
+                self._seen[key] = now
+                while len(self._seen) > self.max_entries:
+                    self._seen.popitem(last=False)
+            outcome = "reused" if last_seen is not None and now - last_seen <= self.ttl else "miss"
+
+        PROMPT_PREFIX_TOKENS.inc(tokens, model=model, outcome=outcome)
+        reused = tokens if outcome == "reused" else 0
+        with self._lock:
+            self.prefix_tokens += tokens
+            self.reused_tokens += reused
+        add_span_counters(prefix_tokens=tokens, reused_prefix_tokens=reused)
+        return reused
+
+
+prefix_cache = PrefixCacheTracker(
+    ttl=float(os.getenv("PROMPT_CACHE_TTL", "300")),
+    min_tokens=int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "0"))
+)
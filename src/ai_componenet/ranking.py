@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from typing import Dict, Optional, Tuple
+import numpy as np
+from src.ai_componenet.graph.utils.models import SCORE_DIMENSIONS, SCORE_WEIGHTS
+
+# Column order of score matrices: one column per score dimension
+DIMENSIONS = list(SCORE_DIMENSIONS)
+
+
+def weight_vector(weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Weights in ``DIMENSIONS`` order; dimensions left out keep their default weight.
+
+    Raises ValueError for unknown dimensions, negative weights or weights that are all zero.
+    """
+    weights = weights or {}
+    unknown = sorted(set(weights) - set(DIMENSIONS))
+    if unknown:
+        raise ValueError(f"Unknown score dimensions {unknown}; expected some of {DIMENSIONS}")
+    vector = np.array([weights.get(name, SCORE_WEIGHTS[name]) for name in DIMENSIONS], dtype=float)
+    if (vector < 0).any() or not np.isfinite(vector).all():
+        raise ValueError("Weights must be finite and non-negative")
+    if not vector.any():
+        raise ValueError("At least one weight must be positive")
+    return vector
+
+
+def weighted_scores(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """``weighted_score`` for every row of an (n, dimensions) matrix at once.
+
+    Missing dimension scores are NaN and weights are renormalised over the ones present,
+    as ``weighted_score`` does; rows with no weighted score present are NaN. Values are
+    not rounded, so rankings are not tied by rounding.
+    """
+    present = ~np.isnan(scores)
+    totals = present @ weights
+    sums = np.where(present, scores, 0.0) @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(totals > 0, sums / totals, np.nan)
+
+
+def top_k(values: np.ndarray, ids: np.ndarray, k: int) -> np.ndarray:
+    """Row indices of the ``k`` highest values, best first; ties go to the lower id, NaN rows are left out"""
+    valid = np.flatnonzero(~np.isnan(values))
+    if k <= 0:
+        return valid[:0]
+    if k < len(valid):
+        # Keep everything tied with the k-th value so the tie-break below stays exact
+        kth = np.partition(values[valid], len(valid) - k)[len(valid) - k]
+        valid = valid[values[valid] >= kth]
+    order = np.lexsort((ids[valid], -values[valid]))
+    return valid[order][:k]
+
+
+def rank_candidates(
+    ids: np.ndarray, scores: np.ndarray, weights: Optional[Dict[str, float]] = None, k: int = 10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices of the ``k`` best rows under ``weights`` and the weighted score of every row"""
+    values = weighted_scores(scores, weight_vector(weights))
+    return top_k(values, ids, k), values
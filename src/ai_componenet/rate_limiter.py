@@ -0,0 +1,149 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from dotenv import load_dotenv
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.tracing import add_span_counters
+from src.ai_componenet.deadline import time_left
+
+load_dotenv()
+
+# Shared by every worker process on the host; put it on a local disk
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", os.path.join(os.getcwd(), "rate_limits.db"))
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "120"))
+
+# provider -> (requests per minute, burst); per-minute 0 disables limiting for that provider
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "gemini": (60, 10),
+    "groq": (30, 5),
+    "tavily": (60, 5),
+    "rapidapi": (30, 5),
+}
+
+RATE_LIMIT_WAIT = registry.histogram(
+    "rate_limit_wait_seconds", "Time spent waiting for a rate limiter permit", ["provider"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+RATE_LIMIT_ACQUIRED = registry.counter(
+    "rate_limit_permits_total", "Permits granted by the rate limiter", ["provider"]
+)
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no permit could be obtained within the allowed wait"""
+
+
+def _limits_from_env(provider: str) -> Tuple[float, float]:
+    per_minute, burst = DEFAULT_LIMITS.get(provider, (0, 1))
+    per_minute = float(os.getenv(f"RATE_LIMIT_{provider.upper()}_PER_MINUTE", per_minute))
+    burst = float(os.getenv(f"RATE_LIMIT_{provider.upper()}_BURST", burst))
+    return per_minute, max(burst, 1.0)
+
+
+class SharedRateLimiter:
+    """Token bucket per provider, stored in a SQLite file so all worker processes share it.
+
+    Each acquire runs a short ``BEGIN IMMEDIATE`` transaction that refills the bucket
+    from the elapsed time and takes a token, so concurrent workers never overspend.
+    """
+
+    def __init__(self, path: str = RATE_LIMIT_DB):
+        self.path = path
+        self._local = threading.local()
+        self._limits: Dict[str, Tuple[float, float]] = {}
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def limits(self, provider: str) -> Tuple[float, float]:
+        if provider not in self._limits:
+            self._limits[provider] = _limits_from_env(provider)
+        return self._limits[provider]
+
+    def configure(self, provider: str, per_minute: float, burst: float) -> None:
+        self._limits[provider] = (per_minute, max(burst, 1.0))
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        if not self._initialized:
+            with self._init_lock:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS buckets ("
+                    "provider TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+                )
+                self._initialized = True
+        return connection
+
+    def _try_take(self, provider: str, rate: float, burst: float) -> float:
+        """Take one token if available; otherwise return the seconds until one will be"""
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated FROM buckets WHERE provider = ?", (provider,)
+            ).fetchone()
+            tokens = burst if row is None else min(burst, row[0] + max(0.0, now - row[1]) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if wait == 0.0:
+                tokens -= 1
+            connection.execute(
+                "INSERT INTO buckets (provider, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(provider) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (provider, tokens, now)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait
+
+    def acquire(self, provider: str, max_wait: Optional[float] = None) -> float:
+        """Block until a permit for ``provider`` is available; returns the seconds waited"""
+        per_minute, burst = self.limits(provider)
+        if per_minute <= 0:
+            return 0.0
+
+        max_wait = RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        left = time_left()
+        if left is not None:
+            max_wait = min(max_wait, max(left, 0.0))
+        rate = per_minute / 60.0
+        start = time.monotonic()
+        while True:
+            wait = self._try_take(provider, rate, burst)
+            waited = time.monotonic() - start
+            if wait == 0.0:
+                break
+            if waited + wait > max_wait:
+                RATE_LIMIT_WAIT.observe(waited, provider=provider)
+                raise RateLimitTimeout(
+                    f"No {provider} permit within {max_wait:.0f}s (limit {per_minute:g}/min)"
+                )
+            time.sleep(wait)
+
+        RATE_LIMIT_WAIT.observe(waited, provider=provider)
+        RATE_LIMIT_ACQUIRED.inc(provider=provider)
+        if waited > 0:
+            add_span_counters(rate_limit_wait_ms=round(waited * 1000, 3))
+        return waited
+
+
+rate_limiter = SharedRateLimiter()
+
+
+def acquire(provider: str, max_wait: Optional[float] = None) -> float:
+    """Acquire a permit from the process-shared limiter"""
+    return rate_limiter.acquire(provider, max_wait)
@@ -0,0 +1,262 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import re
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+from dotenv import load_dotenv
+from src.ai_componenet.logger import logging
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.tracing import add_span_counters
+from src.ai_componenet.deadline import check_deadline, time_left
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# name -> default; each can be overridden globally (RESILIENCE_MAX_ATTEMPTS) or per
+# provider (RESILIENCE_RAPIDAPI_MAX_ATTEMPTS)
+DEFAULT_SETTINGS: Dict[str, float] = {
+    "MAX_ATTEMPTS": 3,
+    "BASE_DELAY": 0.5,
+    "MAX_DELAY": 20.0,
+    "FAILURE_THRESHOLD": 5,
+    "RESET_TIMEOUT": 30.0,
+}
+
+# Status codes worth another attempt: timeouts, throttling and server-side failures
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+EXTERNAL_CALL_RETRIES = registry.counter(
+    "external_call_retries_total", "Retries of failed external calls", ["provider"]
+)
+CIRCUIT_REJECTIONS = registry.counter(
+    "circuit_breaker_rejections_total", "Calls failed fast because the provider's circuit was open", ["provider"]
+)
+CIRCUIT_STATE = registry.gauge(
+    "circuit_breaker_state", "Circuit state per provider (0 closed, 1 half open, 2 open)", ["provider"]
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+    def __init__(self, provider: str, retry_after: float):
+        super().__init__(f"{provider} is unavailable, circuit open for another {retry_after:.0f}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def _setting(provider: str, name: str) -> float:
+    default = os.getenv(f"RESILIENCE_{name}", DEFAULT_SETTINGS[name])
+    return float(os.getenv(f"RESILIENCE_{provider.upper()}_{name}", default))
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an exception from requests, google-api-core or the Tavily client"""
+    response = getattr(error, "response", None)
+    code = getattr(response, "status_code", None) or getattr(error, "status_code", None)
+    if code is None and isinstance(getattr(error, "code", None), int):
+        code = error.code
+    if code is None:
+        # langchain_tavily reports HTTP failures as ValueError("Error 429: ...")
+        match = re.match(r"Error (\d{3})\b", str(error))
+        code = int(match.group(1)) if match else None
+    return code
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Transient failures: connection problems, timeouts, throttling and 5xx responses"""
+    import requests
+
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)):
+        return True
+    return status_code(error) in RETRYABLE_STATUS
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header (delta-seconds or HTTP date), if any"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider.
+
+    After ``failure_threshold`` transient failures in a row the circuit opens and calls
+    fail fast with ``CircuitOpenError``. Once ``reset_timeout`` has passed a single
+    probe call is let through (half open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, provider: str, failure_threshold: int, reset_timeout: float):
+        self.provider = provider
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+        CIRCUIT_REJECTIONS.inc(provider=self.provider)
+        raise CircuitOpenError(self.provider, max(remaining, 0.0))
+
+    def is_rejecting(self) -> bool:
+        """True while the circuit is open and its reset timeout has not passed yet"""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() < self.opened_at + self.reset_timeout
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit for {self.provider} closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(f"Circuit for {self.provider} opened after {self.failures} failures")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(
+                provider, _setting(provider, "FAILURE_THRESHOLD"), _setting(provider, "RESET_TIMEOUT")
+            )
+        return _breakers[provider]
+
+
+CIRCUIT_STATE.set_function(lambda: {
+    (provider,): _STATE_VALUES[breaker.state] for provider, breaker in list(_breakers.items())
+})
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(max_delay, base * 2**attempt)]"""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+def call_with_retry(provider: str, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call ``function`` through the provider's circuit breaker, retrying transient failures.
+
+    Non-transient errors are raised immediately. A ``Retry-After`` longer than the
+    provider's maximum delay, or than the time left in the request budget, is not
+    waited out; the error is raised instead.
+    """
+    breaker = get_breaker(provider)
+    max_attempts = max(1, int(_setting(provider, "MAX_ATTEMPTS")))
+    base_delay = _setting(provider, "BASE_DELAY")
+    max_delay = _setting(provider, "MAX_DELAY")
+
+    attempt = 0
+    while True:
+        check_deadline()
+        breaker.before_call()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            if not is_retryable(e):
+                # An HTTP error means the provider answered and the request itself was bad;
+                # anything else (parsing, validation, permit timeouts) says nothing about it
+                if status_code(e) is not None:
+                    breaker.record_success()
+                else:
+                    breaker.release_probe()
+                raise
+            breaker.record_failure()
+            attempt += 1
+            requested = retry_after(e)
+            delay = max(requested or 0.0, backoff_delay(attempt - 1, base_delay, max_delay))
+            left = time_left()
+            if attempt >= max_attempts or breaker.state == OPEN or delay > max_delay or (
+                left is not None and delay >= left
+            ):
+                raise
+            logger.warning(f"{provider} call failed ({e}); retry {attempt}/{max_attempts - 1} in {delay:.2f}s")
+            EXTERNAL_CALL_RETRIES.inc(provider=provider)
+            add_span_counters(retries=1)
+            time.sleep(delay)
+            continue
+        breaker.record_success()
+        return result
+
+
+def stream_with_breaker(provider: str, function: Callable[..., Iterator[Any]], *args: Any, **kwargs: Any) -> Iterator[Any]:
+    """Iterate a streaming call behind the provider's circuit breaker.
+
+    Streams are not retried: chunks may already have reached the client.
+    """
+    breaker = get_breaker(provider)
+    check_deadline()
+    breaker.before_call()
+    try:
+        yield from function(*args, **kwargs)
+    except Exception as e:
+        if is_retryable(e):
+            breaker.record_failure()
+        elif status_code(e) is not None:
+            breaker.record_success()
+        else:
+            breaker.release_probe()
+        raise
+    except BaseException:
+        # Consumer stopped early (GeneratorExit); that says nothing about the provider
+        breaker.release_probe()
+        raise
+    breaker.record_success()
+
+
+def find_cause(error: BaseException, error_type: type) -> Optional[BaseException]:
+    """First exception of ``error_type`` in the ``__cause__`` / ``__context__`` chain"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, error_type):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
@@ -0,0 +1,134 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import hashlib
+import re
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+from urllib.parse import urlparse
+from src.ai_componenet.metrics import registry
+from src.ai_componenet.tracing import add_span_counters
+from src.ai_componenet.deadline import DeadlineExceeded, time_left
+from src.ai_componenet.resilience import find_cause
+
+SINGLE_FLIGHT_CALLS = registry.counter(
+    "single_flight_calls_total", "Calls through a single-flight group; followers reused an in-flight call",
+    ["group", "role"]
+)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.abandoned = False  # the leader stopped without a result, e.g. a closed stream
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key (the leader) runs the function; callers arriving while
+    it is still running wait for it and receive the same result or exception. Nothing
+    is cached once the call finishes.
+
+    Followers wait no longer than their own time budget (``DeadlineExceeded``). A leader
+    that ran out of *its* budget, or was abandoned, says nothing about theirs, so they
+    try again instead.
+    """
+
+    def __init__(self, group: str):
+        self.group = group
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+
+            SINGLE_FLIGHT_CALLS.inc(group=self.group, role="follower")
+            add_span_counters(coalesced=1)
+            left = time_left()
+            if not call.done.wait(timeout=None if left is None else max(0.0, left)):
+                raise DeadlineExceeded(f"Time budget exhausted waiting for an in-flight {self.group} call")
+            if call.abandoned or (call.error is not None and find_cause(call.error, DeadlineExceeded) is not None):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        with self._leading(key, call):
+            call.result = function(*args, **kwargs)
+            return call.result
+
+    @contextmanager
+    def _leading(self, key: Hashable, call: _Call) -> Iterator[_Call]:
+        SINGLE_FLIGHT_CALLS.inc(group=self.group, role="leader")
+        try:
+            yield call
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @contextmanager
+    def lead(self, key: Hashable) -> Iterator[Optional[_Call]]:
+        """Run the block as the leader for ``key``, or yield None when a call is already in flight.
+
+        For work that cannot be a single function call, such as a stream: the block sets
+        ``call.result`` for the followers, and an exception raised in it becomes theirs.
+        """
+        with self._lock:
+            if key in self._calls:
+                call = None
+            else:
+                call = self._calls[key] = _Call()
+        if call is None:
+            yield None
+            return
+        with self._leading(key, call):
+            yield call
+
+
+def coalesced(group: str, key: Callable[..., Hashable]) -> Callable:
+    """Decorator running the function through a ``SingleFlight`` keyed by ``key(*args, **kwargs)``"""
+    flight = SingleFlight(group)
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            return flight.do(key(*args, **kwargs), function, *args, **kwargs)
+        wrapper.single_flight = flight
+        return wrapper
+    return decorator
+
+
+def normalized_text_key(text: str) -> str:
+    """Digest of text with case and whitespace differences removed"""
+    normalized = re.sub(r"\s+", " ", text or "").strip().casefold()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def canonical_profile_url(url: str) -> str:
+    """``linkedin.com/in/<slug>`` for any scheme, subdomain, query string or trailing slash"""
+    parsed = urlparse(url.strip() if "://" in url else f"https://{url.strip()}")
+    host = parsed.netloc.lower().split(":")[0]
+    if host.endswith("linkedin.com"):
+        host = "linkedin.com"
+    return f"{host}{parsed.path.rstrip('/').lower()}"
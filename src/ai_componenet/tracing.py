@@ -0,0 +1,198 @@
+import os
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TRACE_FILE = os.getenv("TRACE_FILE", os.path.join(os.getcwd(), "logs", "traces.jsonl"))
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+# The trace file is rotated past this size, keeping this many older files (TRACE_FILE.1 is the newest)
+TRACE_FILE_MAX_BYTES = int(os.getenv("TRACE_FILE_MAX_BYTES", str(50 * 1024 * 1024)))
+TRACE_FILE_BACKUPS = int(os.getenv("TRACE_FILE_BACKUPS", "3"))
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_current_trace: ContextVar[Optional["Span"]] = ContextVar("current_trace", default=None)
+_export_lock = threading.Lock()
+
+
+class Span:
+    """One timed operation in a run; children are nested operations started inside it"""
+
+    def __init__(self, name: str, trace_id: str, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.children: List["Span"] = []
+        self.start = time.time()
+        self._start_perf = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def set(self, **attributes: Any) -> None:
+        with self._lock:
+            self.attributes.update(attributes)
+
+    def add(self, **counters: float) -> None:
+        """Increment numeric attributes such as token, byte or retry counts"""
+        with self._lock:
+            for key, value in counters.items():
+                self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration_ms = round((time.perf_counter() - self._start_perf) * 1000, 3)
+        if error is not None:
+            self.status = "error"
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children]
+        }
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Set attributes on the active span, if any"""
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.set(**attributes)
+
+
+def set_trace_attributes(**attributes: Any) -> None:
+    """Set attributes on the root span of the active trace (e.g. ``job_id`` once it is known)"""
+    root = _current_trace.get()
+    if root is not None:
+        root.set(**attributes)
+
+
+def add_span_counters(**counters: float) -> None:
+    """Increment counters on the active span, if any"""
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.add(**counters)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record a child span of the active span; does nothing outside a trace"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name, parent.trace_id, attributes)
+    with parent._lock:
+        parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.finish(e)
+        raise
+    else:
+        child.finish()
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Span]:
+    """Open the root span of a run and export the whole tree when it ends"""
+    root = Span(name, uuid.uuid4().hex, attributes)
+    token = _current_span.set(root)
+    trace_token = _current_trace.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.finish(e)
+        raise
+    else:
+        root.finish()
+    finally:
+        _current_trace.reset(trace_token)
+        _current_span.reset(token)
+        if TRACING_ENABLED:
+            export_trace(root)
+
+
+def traced(name: str) -> Callable:
+    """Decorator that runs the function inside a span of the active trace"""
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _rotate() -> None:
+    for i in range(TRACE_FILE_BACKUPS - 1, 0, -1):
+        if os.path.exists(f"{TRACE_FILE}.{i}"):
+            os.replace(f"{TRACE_FILE}.{i}", f"{TRACE_FILE}.{i + 1}")
+    if TRACE_FILE_BACKUPS > 0:
+        os.replace(TRACE_FILE, f"{TRACE_FILE}.1")
+    else:
+        os.remove(TRACE_FILE)
+
+
+def export_trace(root: Span) -> None:
+    """Append the trace as one JSON line to ``TRACE_FILE``, rotating it once it is full"""
+    record = {
+        "trace_id": root.trace_id,
+        "job_id": root.attributes.get("job_id"),
+        **root.to_dict()
+    }
+    line = json.dumps(record, default=str)
+    with _export_lock:
+        os.makedirs(os.path.dirname(TRACE_FILE) or ".", exist_ok=True)
+        if TRACE_FILE_MAX_BYTES > 0 and os.path.exists(TRACE_FILE) \
+                and os.path.getsize(TRACE_FILE) + len(line) + 1 > TRACE_FILE_MAX_BYTES:
+            _rotate()
+        with open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def get_traces(job_id: int) -> List[Dict[str, Any]]:
+    """Read back every exported trace recorded for ``job_id``, oldest first.
+
+    Scans the current trace file and its rotated backups, so the cost is bounded by
+    ``TRACE_FILE_MAX_BYTES * (TRACE_FILE_BACKUPS + 1)``. Lines of other jobs are skipped
+    without being parsed.
+    """
+    # export_trace writes job_id right after trace_id, so this prefix only matches that job
+    needle = f', "job_id": {json.dumps(job_id)}, '
+    paths = [f"{TRACE_FILE}.{i}" for i in range(TRACE_FILE_BACKUPS, 0, -1)] + [TRACE_FILE]
+    traces = []
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if needle not in line[:120]:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("job_id") == job_id:
+                    traces.append(record)
+    return traces
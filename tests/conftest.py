@@ -0,0 +1,34 @@
+"""
+Test environment shared by every test module.
+
+The app reads its configuration when its modules are imported, so the database,
+trace file, checkpoint and rate-limit stores are pointed at a throwaway directory
+here, before any test module imports them.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+WORKDIR = tempfile.mkdtemp(prefix="tests_")
+# Kept short so a lock-order inversion fails fast instead of stalling the suite
+SQLITE_BUSY_TIMEOUT_MS = 3000
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORKDIR, 'tests.db')}"
+os.environ["SQLITE_BUSY_TIMEOUT_MS"] = str(SQLITE_BUSY_TIMEOUT_MS)
+os.environ["TRACE_FILE"] = os.path.join(WORKDIR, "traces.jsonl")
+os.environ["CHECKPOINT_DB"] = os.path.join(WORKDIR, "checkpoints.db")
+os.environ["RATE_LIMIT_DB"] = os.path.join(WORKDIR, "rate_limits.db")
+for key in ("GOOGLE_API_KEY", "TAVILY_API_KEY", "RAPID_API_KEY"):
+    os.environ.setdefault(key, "test")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def database():
+    """The test database with every table created"""
+    from src.ai_componenet.database.database import create_tables
+    create_tables()
@@ -0,0 +1,126 @@
+"""
+SQLiteCheckpointSaver with run_checkpointed: resuming an interrupted run by its
+run ID, finished and conflicting runs, pruning and expiry of old runs.
+"""
+import time
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+import src.ai_componenet.graph.checkpointer as checkpointer_module
+from src.ai_componenet.graph.checkpointer import SQLiteCheckpointSaver
+from src.ai_componenet.graph.proj_graph import RunConflict, new_run_id, run_checkpointed
+
+
+class State(TypedDict, total=False):
+    job_desc: str
+    searched: int
+    scored: int
+    deadline: float
+
+
+class Pipeline:
+    """Two-step graph whose second step fails until ``fail_scoring`` is cleared"""
+
+    def __init__(self, saver: SQLiteCheckpointSaver):
+        self.fail_scoring = True
+        self.calls = {"search": 0, "score": 0}
+        workflow = StateGraph(State)
+        workflow.add_node("search", self.search)
+        workflow.add_node("score", self.score)
+        workflow.add_edge(START, "search")
+        workflow.add_edge("search", "score")
+        workflow.add_edge("score", END)
+        self.graph = workflow.compile(checkpointer=saver)
+
+    def search(self, state):
+        self.calls["search"] += 1
+        return {"searched": self.calls["search"]}
+
+    def score(self, state):
+        self.calls["score"] += 1
+        if self.fail_scoring:
+            raise TimeoutError("scoring timed out")
+        return {"scored": state["searched"] * 10}
+
+
+@pytest.fixture
+def saver(tmp_path):
+    return SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+
+
+def checkpoint_count(saver, run_id):
+    return len(list(saver.list({"configurable": {"thread_id": run_id}})))
+
+
+def test_interrupted_run_resumes_by_run_id_without_repeating_finished_steps(saver):
+    pipeline = Pipeline(saver)
+    run_id = new_run_id()
+    with pytest.raises(TimeoutError):
+        run_checkpointed(pipeline.graph, run_id, {"job_desc": "ML engineer"})
+    assert pipeline.calls == {"search": 1, "score": 1}
+
+    # A new saver on the same file, as after a restart of the worker
+    resumed = Pipeline(SQLiteCheckpointSaver(saver.path))
+    resumed.fail_scoring = False
+    result = run_checkpointed(resumed.graph, run_id, {"job_desc": "ML engineer"}, resume_update={"deadline": 42.0})
+    assert resumed.calls == {"search": 0, "score": 1}
+    assert result == {"job_desc": "ML engineer", "searched": 1, "scored": 10, "deadline": 42.0}
+
+
+def test_finished_run_returns_its_final_state(saver):
+    pipeline = Pipeline(saver)
+    pipeline.fail_scoring = False
+    run_id = new_run_id()
+    first = run_checkpointed(pipeline.graph, run_id, {"job_desc": "ML engineer"})
+    again = run_checkpointed(pipeline.graph, run_id, {"job_desc": "ML engineer"})
+    assert again == first
+    assert pipeline.calls == {"search": 1, "score": 1}
+
+
+def test_run_id_reused_for_another_job_is_rejected(saver):
+    pipeline = Pipeline(saver)
+    run_id = new_run_id()
+    with pytest.raises(TimeoutError):
+        run_checkpointed(pipeline.graph, run_id, {"job_desc": "ML engineer"})
+    with pytest.raises(RunConflict):
+        run_checkpointed(pipeline.graph, run_id, {"job_desc": "Data engineer"})
+
+
+def test_finished_runs_are_pruned_to_their_latest_checkpoint(saver):
+    pipeline = Pipeline(saver)
+    interrupted, finished = new_run_id(), new_run_id()
+    with pytest.raises(TimeoutError):
+        run_checkpointed(pipeline.graph, interrupted, {"job_desc": "ML engineer"})
+    pipeline.fail_scoring = False
+    result = run_checkpointed(pipeline.graph, finished, {"job_desc": "ML engineer"})
+
+    assert checkpoint_count(saver, finished) == 1
+    # Interrupted runs keep every checkpoint and their pending writes so they can resume
+    assert checkpoint_count(saver, interrupted) > 1
+    latest = saver.get_tuple({"configurable": {"thread_id": finished}})
+    assert latest.checkpoint["channel_values"] == result
+    assert latest.pending_writes == []
+
+
+def test_prune_of_an_unknown_run_is_a_no_op(saver):
+    saver.prune("missing")
+    assert saver.get_tuple({"configurable": {"thread_id": "missing"}}) is None
+
+
+def test_runs_untouched_for_the_retention_period_are_deleted(saver, monkeypatch):
+    pipeline = Pipeline(saver)
+    pipeline.fail_scoring = False
+    old, recent = new_run_id(), new_run_id()
+
+    now = time.time()
+    monkeypatch.setattr(checkpointer_module.time, "time", lambda: now - 3600)
+    run_checkpointed(pipeline.graph, old, {"job_desc": "ML engineer"})
+    monkeypatch.setattr(checkpointer_module.time, "time", lambda: now)
+    run_checkpointed(pipeline.graph, recent, {"job_desc": "ML engineer"})
+
+    assert saver.delete_older_than(1800) == 1
+    assert saver.get_tuple({"configurable": {"thread_id": old}}) is None
+    assert saver.get_tuple({"configurable": {"thread_id": recent}}) is not None
+    assert saver.delete_older_than(1800) == 0
@@ -0,0 +1,64 @@
+"""
+Concurrent pipeline writers on one SQLite file must never wait out the busy timeout.
+
+Each writer runs the database side of a pipeline run and of a re-analysis, including
+the bulk UPDATE/DELETE statements (unflagging the previous best candidate, clearing
+outreach messages, deleting a job's candidates). A lock-order inversion between the
+process write lock and SQLite's file lock shows up as "database is locked" after the
+busy timeout, which the test environment keeps short.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import SQLITE_BUSY_TIMEOUT_MS
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+from src.ai_componenet.graph.utils.jdinfo import JDInfo
+
+WRITERS = 8
+ROUNDS = 5
+CANDIDATES = 3
+
+
+def pipeline_writer(writer_id: int) -> float:
+    """One writer's rounds; returns the slowest single transaction in seconds"""
+    slowest = 0.0
+
+    def timed(function, *args, **kwargs):
+        """Run one CRUD call in its own session; returns the id of the row it returned, if any"""
+        nonlocal slowest
+        start = time.perf_counter()
+        with get_db_session() as db:
+            result = getattr(function(db, *args, **kwargs), "id", None)
+        slowest = max(slowest, time.perf_counter() - start)
+        return result
+
+    for round_ in range(ROUNDS):
+        job_id = timed(
+            JobDescriptionCRUD.create_job_description,
+            jd_info=JDInfo(job_title=f"Engineer {writer_id}"), original_desc=f"JD {writer_id}-{round_}"
+        )
+        candidate_ids = [
+            timed(
+                LinkedInCandidateCRUD.create_candidate,
+                job_description_id=job_id, profile_data=f"profile {writer_id}-{i}",
+                final_score=float(i), score_breakdown={"Education": 7.0}
+            )
+            for i in range(CANDIDATES)
+        ]
+        # The second call unflags the first best candidate with a bulk UPDATE, then flushes
+        timed(LinkedInCandidateCRUD.update_best_candidate, candidate_id=candidate_ids[0], outreach_message="Hi")
+        timed(LinkedInCandidateCRUD.update_best_candidate, candidate_id=candidate_ids[-1], outreach_message="Hello")
+        timed(LinkedInCandidateCRUD.update_candidate_scores, candidate_id=candidate_ids[1],
+              final_score=5.0, score_breakdown={"Education": 5.0})
+        timed(LinkedInCandidateCRUD.clear_outreach_messages, job_description_id=job_id)
+        timed(LinkedInCandidateCRUD.delete_candidates_by_job, job_description_id=job_id)
+    return slowest
+
+
+def test_concurrent_writers_do_not_wait_for_busy_timeout(database):
+    with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+        slowest = max(pool.map(pipeline_writer, range(WRITERS)))
+
+    # Lock waits between healthy writers are milliseconds; an inversion waits out the timeout
+    assert slowest < SQLITE_BUSY_TIMEOUT_MS / 1000 / 2, f"a transaction took {slowest:.2f}s"
@@ -0,0 +1,46 @@
+"""
+Every LLM attempt gets a request timeout that fits the time left in the request budget.
+"""
+import time
+
+import pytest
+
+import src.ai_componenet.get_llm as get_llm
+from src.ai_componenet.deadline import deadline_scope
+from src.ai_componenet.get_llm import TimedChain
+
+
+class Answer:
+    """Chain stand-in answering with the timeout it was built with"""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    def invoke(self, input, config=None, **kwargs):
+        return self.timeout
+
+    def stream(self, input, config=None, **kwargs):
+        yield self.timeout
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_TIMEOUTTEST_PER_MINUTE", "0")
+    monkeypatch.setattr(get_llm, "LLM_TIMEOUT", 60.0)
+    return TimedChain(None, "model", "text", provider="timeouttest", build=Answer)
+
+
+def test_attempts_use_the_configured_timeout_without_a_budget(chain):
+    assert chain.invoke({}) == 60.0
+    assert list(chain.stream({})) == [60.0]
+
+
+def test_attempts_are_clamped_to_the_time_left(chain):
+    with deadline_scope(time.time() + 5):
+        assert 4 < chain.invoke({}) <= 5
+        assert 4 < list(chain.stream({}))[0] <= 5
+
+
+def test_prebuilt_chains_are_used_as_is():
+    chain = TimedChain(Answer("prebuilt"), "model", "text", provider="timeouttest")
+    assert chain.invoke({}) == "prebuilt"
@@ -0,0 +1,75 @@
+"""
+PrefixCacheTracker: reuse within the TTL, the minimum prefix size, per-model
+caches, and the scoring prefix counted once per job by the fake provider.
+"""
+import pytest
+
+import src.ai_componenet.prompt_cache as prompt_cache
+from src.ai_componenet.prompt_cache import PrefixCacheTracker, estimate_tokens
+
+PREFIX = "rubric and job description " * 20
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(prompt_cache.time, "monotonic", clock)
+    return clock
+
+
+def test_repeated_prefix_is_reused_within_the_ttl(clock):
+    tracker = PrefixCacheTracker(ttl=60, min_tokens=0)
+    assert tracker.record("model", PREFIX) == 0
+    clock.now += 59
+    assert tracker.record("model", PREFIX) == estimate_tokens(PREFIX)
+    # Reuse refreshes the entry, so the TTL counts from the last call
+    clock.now += 59
+    assert tracker.record("model", PREFIX) == estimate_tokens(PREFIX)
+    clock.now += 61
+    assert tracker.record("model", PREFIX) == 0
+    assert (tracker.prefix_tokens, tracker.reused_tokens) == (4 * estimate_tokens(PREFIX), 2 * estimate_tokens(PREFIX))
+
+
+def test_prefixes_below_the_minimum_are_never_reused():
+    tracker = PrefixCacheTracker(ttl=60, min_tokens=estimate_tokens(PREFIX) + 1)
+    tracker.record("model", PREFIX)
+    assert tracker.record("model", PREFIX) == 0
+    assert tracker.prefix_tokens == 2 * estimate_tokens(PREFIX)
+
+
+def test_caches_are_per_model_and_bounded():
+    tracker = PrefixCacheTracker(ttl=60, min_tokens=0, max_entries=2)
+    tracker.record("a", PREFIX)
+    assert tracker.record("b", PREFIX) == 0
+    tracker.record("b", "other prefix")
+    # The oldest entry, model a's prefix, was evicted
+    assert tracker.record("a", PREFIX) == 0
+
+
+def test_scoring_a_job_reuses_its_prefix_after_the_first_candidate(monkeypatch):
+    from src.ai_componenet.fakes import fake_llm_stats
+    from src.ai_componenet.graph import nodes
+    from src.ai_componenet.graph.utils.models import ScoringOutput
+
+    monkeypatch.setenv("LLM_PROVIDERS", "fake")
+    monkeypatch.setenv("RATE_LIMIT_FAKE_PER_MINUTE", "0")
+    tracker = PrefixCacheTracker(ttl=60, min_tokens=0)
+    monkeypatch.setattr(nodes, "prefix_cache", tracker)
+
+    job_desc = "Senior ML engineer, Python and AWS, San Francisco"
+    calls = fake_llm_stats.calls
+    for profile in ["profile one", "profile two", "profile three"]:
+        assert isinstance(nodes.score_profile(profile, job_desc, "fast", {}), ScoringOutput)
+    nodes.score_profile("profile one", "A different job", "fast", {})
+
+    prefix = estimate_tokens(nodes.scoring_prefix_template.format(job_desc=job_desc))
+    assert fake_llm_stats.calls - calls == 4
+    assert tracker.reused_tokens == 2 * prefix
@@ -0,0 +1,84 @@
+"""
+Vectorised ranking: weighted_scores against the scalar weighted_score (missing
+dimensions renormalised), top_k tie-breaks and NaN rows, and weight validation.
+"""
+import numpy as np
+import pytest
+
+from src.ai_componenet.graph.utils.models import SCORE_WEIGHTS, weighted_score
+from src.ai_componenet.ranking import DIMENSIONS, rank_candidates, top_k, weight_vector, weighted_scores
+
+
+def breakdowns(scores: np.ndarray):
+    """Score breakdowns as stored per candidate, with missing (NaN) dimensions left out"""
+    return [
+        {name: float(value) for name, value in zip(DIMENSIONS, row) if not np.isnan(value)}
+        for row in scores
+    ]
+
+
+@pytest.mark.parametrize("weights", [None, {"Education": 1.0, "Tenure": 0.0}, {"Location_Match": 3.0}])
+def test_weighted_scores_match_the_scalar_weighted_score(weights):
+    rng = np.random.default_rng(7)
+    scores = rng.uniform(0, 10, size=(200, len(DIMENSIONS))).round(1)
+    # Knock out a quarter of the dimension scores, and every score of a few rows
+    scores[rng.random(scores.shape) < 0.25] = np.nan
+    scores[:5] = np.nan
+
+    vector = weight_vector(weights)
+    values = weighted_scores(scores, vector)
+    scalar_weights = dict(zip(DIMENSIONS, vector))
+    for value, breakdown in zip(values, breakdowns(scores)):
+        expected = weighted_score(breakdown, scalar_weights)
+        if expected is None:
+            assert np.isnan(value)
+        else:
+            # weighted_score rounds to two decimals; weighted_scores does not round
+            assert value == pytest.approx(expected, abs=0.005 + 1e-9)
+
+
+def test_rows_with_only_zero_weight_dimensions_are_nan():
+    vector = weight_vector({"Education": 0.0})
+    scores = np.full((2, len(DIMENSIONS)), np.nan)
+    scores[0, DIMENSIONS.index("Education")] = 9.0
+    scores[1, DIMENSIONS.index("Tenure")] = 4.0
+    values = weighted_scores(scores, vector)
+    assert np.isnan(values[0]) and values[1] == 4.0
+
+
+def test_top_k_breaks_ties_by_lower_id_and_skips_nan():
+    values = np.array([7.0, np.nan, 9.0, 7.0, 7.0, 5.0])
+    ids = np.array([40, 10, 50, 30, 20, 60])
+    assert top_k(values, ids, 3).tolist() == [2, 4, 3]
+    # Ties at the cut-off are decided by id too, not by partition order
+    assert top_k(values, ids, 2).tolist() == [2, 4]
+    assert top_k(values, ids, 10).tolist() == [2, 4, 3, 0, 5]
+    assert top_k(values, ids, 0).tolist() == []
+
+
+def test_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 20, size=500).astype(float)
+    values[rng.random(500) < 0.1] = np.nan
+    ids = rng.permutation(10_000)[:500]
+    expected = sorted(
+        (i for i in range(500) if not np.isnan(values[i])), key=lambda i: (-values[i], ids[i])
+    )
+    for k in (1, 17, 100, 500):
+        assert top_k(values, ids, k).tolist() == expected[:k]
+
+
+def test_rank_candidates_uses_default_weights_for_dimensions_left_out():
+    ids = np.array([1, 2])
+    scores = np.array([[10, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 10]], dtype=float)
+    order, values = rank_candidates(ids, scores, {"Tenure": 1.0}, k=2)
+    assert order.tolist() == [1, 0]
+    total = sum(SCORE_WEIGHTS[name] for name in DIMENSIONS if name != "Tenure") + 1.0
+    assert values.tolist() == pytest.approx([10 * SCORE_WEIGHTS["Education"] / total, 10 / total])
+
+
+@pytest.mark.parametrize("weights", [{"Charm": 1.0}, {"Education": -1.0}, {"Education": float("nan")},
+                                     {name: 0.0 for name in DIMENSIONS}])
+def test_invalid_weights_are_rejected(weights):
+    with pytest.raises(ValueError):
+        weight_vector(weights)
@@ -0,0 +1,108 @@
+"""
+Re-analysis of an edited job: the stored job and candidates change only inside the
+checkpointed run, after the new search succeeded, and a resumed run keeps its plan.
+"""
+import pytest
+
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+from src.ai_componenet.graph import nodes
+from src.ai_componenet.graph.checkpointer import SQLiteCheckpointSaver
+from src.ai_componenet.graph.proj_graph import create_graph, new_run_id, run_checkpointed, run_started
+from src.ai_componenet.graph.reanalysis import prepare_reanalysis
+from src.ai_componenet.graph.utils.jdinfo import JDInfo
+
+
+class Search:
+    """``tavily_tool`` stand-in that fails while ``down`` is set"""
+
+    def __init__(self):
+        self.down = True
+        self.calls = 0
+
+    def __call__(self, job_position, max_result=5):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("search unavailable")
+        urls = [f"https://www.linkedin.com/in/new-{i}" for i in range(max_result)]
+        return urls, len(urls)
+
+
+@pytest.fixture
+def graph(database, tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDERS", "fake")
+    monkeypatch.setenv("RATE_LIMIT_FAKE_PER_MINUTE", "0")
+    monkeypatch.setattr(nodes, "data_of_linkedin_url", lambda url: f"Profile of {url}")
+    return create_graph(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")))
+
+
+@pytest.fixture
+def job():
+    """A stored job whose title differs from what the fake model extracts, with two candidates"""
+    with get_db_session() as db:
+        job_id = JobDescriptionCRUD.create_job_description(
+            db, jd_info=JDInfo(job_title="Data Engineer"), original_desc="Data engineer, Spark"
+        ).id
+        for i in range(2):
+            candidate = LinkedInCandidateCRUD.create_candidate(
+                db, job_description_id=job_id, profile_data=f"old profile {i}",
+                linkedin_url=f"https://www.linkedin.com/in/old-{i}", final_score=6.0
+            )
+            LinkedInCandidateCRUD.update_best_candidate(db, candidate_id=candidate.id, outreach_message="Hi")
+    return job_id
+
+
+def stored(job_id):
+    with get_db_session() as db:
+        job = JobDescriptionCRUD.get_job_description(db, job_id)
+        candidates = LinkedInCandidateCRUD.get_candidates_by_job(db, job_id)
+        return job.original_job_desc, sorted((c.linkedin_url, c.outreach_message) for c in candidates)
+
+
+def test_failed_search_leaves_the_job_untouched_and_resume_applies_the_plan(graph, job, monkeypatch):
+    search = Search()
+    monkeypatch.setattr(nodes, "tavily_tool", search)
+    before = stored(job)
+
+    job_desc = "Machine learning engineer, Python"
+    state = {"job_desc": job_desc, "max_profiles": 2, "outreach_mode": "on_demand"}
+    plan_state = prepare_reanalysis(job, job_desc)
+    assert stored(job) == before
+    assert plan_state["reanalysis"]["drop_candidates"] and plan_state["reanalysis"]["update_job"]
+    assert plan_state["reanalysis"]["stages"]["search"] == "ran"
+
+    run_id = new_run_id()
+    with pytest.raises(Exception):
+        run_checkpointed(graph, run_id, {**state, **plan_state})
+    assert stored(job) == before
+
+    # Resumed by run_id: the plan comes from the checkpoint, not from a new diff
+    search.down = False
+    assert run_started(graph, run_id)
+    result = run_checkpointed(graph, run_id, state)
+    assert result["reanalysis"]["applied"]
+    assert result["reanalysis"]["stages"] == plan_state["reanalysis"]["stages"]
+
+    desc, candidates = stored(job)
+    assert desc == job_desc
+    assert candidates == [(f"https://www.linkedin.com/in/new-{i}", None) for i in range(2)]
+    assert search.calls == 2
+
+
+def test_reused_candidates_keep_their_rows_and_lose_stale_outreach(graph, job, monkeypatch):
+    monkeypatch.setattr(nodes, "tavily_tool", Search())
+    with get_db_session() as db:
+        JobDescriptionCRUD.update_job_description(
+            db, job, JDInfo(job_title="Machine Learning Engineer"), "Machine learning engineer"
+        )
+
+    job_desc = "Machine learning engineer, remote"
+    plan_state = prepare_reanalysis(job, job_desc)
+    assert not plan_state["reanalysis"]["drop_candidates"]
+    run_checkpointed(graph, new_run_id(), {
+        "job_desc": job_desc, "max_profiles": 2, "outreach_mode": "on_demand", **plan_state
+    })
+
+    desc, candidates = stored(job)
+    assert desc == job_desc
+    assert candidates == [(f"https://www.linkedin.com/in/old-{i}", None) for i in range(2)]
@@ -0,0 +1,214 @@
+"""
+Circuit breaker state transitions, retries with backoff and Retry-After, and
+breaker accounting for streams.
+"""
+import itertools
+import time
+from email.utils import formatdate
+
+import pytest
+
+import src.ai_componenet.resilience as resilience
+from src.ai_componenet.deadline import deadline_scope
+from src.ai_componenet.resilience import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, backoff_delay,
+    call_with_retry, get_breaker, retry_after, stream_with_breaker
+)
+
+_providers = itertools.count()
+
+
+class HTTPError(Exception):
+    """Stand-in for a provider HTTP error carrying a response"""
+
+    def __init__(self, status: int, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = type("Response", (), {"status_code": status, "headers": headers or {}})()
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """A fresh provider name with fast, deterministic retry settings"""
+    name = f"test{next(_providers)}"
+    for setting, value in {"MAX_ATTEMPTS": 3, "BASE_DELAY": 0.5, "MAX_DELAY": 20, "FAILURE_THRESHOLD": 10}.items():
+        monkeypatch.setenv(f"RESILIENCE_{name.upper()}_{setting}", str(value))
+    return name
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Delays call_with_retry slept for, without sleeping"""
+    recorded = []
+    monkeypatch.setattr(resilience.time, "sleep", recorded.append)
+    return recorded
+
+
+def failing(*errors, result="ok"):
+    """Function raising ``errors`` on successive calls, then returning ``result``"""
+    remaining = list(errors)
+    calls = []
+
+    def function():
+        calls.append(1)
+        if remaining:
+            raise remaining.pop(0)
+        return result
+    function.calls = calls
+    return function
+
+
+def test_breaker_opens_after_threshold_and_rejects():
+    breaker = CircuitBreaker("p", failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.is_rejecting()
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_call()
+    assert 0 < raised.value.retry_after <= 60
+
+
+def test_success_resets_the_consecutive_failure_count():
+    breaker = CircuitBreaker("p", failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success():
+    breaker = CircuitBreaker("p", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert not breaker.is_rejecting()
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # A second caller while the probe runs still fails fast
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.failures == 0
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker("p", failure_threshold=5, reset_timeout=0.05)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.is_rejecting()
+
+
+def test_released_probe_lets_the_next_caller_probe():
+    breaker = CircuitBreaker("p", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.release_probe()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        for _ in range(50):
+            assert 0 <= backoff_delay(attempt, 0.5, 4.0) <= min(4.0, 0.5 * 2 ** attempt)
+
+
+def test_transient_failures_are_retried_with_bounded_backoff(provider, sleeps):
+    function = failing(HTTPError(503), ConnectionError("reset"))
+    assert call_with_retry(provider, function) == "ok"
+    assert len(function.calls) == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+    assert get_breaker(provider).state == CLOSED
+
+
+def test_attempts_are_limited(provider, sleeps):
+    function = failing(*[HTTPError(500)] * 5)
+    with pytest.raises(HTTPError):
+        call_with_retry(provider, function)
+    assert len(function.calls) == 3
+
+
+def test_client_errors_are_not_retried_and_do_not_trip_the_breaker(provider, sleeps):
+    function = failing(HTTPError(400))
+    with pytest.raises(HTTPError):
+        call_with_retry(provider, function)
+    assert len(function.calls) == 1 and sleeps == []
+    assert get_breaker(provider).failures == 0
+
+
+def test_open_circuit_stops_retrying(provider, sleeps, monkeypatch):
+    monkeypatch.setenv(f"RESILIENCE_{provider.upper()}_FAILURE_THRESHOLD", "1")
+    function = failing(HTTPError(503), HTTPError(503))
+    with pytest.raises(HTTPError):
+        call_with_retry(provider, function)
+    assert len(function.calls) == 1
+    with pytest.raises(CircuitOpenError):
+        call_with_retry(provider, function)
+
+
+def test_retry_after_seconds_and_http_date_are_parsed():
+    assert retry_after(HTTPError(429, {"Retry-After": "7"})) == 7.0
+    assert retry_after(HTTPError(429, {"Retry-After": "-3"})) == 0.0
+    assert 25 < retry_after(HTTPError(429, {"Retry-After": formatdate(time.time() + 30, usegmt=True)})) <= 30
+    assert retry_after(HTTPError(429, {"Retry-After": "soon"})) is None
+    assert retry_after(HTTPError(429)) is None
+
+
+def test_retry_after_is_waited_out(provider, sleeps):
+    function = failing(HTTPError(429, {"Retry-After": "3"}))
+    assert call_with_retry(provider, function) == "ok"
+    assert sleeps == [3.0]
+
+
+def test_retry_after_beyond_max_delay_is_raised(provider, sleeps):
+    function = failing(HTTPError(429, {"Retry-After": "60"}))
+    with pytest.raises(HTTPError):
+        call_with_retry(provider, function)
+    assert len(function.calls) == 1 and sleeps == []
+
+
+def test_retry_after_beyond_the_deadline_is_raised(provider, sleeps):
+    function = failing(HTTPError(429, {"Retry-After": "3"}))
+    with deadline_scope(time.time() + 1.0):
+        with pytest.raises(HTTPError):
+            call_with_retry(provider, function)
+    assert sleeps == []
+
+
+def test_stream_failures_count_against_the_breaker(provider, monkeypatch):
+    monkeypatch.setenv(f"RESILIENCE_{provider.upper()}_FAILURE_THRESHOLD", "1")
+
+    def broken():
+        yield "first"
+        raise HTTPError(502)
+
+    with pytest.raises(HTTPError):
+        list(stream_with_breaker(provider, broken))
+    assert get_breaker(provider).state == OPEN
+
+
+def test_abandoned_stream_releases_the_probe(provider, monkeypatch):
+    monkeypatch.setenv(f"RESILIENCE_{provider.upper()}_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv(f"RESILIENCE_{provider.upper()}_RESET_TIMEOUT", "0.05")
+    breaker = get_breaker(provider)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    stream = stream_with_breaker(provider, lambda: iter(["a", "b"]))
+    assert next(stream) == "a"
+    stream.close()
+    assert breaker.state == HALF_OPEN
+    # The probe slot is free again, so the next call is let through
+    assert list(stream_with_breaker(provider, lambda: iter(["c"]))) == ["c"]
+    assert breaker.state == CLOSED
@@ -0,0 +1,130 @@
+"""
+ResponseCache: TTL expiry, LRU eviction by entry count and by bytes, prefix
+invalidation, and the invalidations the CRUD layer issues after writes.
+"""
+import pytest
+
+import src.ai_componenet.database.cache as cache_module
+from src.ai_componenet.database.cache import ResponseCache, response_cache
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+from src.ai_componenet.graph.utils.jdinfo import JDInfo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl=10)
+    cache.set(("job", 1, False), b"body", {"etag": "x"})
+
+    clock.now += 9.9
+    assert cache.get(("job", 1, False)) == (b"body", {"etag": "x"})
+    clock.now += 0.2
+    assert cache.get(("job", 1, False)) is None
+    assert cache.stats()["entries"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = ResponseCache(max_entries=2)
+    cache.set(("job", 1), b"a")
+    cache.set(("job", 2), b"b")
+    cache.get(("job", 1))
+    cache.set(("job", 3), b"c")
+
+    assert cache.get(("job", 2)) is None
+    assert cache.get(("job", 1)) == (b"a", {})
+    assert cache.get(("job", 3)) == (b"c", {})
+    assert cache.evictions == 1
+
+
+def test_size_limit_evicts_and_rejects_oversized_bodies():
+    cache = ResponseCache(max_bytes=100)
+    assert cache.set(("job", 1), b"x" * 20)
+    assert cache.set(("job", 2), b"x" * 20)
+    # More than a quarter of the budget is never stored
+    assert not cache.set(("job", 3), b"x" * 26)
+    for i in range(3, 7):
+        cache.set(("job", i), b"x" * 20)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 100
+    assert stats["entries"] == 5
+    assert cache.get(("job", 1)) is None
+
+
+def test_replacing_an_entry_keeps_the_byte_count_exact():
+    cache = ResponseCache()
+    cache.set(("stats",), b"x" * 10)
+    cache.set(("stats",), b"x" * 4)
+    assert cache.stats()["bytes"] == 4
+
+
+def test_invalidate_drops_only_the_prefix():
+    cache = ResponseCache()
+    for key in [("job", 1, False), ("job", 1, True), ("job", 2, False), ("stats",)]:
+        cache.set(key, b"body")
+
+    cache.invalidate("job", 1)
+    assert cache.get(("job", 1, False)) is None
+    assert cache.get(("job", 1, True)) is None
+    assert cache.get(("job", 2, False)) is not None
+    assert cache.get(("stats",)) is not None
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_fill_that_raced_an_invalidation_is_skipped():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate("job", 1)
+    assert not cache.set(("job", 1, False), b"stale", generation=generation)
+    assert cache.set(("job", 1, False), b"fresh", generation=cache.generation)
+
+
+def test_crud_writes_invalidate_cached_responses(database):
+    with get_db_session() as db:
+        job_id = JobDescriptionCRUD.create_job_description(
+            db, jd_info=JDInfo(job_title="Cache test"), original_desc="cache test"
+        ).id
+    other_job = ("job", job_id + 1000, False)
+
+    response_cache.clear()
+    for key in [("job", job_id, False), ("stats",), ("best-candidates", 10), other_job]:
+        response_cache.set(key, b"cached")
+
+    with get_db_session() as db:
+        candidate_id = LinkedInCandidateCRUD.create_candidate(
+            db, job_description_id=job_id, profile_data="profile", final_score=7.0,
+            score_breakdown={"Education": 7.0}
+        ).id
+    assert response_cache.get(("job", job_id, False)) is None
+    assert response_cache.get(("stats",)) is None
+    assert response_cache.get(other_job) is not None
+
+    response_cache.set(("job", job_id, False), b"cached")
+    response_cache.set(("best-candidates", 10), b"cached")
+    with get_db_session() as db:
+        LinkedInCandidateCRUD.update_best_candidate(db, candidate_id=candidate_id, outreach_message="Hi")
+    assert response_cache.get(("job", job_id, False)) is None
+    assert response_cache.get(("best-candidates", 10)) is None
+
+    response_cache.set(("job", job_id, False), b"cached")
+    with get_db_session() as db:
+        LinkedInCandidateCRUD.delete_candidates_by_job(db, job_description_id=job_id)
+    assert response_cache.get(("job", job_id, False)) is None
+    assert response_cache.get(other_job) is not None
@@ -0,0 +1,211 @@
+"""
+SingleFlight: one execution per key for concurrent callers, follower deadlines,
+leaders that ran out of time or were abandoned, and the key normalisers.
+"""
+import threading
+import time
+
+import pytest
+
+from src.ai_componenet.deadline import DeadlineExceeded, deadline_scope
+from src.ai_componenet.single_flight import SingleFlight, canonical_profile_url, normalized_text_key
+
+
+class HeldCall:
+    """Function that blocks until released and counts its executions"""
+
+    def __init__(self, result="done", error=None):
+        self.result = result
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def in_thread(function, *args):
+    """Start ``function`` in a thread; returns the thread and a dict receiving its result or error"""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = function(*args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+
+def let_followers_join():
+    """Followers started just before are blocked on the in-flight call after this"""
+    time.sleep(0.1)
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight("test")
+    function = HeldCall(result={"value": 1})
+    leader, leader_outcome = in_thread(flight.do, "k", function)
+    function.started.wait(2)
+    followers = [in_thread(flight.do, "k", function) for _ in range(5)]
+    let_followers_join()
+    function.release.set()
+
+    for thread, _ in [(leader, None)] + followers:
+        thread.join(2)
+    assert function.calls == 1
+    assert all(outcome["result"] is leader_outcome["result"] for _, outcome in followers)
+
+
+def test_nothing_is_cached_after_the_call():
+    flight = SingleFlight("test")
+    calls = []
+    flight.do("k", calls.append, 1)
+    flight.do("k", calls.append, 2)
+    assert calls == [1, 2]
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight("test")
+    function = HeldCall()
+    first, _ = in_thread(flight.do, "a", function)
+    function.started.wait(2)
+    assert flight.do("b", lambda: "other") == "other"
+    function.release.set()
+    first.join(2)
+
+
+def test_followers_receive_the_leaders_error():
+    flight = SingleFlight("test")
+    function = HeldCall(error=ValueError("bad input"))
+    leader, leader_outcome = in_thread(flight.do, "k", function)
+    function.started.wait(2)
+    follower, follower_outcome = in_thread(flight.do, "k", function)
+    let_followers_join()
+    function.release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert isinstance(leader_outcome["error"], ValueError)
+    assert follower_outcome["error"] is leader_outcome["error"]
+    assert function.calls == 1
+
+
+def test_follower_waits_no_longer_than_its_own_deadline():
+    flight = SingleFlight("test")
+    function = HeldCall()
+    leader, _ = in_thread(flight.do, "k", function)
+    function.started.wait(2)
+
+    start = time.time()
+    with deadline_scope(time.time() + 0.1):
+        with pytest.raises(DeadlineExceeded):
+            flight.do("k", function)
+    assert time.time() - start < 1
+    function.release.set()
+    leader.join(2)
+
+
+def test_follower_reruns_when_the_leader_ran_out_of_time():
+    flight = SingleFlight("test")
+    function = HeldCall(error=DeadlineExceeded("leader budget spent"))
+    leader, leader_outcome = in_thread(flight.do, "k", function)
+    function.started.wait(2)
+    follower, follower_outcome = in_thread(flight.do, "k", lambda: "follower ran")
+    let_followers_join()
+    function.release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert isinstance(leader_outcome["error"], DeadlineExceeded)
+    assert follower_outcome["result"] == "follower ran"
+
+
+def test_lead_shares_its_result_with_followers():
+    flight = SingleFlight("test")
+    entered = threading.Event()
+    release = threading.Event()
+
+    def stream():
+        with flight.lead("k") as call:
+            entered.set()
+            release.wait(5)
+            call.result = "streamed"
+        return "leader"
+
+    leader, _ = in_thread(stream)
+    entered.wait(2)
+    with flight.lead("k") as call:
+        assert call is None
+    follower, follower_outcome = in_thread(flight.do, "k", lambda: "should not run")
+    let_followers_join()
+    release.set()
+    leader.join(2)
+    follower.join(2)
+    assert follower_outcome["result"] == "streamed"
+
+
+def test_abandoned_lead_lets_followers_rerun():
+    flight = SingleFlight("test")
+
+    def stream():
+        with flight.lead("k") as call:
+            yield "first chunk"
+            call.result = "streamed"
+
+    generator = stream()
+    next(generator)
+    follower, follower_outcome = in_thread(flight.do, "k", lambda: "rerun")
+    let_followers_join()
+    generator.close()
+    follower.join(2)
+    assert follower_outcome["result"] == "rerun"
+
+
+def test_outreach_stream_follower_yields_nothing_for_a_missing_candidate():
+    from src.ai_componenet.graph.nodes import ensure_outreach_message, stream_outreach_message
+
+    flight = ensure_outreach_message.single_flight
+    candidate_id = 987654
+    entered = threading.Event()
+    release = threading.Event()
+
+    def other_generation():
+        # An in-flight generation that found no candidate
+        with flight.lead(candidate_id) as call:
+            entered.set()
+            release.wait(5)
+            call.result = None
+
+    leader, _ = in_thread(other_generation)
+    entered.wait(2)
+    streamed, outcome = in_thread(lambda: list(stream_outreach_message(candidate_id)))
+    let_followers_join()
+    release.set()
+    leader.join(2)
+    streamed.join(2)
+    assert outcome == {"result": []}
+
+
+def test_normalized_text_key_ignores_case_and_whitespace():
+    assert normalized_text_key("Senior  ML\nEngineer ") == normalized_text_key("senior ml engineer")
+    assert normalized_text_key("ML engineer") != normalized_text_key("ML engineers")
+    assert normalized_text_key(None) == normalized_text_key("")
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/Jane-Doe/",
+    "http://linkedin.com/in/jane-doe?trk=search",
+    "uk.linkedin.com/in/jane-doe",
+    "  https://www.linkedin.com:443/in/jane-doe#about  ",
+])
+def test_canonical_profile_url_collapses_variants(url):
+    assert canonical_profile_url(url) == "linkedin.com/in/jane-doe"
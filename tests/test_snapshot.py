@@ -0,0 +1,141 @@
+"""
+CandidateSnapshot: queries after inserts, updates and deletes, the updated_at
+watermark and its lookback, sync intervals, mark_changed and the periodic rebuild.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.ai_componenet.database.snapshot as snapshot_module
+from src.ai_componenet.database.database import get_db_session
+from src.ai_componenet.database.crud import JobDescriptionCRUD, LinkedInCandidateCRUD
+from src.ai_componenet.database.models import LinkedInCandidate
+from src.ai_componenet.database.snapshot import CandidateSnapshot
+from src.ai_componenet.graph.utils.jdinfo import JDInfo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(snapshot_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def snapshot(database, clock):
+    return CandidateSnapshot(sync_interval=2, rebuild_interval=300)
+
+
+@pytest.fixture
+def job(database):
+    with get_db_session() as db:
+        return JobDescriptionCRUD.create_job_description(
+            db, jd_info=JDInfo(job_title="Backend Engineer", seniority_level="senior"), original_desc="backend"
+        ).id
+
+
+def add_candidate(job_id, final_score, education=5.0):
+    with get_db_session() as db:
+        return LinkedInCandidateCRUD.create_candidate(
+            db, job_description_id=job_id, profile_data="profile", final_score=final_score,
+            score_breakdown={"Education": education}
+        ).id
+
+
+def set_updated_at(candidate_id, updated_at):
+    """Backdate a row, as if it was flushed long before it committed"""
+    with get_db_session() as db:
+        db.query(LinkedInCandidate).filter(LinkedInCandidate.id == candidate_id).update(
+            {LinkedInCandidate.updated_at: updated_at}, synchronize_session=False
+        )
+
+
+def top_ids(snapshot, job_id, **filters):
+    return [row["candidate_id"] for row in snapshot.query(job_ids=[job_id], **filters)["top"]]
+
+
+def test_inserts_updates_and_deletes_show_up_in_queries(snapshot, job):
+    first, second = add_candidate(job, 6.0), add_candidate(job, 8.0)
+    assert top_ids(snapshot, job) == [second, first]
+
+    third = add_candidate(job, 9.0, education=9.0)
+    snapshot.mark_changed()
+    assert top_ids(snapshot, job) == [third, second, first]
+    assert top_ids(snapshot, job, min_scores={"Education": 8}) == [third]
+    assert top_ids(snapshot, job, job_title="backend", seniority_levels=["senior"], k=1) == [third]
+
+    with get_db_session() as db:
+        LinkedInCandidateCRUD.update_candidate_scores(db, first, 9.5, {"Education": 9.5})
+    snapshot.mark_changed()
+    assert top_ids(snapshot, job) == [first, third, second]
+
+    with get_db_session() as db:
+        JobDescriptionCRUD.update_job_description(db, job, JDInfo(job_title="Data Engineer"), "data")
+    snapshot.mark_changed()
+    assert top_ids(snapshot, job, job_title="backend") == []
+    assert top_ids(snapshot, job, job_title="data engineer") == [first, third, second]
+
+    with get_db_session() as db:
+        LinkedInCandidateCRUD.delete_candidates_by_job(db, job)
+    snapshot.remove_job(job)
+    assert top_ids(snapshot, job) == []
+
+
+def test_writes_of_other_processes_appear_after_the_sync_interval(snapshot, job, clock):
+    first = add_candidate(job, 6.0)
+    assert top_ids(snapshot, job) == [first]
+
+    # Written without mark_changed, as by another worker process
+    second = add_candidate(job, 7.0)
+    clock.now += 1
+    assert top_ids(snapshot, job) == [first]
+    clock.now += 1.5
+    assert top_ids(snapshot, job) == [second, first]
+
+
+def test_rows_committed_behind_the_watermark_are_reread_within_the_lookback(snapshot, job, clock):
+    # The first sync reads everything and sets the watermark to this row's updated_at
+    first = add_candidate(job, 5.0)
+    assert top_ids(snapshot, job) == [first]
+    late = add_candidate(job, 6.0)
+    set_updated_at(late, datetime.utcnow() - timedelta(seconds=1))
+    stale = add_candidate(job, 7.0)
+    set_updated_at(stale, datetime.utcnow() - timedelta(hours=1))
+
+    snapshot.mark_changed()
+    # The lookback (the 2 s sync interval) covers the late row, not the one an hour behind
+    assert top_ids(snapshot, job) == [late, first]
+
+    clock.now += 301
+    assert top_ids(snapshot, job) == [stale, late, first]
+
+
+def test_deletes_by_other_processes_are_dropped_by_the_rebuild(snapshot, job, clock):
+    kept, deleted = add_candidate(job, 6.0), add_candidate(job, 7.0)
+    assert top_ids(snapshot, job) == [deleted, kept]
+    built_at = snapshot.built_at
+
+    with get_db_session() as db:
+        db.query(LinkedInCandidate).filter(LinkedInCandidate.id == deleted).delete()
+    clock.now += 10
+    assert top_ids(snapshot, job) == [deleted, kept]
+    assert snapshot.built_at == built_at
+
+    clock.now += 300
+    assert top_ids(snapshot, job) == [kept]
+    assert snapshot.built_at == clock.now
+
+
+def test_unknown_fields_are_rejected(snapshot):
+    with pytest.raises(ValueError):
+        snapshot.query(min_scores={"Charm": 5})
+    with pytest.raises(ValueError):
+        snapshot.query(sort_by="Charm")
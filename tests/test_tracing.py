@@ -0,0 +1,48 @@
+"""
+Trace export: rotation of the trace file and reading a job's traces back across it.
+"""
+import os
+
+import pytest
+
+import src.ai_componenet.tracing as tracing
+from src.ai_componenet.tracing import get_traces, span, start_trace
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "traces.jsonl")
+    monkeypatch.setattr(tracing, "TRACE_FILE", path)
+    monkeypatch.setattr(tracing, "TRACING_ENABLED", True)
+    return path
+
+
+def record_run(job_id, **counters):
+    with start_trace("analyze_job", job_id=job_id):
+        with span("llm_call") as llm_span:
+            llm_span.add(**counters)
+
+
+def test_traces_are_read_back_per_job(trace_file):
+    record_run(1, prompt_tokens=10)
+    record_run(2, prompt_tokens=20)
+    record_run(11, prompt_tokens=30)
+    record_run(1, prompt_tokens=40)
+
+    traces = get_traces(1)
+    assert [t["children"][0]["attributes"]["prompt_tokens"] for t in traces] == [10, 40]
+    assert get_traces(3) == []
+
+
+def test_trace_file_is_rotated_and_backups_are_capped(trace_file, monkeypatch):
+    monkeypatch.setattr(tracing, "TRACE_FILE_MAX_BYTES", 1000)
+    monkeypatch.setattr(tracing, "TRACE_FILE_BACKUPS", 2)
+    for i in range(40):
+        record_run(7, prompt_tokens=i)
+
+    assert os.path.getsize(trace_file) <= 1000
+    assert os.path.exists(f"{trace_file}.2")
+    assert not os.path.exists(f"{trace_file}.3")
+    tokens = [t["children"][0]["attributes"]["prompt_tokens"] for t in get_traces(7)]
+    # The oldest runs were rotated out; the rest come back oldest first and end with the latest
+    assert tokens == sorted(tokens) and tokens[-1] == 39 and tokens[0] > 0